@@ -18,10 +18,28 @@ Features:
 import asyncio
 import sys
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple, Union
 import json
-from dataclasses import dataclass
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+# aioconsole is optional; without it prompts are read on a worker thread
+try:
+    from aioconsole import ainput
+    AIOCONSOLE_AVAILABLE = True
+except ImportError:
+    AIOCONSOLE_AVAILABLE = False
+
+# orjson is optional; serialization falls back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -30,7 +48,147 @@ from src.core.database import get_neo4j_manager, get_vector_manager
 from src.core.config import get_config
 
 
-@dataclass
+# Minimum refresh intervals (seconds) for cached database statistics
+NEO4J_STATS_TTL = 5.0
+PINECONE_STATS_TTL = 30.0
+
+PINECONE_EMBEDDING_DIMENSION = 384  # Based on all-MiniLM-L6-v2
+PINECONE_COLLECTIONS = ("documents", "entities")
+
+# Background refresh runs a little ahead of the Pinecone TTL so menu reads stay warm
+STATS_REFRESH_INTERVAL = 25.0
+
+DOCUMENT_FULLTEXT_INDEX_QUERY = (
+    "CREATE FULLTEXT INDEX docFts IF NOT EXISTS FOR (d:Document) ON EACH [d.title, d.content]"
+)
+
+# Hot Cypher statements are module constants so the query text is identical on
+# every call (Neo4j plan cache hits); all inputs are bound as parameters.
+
+# Documents, entities, relationships and last update in one round-trip.
+# max() keeps the row even when there are no documents yet.
+NEO4J_STATS_QUERY = """
+CALL { MATCH (d:Document) RETURN count(d) as doc_count }
+CALL { MATCH (e:Entity) RETURN count(e) as entity_count }
+CALL { MATCH ()-[r]->() RETURN count(r) as rel_count }
+CALL { MATCH (d:Document) RETURN max(d.updated_at) as last_updated }
+RETURN doc_count, entity_count, rel_count, last_updated
+"""
+
+DOCUMENT_INVENTORY_QUERY = """
+MATCH (d:Document)
+RETURN d.id as id, d.title as title,
+       substring(d.content, 0, 200) as preview, size(d.content) as content_len,
+       d.source as source, d.created_at as created_at,
+       size([(d)<-[:MENTIONED_IN]-(e:Entity) | e]) as entity_count
+ORDER BY d.created_at DESC
+LIMIT $limit
+"""
+
+ENTITY_ANALYSIS_QUERY = """
+MATCH (e:Entity)
+OPTIONAL MATCH (e)-[r]->(d:Document)
+WITH e, count(d) as document_count
+ORDER BY document_count DESC
+LIMIT $limit
+CALL {
+    WITH e
+    MATCH (e)-->(d:Document)
+    WITH DISTINCT d.title as title
+    LIMIT 3
+    RETURN collect(title) as sample_documents
+}
+RETURN e.name as name, e.type as type, e.description as description,
+       document_count, sample_documents
+ORDER BY document_count DESC
+"""
+
+DOCUMENT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes('docFts', $query) YIELD node AS d, score
+RETURN d.id as id, d.title as title,
+       substring(d.content, 0, 300) as preview, size(d.content) as content_len,
+       d.source as source, d.created_at as created_at, score
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+# Fallback used when the docFts index could not be created
+DOCUMENT_CONTAINS_SEARCH_QUERY = """
+MATCH (d:Document)
+WHERE d.title CONTAINS $query OR d.content CONTAINS $query
+RETURN d.id as id, d.title as title,
+       substring(d.content, 0, 300) as preview, size(d.content) as content_len,
+       d.source as source, d.created_at as created_at
+ORDER BY d.created_at DESC
+LIMIT $limit
+"""
+
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL_CHARS = set('+-&|!(){}[]^"~*?:\\/')
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    if AIOCONSOLE_AVAILABLE:
+        return await ainput(prompt)
+    return await asyncio.to_thread(input, prompt)
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape user input so it is matched literally by the full-text index"""
+    return "".join(f"\\{ch}" if ch in _LUCENE_SPECIAL_CHARS else ch for ch in text)
+
+# Per-row dashboard templates, filled with str.format_map
+_STAT_TEMPLATE = (
+    "\n🗄️  {stat.name}\n"
+    "   Status: {stat.status}\n"
+    "   Documents: {stat.total_documents:,}\n"
+    "   Entities: {stat.total_entities:,}\n"
+    "   Relationships: {stat.total_relationships:,}\n"
+    "   Embeddings: {stat.total_embeddings:,}"
+)
+_DOCUMENT_TEMPLATE = (
+    "\n📄 {doc.title}\n"
+    "   ID: {doc.id}\n"
+    "   Status: {icons} Neo4j: {doc.in_neo4j}, Pinecone: {doc.in_pinecone}\n"
+    "   Entities: {doc.entity_count}, Chunks: {doc.chunk_count}\n"
+    "   Source: {doc.source}\n"
+    "   Preview: {doc.content_preview}"
+)
+_ENTITY_TEMPLATE = (
+    "\n🔖 {name} ({type})\n"
+    "   Documents: {document_count}\n"
+    "   Description: {description}"
+)
+
+
+
+def _format_vector_hits(documents: List[str], metadatas: List[Dict[str, Any]],
+                        distances: List[float]) -> List[Dict[str, Any]]:
+    """Turn Chroma-style query columns, already ranked by the vector store, into search results"""
+    count = min(len(documents), len(metadatas), len(distances))
+    if count == 0:
+        return []
+    
+    # One vectorized transform instead of a subtraction per row
+    similarities = 1.0 - np.asarray(distances[:count], dtype=np.float32)
+    
+    hits = []
+    for i in range(count):
+        content = documents[i]
+        metadata = metadatas[i] or {}
+        hits.append({
+            "source": "Pinecone",
+            "id": metadata.get("chunk_id", f"chunk_{i}"),
+            "title": f"Chunk from {metadata.get('document_id', 'Unknown')}",
+            "content_preview": content[:300] + "..." if len(content) > 300 else content,
+            "similarity": float(similarities[i]),
+            "metadata": metadata
+        })
+    return hits
+
+
+@dataclass(slots=True, frozen=True)
 class DatabaseStats:
     """Statistics for a database"""
     name: str
@@ -43,7 +201,7 @@ class DatabaseStats:
     size_info: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DocumentInfo:
     """Information about a document across all databases"""
     id: str
@@ -52,13 +210,21 @@ class DocumentInfo:
     source: str
     created_at: str
     in_neo4j: bool
-    in_pinecone: bool
+    in_pinecone: Optional[bool]  # None when the vector store could not be queried
     in_chroma: bool
     entity_count: int
-    chunk_count: int
+    chunk_count: Optional[int]
     metadata: Dict[str, Any]
 
 
+def to_json(record: Union[DatabaseStats, DocumentInfo]) -> bytes:
+    """Serialize a stats or document record to JSON bytes"""
+    data = asdict(record)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode("utf-8")
+
+
 class AdminPortal:
     """Main admin portal class"""
     
@@ -67,6 +233,12 @@ class AdminPortal:
         self.neo4j_manager = None
         self.vector_manager = None
         self.chroma_manager = None
+        # Whether the docFts index exists; search falls back to CONTAINS otherwise
+        self._fulltext_available = False
+        # (monotonic timestamp, stats) of the last successful fetch
+        self._neo4j_stats_cache: Optional[Tuple[float, DatabaseStats]] = None
+        self._stats_cache: Optional[Tuple[float, DatabaseStats]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
         
     async def initialize(self):
         """Initialize database connections"""
@@ -81,6 +253,14 @@ class AdminPortal:
             print(f"❌ Neo4j connection failed: {e}")
             self.neo4j_manager = None
         
+        if self.neo4j_manager:
+            try:
+                # Full-text index backing search_documents (no-op if it already exists)
+                await self._aexec(DOCUMENT_FULLTEXT_INDEX_QUERY)
+                self._fulltext_available = True
+            except Exception as e:
+                print(f"⚠️ Full-text index unavailable, document search will use CONTAINS: {e}")
+        
         try:
             # Pinecone connection
             self.vector_manager = get_vector_manager()
@@ -94,57 +274,72 @@ class AdminPortal:
             print("ℹ️ Chroma fallback not configured")
         except Exception as e:
             print(f"❌ Chroma connection failed: {e}")
+        
+        # Keep the stats caches warm while the user is at the menu
+        self._refresh_task = asyncio.create_task(self._refresh_stats_cache_periodically())
+    
+    async def close(self):
+        """Stop background work"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+    
+    async def _refresh_stats_cache_periodically(self):
+        """Populate the stats caches in the background; errors surface on the next menu read"""
+        while True:
+            refreshers = []
+            if self.neo4j_manager:
+                refreshers.append(self._get_neo4j_stats())
+            if self.vector_manager:
+                refreshers.append(self._get_pinecone_stats())
+            await asyncio.gather(*refreshers, return_exceptions=True)
+            await asyncio.sleep(STATS_REFRESH_INTERVAL)
+    
+    async def _aexec(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run a Neo4j query on a worker thread so the sync driver doesn't block the event loop"""
+        return await asyncio.to_thread(self.neo4j_manager.execute_query, query, parameters)
+    
+    async def _avector(self, func, *args, **kwargs):
+        """Run a blocking vector store call on a worker thread"""
+        return await asyncio.to_thread(func, *args, **kwargs)
     
     async def get_database_statistics(self) -> List[DatabaseStats]:
         """Get comprehensive statistics for all databases"""
-        stats = []
-        
-        # Neo4j Statistics
+        # Neo4j and Pinecone are independent, so query them concurrently
+        sources = []
         if self.neo4j_manager:
-            try:
-                neo4j_stats = await self._get_neo4j_stats()
-                stats.append(neo4j_stats)
-            except Exception as e:
-                print(f"Error getting Neo4j stats: {e}")
-        
-        # Pinecone Statistics
+            sources.append(("Neo4j", self._get_neo4j_stats()))
         if self.vector_manager:
-            try:
-                pinecone_stats = await self._get_pinecone_stats()
-                stats.append(pinecone_stats)
-            except Exception as e:
-                print(f"Error getting Pinecone stats: {e}")
+            sources.append(("Pinecone", self._get_pinecone_stats()))
+        
+        results = await asyncio.gather(*(coro for _, coro in sources), return_exceptions=True)
+        
+        stats = []
+        for (name, _), result in zip(sources, results):
+            if isinstance(result, Exception):
+                print(f"Error getting {name} stats: {result}")
+            else:
+                stats.append(result)
         
         return stats
     
     async def _get_neo4j_stats(self) -> DatabaseStats:
         """Get Neo4j database statistics"""
-        # Document count
-        doc_query = "MATCH (d:Document) RETURN count(d) as count"
-        doc_result = self.neo4j_manager.execute_query(doc_query)
-        doc_count = doc_result[0]["count"] if doc_result else 0
-        
-        # Entity count
-        entity_query = "MATCH (e:Entity) RETURN count(e) as count"
-        entity_result = self.neo4j_manager.execute_query(entity_query)
-        entity_count = entity_result[0]["count"] if entity_result else 0
-        
-        # Relationship count
-        rel_query = "MATCH ()-[r]->() RETURN count(r) as count"
-        rel_result = self.neo4j_manager.execute_query(rel_query)
-        rel_count = rel_result[0]["count"] if rel_result else 0
-        
-        # Last updated document
-        last_updated_query = """
-        MATCH (d:Document) 
-        RETURN d.updated_at as last_updated 
-        ORDER BY d.updated_at DESC 
-        LIMIT 1
-        """
-        last_updated_result = self.neo4j_manager.execute_query(last_updated_query)
-        last_updated = last_updated_result[0]["last_updated"] if last_updated_result else None
+        if self._neo4j_stats_cache and time.monotonic() - self._neo4j_stats_cache[0] < NEO4J_STATS_TTL:
+            return self._neo4j_stats_cache[1]
+        
+        result = await self._aexec(NEO4J_STATS_QUERY)
+        row = result[0] if result else {}
+        doc_count = row.get("doc_count", 0)
+        entity_count = row.get("entity_count", 0)
+        rel_count = row.get("rel_count", 0)
+        last_updated = row.get("last_updated")
         
-        return DatabaseStats(
+        stats = DatabaseStats(
             name="Neo4j Graph Database",
             status="Connected",
             total_documents=doc_count,
@@ -158,44 +353,46 @@ class AdminPortal:
                 "relationships": rel_count
             }
         )
+        self._neo4j_stats_cache = (time.monotonic(), stats)
+        return stats
     
     async def _get_pinecone_stats(self) -> DatabaseStats:
         """Get Pinecone database statistics"""
+        if self._stats_cache and time.monotonic() - self._stats_cache[0] < PINECONE_STATS_TTL:
+            return self._stats_cache[1]
+        
         try:
             # Get index stats
             if hasattr(self.vector_manager, 'get_index_stats'):
-                stats = self.vector_manager.get_index_stats()
+                stats = await self._avector(self.vector_manager.get_index_stats)
                 vector_count = stats.get('total_vectors', 0)
             else:
                 # Fallback method
                 vector_count = 0
             
-            # Try to get document count by querying
-            try:
-                results = self.vector_manager.query_collection(
-                    collection_name="documents",
-                    query_text="test",
-                    n_results=1
-                )
-                # This is an approximation - Pinecone doesn't give exact counts easily
-                doc_count = vector_count  # Each vector is typically a document chunk
-            except:
-                doc_count = 0
+            # Stamped once per fetch; cached hits serve the same value
+            fetched_at = datetime.now().isoformat()
             
-            return DatabaseStats(
+            # Pinecone doesn't expose a document count, so approximate it from
+            # the vector count (each vector is typically a document chunk)
+            doc_count = vector_count
+            
+            pinecone_stats = DatabaseStats(
                 name="Pinecone Vector Database",
                 status="Connected",
                 total_documents=doc_count,
                 total_entities=0,
                 total_relationships=0,
                 total_embeddings=vector_count,
-                last_updated=datetime.now().isoformat(),
+                last_updated=fetched_at,
                 size_info={
                     "vectors": vector_count,
-                    "dimensions": 384,  # Based on all-MiniLM-L6-v2
-                    "collections": ["documents", "entities"]
+                    "dimensions": PINECONE_EMBEDDING_DIMENSION,
+                    "collections": PINECONE_COLLECTIONS
                 }
             )
+            self._stats_cache = (time.monotonic(), pinecone_stats)
+            return pinecone_stats
         except Exception as e:
             return DatabaseStats(
                 name="Pinecone Vector Database",
@@ -208,105 +405,66 @@ class AdminPortal:
                 size_info={}
             )
     
-    async def get_document_inventory(self, limit: int = 50) -> List[DocumentInfo]:
-        """Get comprehensive document inventory across all databases"""
-        documents = []
-        
+    async def get_document_inventory(self, limit: int = 50) -> AsyncIterator[DocumentInfo]:
+        """Stream comprehensive document inventory across all databases"""
         if not self.neo4j_manager:
             print("❌ Neo4j not available for document inventory")
-            return documents
+            return
         
         # Get documents from Neo4j
-        doc_query = """
-        MATCH (d:Document)
-        OPTIONAL MATCH (e:Entity)-[:MENTIONED_IN]->(d)
-        RETURN d.id as id, d.title as title, d.content as content, 
-               d.source as source, d.created_at as created_at,
-               count(e) as entity_count
-        ORDER BY d.created_at DESC
-        LIMIT $limit
-        """
+        neo4j_docs = await self._aexec(DOCUMENT_INVENTORY_QUERY, {"limit": limit})
         
-        neo4j_docs = self.neo4j_manager.execute_query(doc_query, {"limit": limit})
+        # One chunk-count lookup for the whole page instead of two per document
+        chunk_counts = await self._preload_pinecone_doc_map([doc["id"] for doc in neo4j_docs])
         
         for doc in neo4j_docs:
             doc_id = doc["id"]
-            
-            # Check if document exists in Pinecone
-            in_pinecone = await self._check_document_in_pinecone(doc_id)
-            chunk_count = await self._get_pinecone_chunk_count(doc_id)
+            chunk_count = chunk_counts.get(doc_id, 0) if chunk_counts is not None else None
             
             # Check if document exists in Chroma (if configured)
             in_chroma = False  # Would implement if Chroma is configured
             
-            documents.append(DocumentInfo(
+            yield DocumentInfo(
                 id=doc_id,
                 title=doc["title"] or "Untitled",
-                content_preview=doc["content"][:200] + "..." if doc["content"] and len(doc["content"]) > 200 else doc["content"] or "",
+                content_preview=(doc["preview"] or "") + ("..." if (doc["content_len"] or 0) > 200 else ""),
                 source=doc["source"] or "Unknown",
                 created_at=doc["created_at"] or "Unknown",
                 in_neo4j=True,
-                in_pinecone=in_pinecone,
+                in_pinecone=chunk_count > 0 if chunk_count is not None else None,
                 in_chroma=in_chroma,
                 entity_count=doc["entity_count"] or 0,
                 chunk_count=chunk_count,
                 metadata={}
-            ))
-        
-        return documents
-    
-    async def _check_document_in_pinecone(self, doc_id: str) -> bool:
-        """Check if a document exists in Pinecone"""
-        try:
-            results = self.vector_manager.query_collection(
-                collection_name="documents",
-                query_text="test",
-                n_results=1,
-                where={"document_id": doc_id}
             )
-            return bool(results.get("ids") and results["ids"][0])
-        except:
-            return False
     
-    async def _get_pinecone_chunk_count(self, doc_id: str) -> int:
-        """Get number of chunks for a document in Pinecone"""
+    async def _preload_pinecone_doc_map(self, doc_ids: List[str]) -> Optional[Dict[str, int]]:
+        """Get chunk counts for a batch of documents; None if they could not be counted"""
+        if not doc_ids:
+            return {}
+        if not self.vector_manager:
+            return None
         try:
-            results = self.vector_manager.query_collection(
-                collection_name="documents",
-                query_text="test",
-                n_results=100,  # Get more to count chunks
-                where={"document_id": doc_id}
-            )
-            return len(results.get("ids", [[]])[0]) if results.get("ids") else 0
-        except:
-            return 0
+            return await self._avector(self.vector_manager.count_chunks_by_document, "documents", doc_ids)
+        except Exception as e:
+            print(f"❌ Error getting Pinecone chunk counts, Pinecone status unknown: {e}")
+            return None
     
-    async def get_entity_analysis(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get entity analysis from Neo4j"""
+    async def get_entity_analysis(self, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """Stream entity analysis from Neo4j"""
         if not self.neo4j_manager:
-            return []
-        
-        entity_query = """
-        MATCH (e:Entity)
-        OPTIONAL MATCH (e)-[r]->(d:Document)
-        RETURN e.name as name, e.type as type, e.description as description,
-               count(d) as document_count, collect(DISTINCT d.title)[0..3] as sample_documents
-        ORDER BY document_count DESC
-        LIMIT $limit
-        """
+            return
         
-        entities = self.neo4j_manager.execute_query(entity_query, {"limit": limit})
+        entities = await self._aexec(ENTITY_ANALYSIS_QUERY, {"limit": limit})
         
-        return [
-            {
+        for entity in entities:
+            yield {
                 "name": entity["name"],
                 "type": entity["type"],
                 "description": entity["description"] or "No description",
                 "document_count": entity["document_count"],
                 "sample_documents": entity["sample_documents"] or []
             }
-            for entity in entities
-        ]
     
     async def search_documents(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Search documents across databases"""
@@ -314,105 +472,119 @@ class AdminPortal:
         
         # Search in Neo4j
         if self.neo4j_manager:
-            neo4j_query = """
-            MATCH (d:Document)
-            WHERE d.title CONTAINS $query OR d.content CONTAINS $query
-            RETURN d.id as id, d.title as title, d.content as content,
-                   d.source as source, d.created_at as created_at
-            ORDER BY d.created_at DESC
-            LIMIT $limit
-            """
-            
-            neo4j_results = self.neo4j_manager.execute_query(neo4j_query, {
-                "query": query,
-                "limit": limit
-            })
+            if self._fulltext_available:
+                neo4j_results = await self._aexec(DOCUMENT_SEARCH_QUERY, {
+                    "query": _escape_lucene(query),
+                    "limit": limit
+                })
+            else:
+                neo4j_results = await self._aexec(DOCUMENT_CONTAINS_SEARCH_QUERY, {
+                    "query": query,
+                    "limit": limit
+                })
             
             for doc in neo4j_results:
-                results.append({
+                result = {
                     "source": "Neo4j",
                     "id": doc["id"],
                     "title": doc["title"],
-                    "content_preview": doc["content"][:300] + "..." if doc["content"] and len(doc["content"]) > 300 else doc["content"],
+                    "content_preview": (doc["preview"] or "") + ("..." if (doc["content_len"] or 0) > 300 else ""),
                     "created_at": doc["created_at"]
-                })
+                }
+                if self._fulltext_available:
+                    result["score"] = doc["score"]
+                results.append(result)
         
         # Search in Pinecone
         if self.vector_manager:
             try:
-                vector_results = self.vector_manager.query_collection(
+                vector_results = await self._avector(
+                    self.vector_manager.query_collection,
                     collection_name="documents",
                     query_text=query,
                     n_results=limit
                 )
                 
                 if vector_results.get("documents") and vector_results["documents"][0]:
-                    for i, (content, metadata, distance) in enumerate(zip(
+                    results.extend(_format_vector_hits(
                         vector_results["documents"][0],
                         vector_results.get("metadatas", [[]])[0] or [],
                         vector_results.get("distances", [[]])[0] or []
-                    )):
-                        results.append({
-                            "source": "Pinecone",
-                            "id": metadata.get("chunk_id", f"chunk_{i}"),
-                            "title": f"Chunk from {metadata.get('document_id', 'Unknown')}",
-                            "content_preview": content[:300] + "..." if len(content) > 300 else content,
-                            "similarity": 1 - distance if distance else 0,
-                            "metadata": metadata
-                        })
+                    ))
             except Exception as e:
                 print(f"Error searching Pinecone: {e}")
         
         return results
     
-    def print_dashboard(self, stats: List[DatabaseStats], documents: List[DocumentInfo], entities: List[Dict[str, Any]]):
-        """Print a comprehensive dashboard"""
-        print("\n" + "="*80)
-        print("🏛️  GRAPH-ENHANCED AGENTIC RAG - ADMIN PORTAL")
-        print("="*80)
+    async def export_inventory(self, path: str, limit: int = 100) -> int:
+        """Write database statistics, then the document inventory, to a JSON Lines file
+        
+        Returns the number of records written.
+        """
+        records = [to_json(stat) for stat in await self.get_database_statistics()]
+        async for doc in self.get_document_inventory(limit):
+            records.append(to_json(doc))
+        
+        def write_records():
+            with open(path, "wb") as f:
+                f.writelines(record + b"\n" for record in records)
+        
+        await asyncio.to_thread(write_records)
+        return len(records)
+    
+    async def print_dashboard(self, stats: List[DatabaseStats], documents: AsyncIterator[DocumentInfo],
+                              entities: AsyncIterator[Dict[str, Any]], top: int = 10):
+        """Print a comprehensive dashboard, consuming at most `top` documents and entities"""
+        # Build the whole dashboard and emit it with a single write
+        lines = [
+            "\n" + "="*80,
+            "🏛️  GRAPH-ENHANCED AGENTIC RAG - ADMIN PORTAL",
+            "="*80,
+            "\n📊 DATABASE STATISTICS",
+            "-" * 50
+        ]
         
         # Database Statistics
-        print("\n📊 DATABASE STATISTICS")
-        print("-" * 50)
         for stat in stats:
-            print(f"\n🗄️  {stat.name}")
-            print(f"   Status: {stat.status}")
-            print(f"   Documents: {stat.total_documents:,}")
-            print(f"   Entities: {stat.total_entities:,}")
-            print(f"   Relationships: {stat.total_relationships:,}")
-            print(f"   Embeddings: {stat.total_embeddings:,}")
+            lines.append(_STAT_TEMPLATE.format_map({"stat": stat}))
             if stat.last_updated:
-                print(f"   Last Updated: {stat.last_updated}")
+                lines.append(f"   Last Updated: {stat.last_updated}")
         
         # Document Inventory
-        print(f"\n📚 DOCUMENT INVENTORY (Top {len(documents)})")
-        print("-" * 50)
-        for doc in documents[:10]:  # Show top 10
-            status_icons = []
-            if doc.in_neo4j:
-                status_icons.append("🔗")
-            if doc.in_pinecone:
-                status_icons.append("🔍")
-            if doc.in_chroma:
-                status_icons.append("💾")
-            
-            print(f"\n📄 {doc.title}")
-            print(f"   ID: {doc.id}")
-            print(f"   Status: {''.join(status_icons)} Neo4j: {doc.in_neo4j}, Pinecone: {doc.in_pinecone}")
-            print(f"   Entities: {doc.entity_count}, Chunks: {doc.chunk_count}")
-            print(f"   Source: {doc.source}")
-            print(f"   Preview: {doc.content_preview}")
+        lines.append(f"\n📚 DOCUMENT INVENTORY (Top {top})")
+        lines.append("-" * 50)
+        top_docs = top
+        async with aclosing(documents):
+            async for doc in documents:
+                status_icons = []
+                if doc.in_neo4j:
+                    status_icons.append("🔗")
+                if doc.in_pinecone:
+                    status_icons.append("🔍")
+                if doc.in_chroma:
+                    status_icons.append("💾")
+                
+                lines.append(_DOCUMENT_TEMPLATE.format_map({"doc": doc, "icons": "".join(status_icons)}))
+                top_docs -= 1
+                if top_docs == 0:
+                    break
         
         # Entity Analysis
-        print(f"\n🏷️  ENTITY ANALYSIS (Top {len(entities)})")
-        print("-" * 50)
-        for entity in entities[:10]:  # Show top 10
-            print(f"\n🔖 {entity['name']} ({entity['type']})")
-            print(f"   Documents: {entity['document_count']}")
-            print(f"   Description: {entity['description']}")
-            if entity['sample_documents']:
-                print(f"   Found in: {', '.join(entity['sample_documents'][:2])}...")
-
+        lines.append(f"\n🏷️  ENTITY ANALYSIS (Top {top})")
+        lines.append("-" * 50)
+        top_entities = top
+        async with aclosing(entities):
+            async for entity in entities:
+                lines.append(_ENTITY_TEMPLATE.format_map(entity))
+                if entity['sample_documents']:
+                    lines.append(f"   Found in: {', '.join(entity['sample_documents'][:2])}...")
+                top_entities -= 1
+                if top_entities == 0:
+                    break
+        
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
 async def main():
     """Main admin portal function"""
@@ -430,9 +602,10 @@ async def main():
         print("3. 🏷️  Entity Analysis")
         print("4. 🔍 Search Documents")
         print("5. 📋 Full Dashboard")
-        print("6. 🚪 Exit")
+        print("6. 💾 Export Inventory (JSON Lines)")
+        print("7. 🚪 Exit")
         
-        choice = input("\nSelect option (1-6): ").strip()
+        choice = (await _ainput("\nSelect option (1-7): ")).strip()
         
         if choice == "1":
             print("\n📊 Getting database statistics...")
@@ -445,11 +618,9 @@ async def main():
                 print(f"   🔍 Embeddings: {stat.total_embeddings:,}")
         
         elif choice == "2":
-            limit = int(input("Number of documents to show (default 20): ") or "20")
+            limit = int(await _ainput("Number of documents to show (default 20): ") or "20")
             print(f"\n📚 Getting document inventory (limit: {limit})...")
-            documents = await portal.get_document_inventory(limit)
-            
-            for doc in documents:
+            async for doc in portal.get_document_inventory(limit):
                 print(f"\n📄 {doc.title}")
                 print(f"   🆔 ID: {doc.id}")
                 print(f"   📍 Databases: Neo4j: {doc.in_neo4j}, Pinecone: {doc.in_pinecone}")
@@ -457,11 +628,9 @@ async def main():
                 print(f"   📝 Preview: {doc.content_preview}")
         
         elif choice == "3":
-            limit = int(input("Number of entities to show (default 20): ") or "20")
+            limit = int(await _ainput("Number of entities to show (default 20): ") or "20")
             print(f"\n🏷️  Getting entity analysis (limit: {limit})...")
-            entities = await portal.get_entity_analysis(limit)
-            
-            for entity in entities:
+            async for entity in portal.get_entity_analysis(limit):
                 print(f"\n🔖 {entity['name']} ({entity['type']})")
                 print(f"   📄 Documents: {entity['document_count']}")
                 print(f"   📝 Description: {entity['description']}")
@@ -469,9 +638,9 @@ async def main():
                     print(f"   📚 Found in: {', '.join(entity['sample_documents'])}")
         
         elif choice == "4":
-            query = input("Enter search query: ").strip()
+            query = (await _ainput("Enter search query: ")).strip()
             if query:
-                limit = int(input("Number of results (default 10): ") or "10")
+                limit = int(await _ainput("Number of results (default 10): ") or "10")
                 print(f"\n🔍 Searching for '{query}'...")
                 results = await portal.search_documents(query, limit)
                 
@@ -480,21 +649,33 @@ async def main():
                     print(f"   🆔 ID: {result['id']}")
                     if 'similarity' in result:
                         print(f"   📊 Similarity: {result['similarity']:.2%}")
+                    elif 'score' in result:
+                        print(f"   📊 Relevance: {result['score']:.2f}")
                     print(f"   📝 Preview: {result['content_preview']}")
         
         elif choice == "5":
             print("\n📋 Generating full dashboard...")
             stats = await portal.get_database_statistics()
-            documents = await portal.get_document_inventory(20)
-            entities = await portal.get_entity_analysis(20)
-            portal.print_dashboard(stats, documents, entities)
+            await portal.print_dashboard(
+                stats,
+                portal.get_document_inventory(20),
+                portal.get_entity_analysis(20)
+            )
         
         elif choice == "6":
+            path = (await _ainput("Output file (default inventory.jsonl): ")).strip() or "inventory.jsonl"
+            limit = int(await _ainput("Number of documents to export (default 100): ") or "100")
+            print(f"\n💾 Exporting inventory to {path}...")
+            count = await portal.export_inventory(path, limit)
+            print(f"✅ Wrote {count} records to {path}")
+        
+        elif choice == "7":
             print("\n👋 Goodbye!")
+            await portal.close()
             break
         
         else:
-            print("❌ Invalid choice. Please select 1-6.")
+            print("❌ Invalid choice. Please select 1-7.")
 
 
 if __name__ == "__main__":
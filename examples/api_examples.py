@@ -6,35 +6,499 @@ for various use cases and query types.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+import asyncio
+import hashlib
 import json
+import logging
+import os
+import random
+import tempfile
+import threading
 import time
-from typing import Dict, Any, List
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import Enum
+from types import MappingProxyType
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Async upload example is optional and only used when aiohttp/aiofiles are installed
+try:
+    import aiohttp
+    import aiofiles
+    ASYNC_UPLOAD_AVAILABLE = True
+except ImportError:
+    ASYNC_UPLOAD_AVAILABLE = False
+
+# HTTP/2 async client is optional and requires httpx[http2]
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# orjson is optional; request bodies fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Semantic cache tier is optional and only used when explicitly enabled
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of example queries in flight at once
+EXAMPLE_CONCURRENCY = int(os.getenv("RAG_EXAMPLE_CONCURRENCY", "8"))
+# Maximum number of concurrent uploads in the async upload example
+EXAMPLE_UPLOAD_CONCURRENCY = int(os.getenv("RAG_EXAMPLE_UPLOAD_CONCURRENCY", "16"))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Read size for streamed upload bodies
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_multipart(
+    fields: Dict[str, str],
+    filename: str,
+    chunks: Iterable[Any],
+    boundary: str
+) -> Iterator[bytes]:
+    """Yield a multipart/form-data body whose file part is streamed from chunks."""
+    for name, value in fields.items():
+        yield (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+        ).encode("utf-8")
+    yield (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: text/plain\r\n\r\n'
+    ).encode("utf-8")
+    for chunk in chunks:
+        if chunk:
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    yield f'\r\n--{boundary}--\r\n'.encode("utf-8")
+
+
+async def iter_file_async(file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """Yield a file's bytes in chunks without blocking the event loop."""
+    async with aiofiles.open(file_path, 'rb') as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
+class Strategy(str, Enum):
+    """Retrieval strategies accepted by the query endpoint."""
+    VECTOR_ONLY = "vector_only"
+    GRAPH_ONLY = "graph_only"
+    HYBRID = "hybrid"
+
+
+@dataclass
+class CacheEntry:
+    """A cached query response."""
+    response: Dict[str, Any]
+    params: Tuple[Any, ...]
+    created_at: float
+    embedding: Optional[Any] = None
+
+
+class SmartRAGCache:
+    """Two-tier client-side cache for query responses.
+    
+    The exact tier matches normalized questions with identical query
+    parameters. The optional semantic tier returns a cached response when a
+    new question embeds within `similarity_threshold` (cosine) of a cached one.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: float = 300.0,
+        enable_semantic: bool = False,
+        similarity_threshold: float = 0.95,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        """Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of cached responses (LRU eviction)
+            ttl_seconds: Time after which a cached response expires
+            enable_semantic: Whether to enable the embedding-based tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            model_name: Sentence-transformers model used for the semantic tier
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enable_semantic = enable_semantic and SEMANTIC_CACHE_AVAILABLE
+        self.similarity_threshold = similarity_threshold
+        self.model_name = model_name
+        
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._model = None
+        self._matrix = None
+        self._matrix_keys: List[str] = []
+        self._matrix_dirty = False
+        self._last_embedding: Optional[Tuple[str, Any]] = None
+        self._precomputed: Dict[str, Any] = {}
+        self._hits = {"exact": 0, "semantic": 0}
+        self._misses = 0
+    
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Lowercase, strip and collapse whitespace."""
+        return " ".join(question.lower().split())
+    
+    @staticmethod
+    def _make_key(normalized: str, params: Tuple[Any, ...]) -> str:
+        return hashlib.blake2b(repr((normalized, params)).encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _load_model(self):
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+    
+    def _embed(self, normalized: str):
+        embedding = self._precomputed.get(normalized)
+        if embedding is not None:
+            return embedding
+        embedding = self._load_model().encode([normalized], normalize_embeddings=True, convert_to_numpy=True)[0]
+        return embedding.astype(np.float32, copy=False)
+    
+    def precompute_embeddings(self, questions: List[str], batch_size: int = 32) -> None:
+        """Embed known upcoming questions in one batched encode call.
+        
+        Later lookups for these questions reuse the precomputed rows instead
+        of encoding each question on its own. No-op without the semantic tier.
+        """
+        if not self.enable_semantic:
+            return
+        
+        with self._lock:
+            pending = list(dict.fromkeys(
+                normalized for normalized in map(self.normalize, questions)
+                if normalized not in self._precomputed
+            ))
+            if not pending:
+                return
+            
+            matrix = self._load_model().encode(
+                pending, batch_size=batch_size, normalize_embeddings=True, convert_to_numpy=True
+            )
+            matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            self._precomputed.update(zip(pending, matrix))
+    
+    def _expired(self, entry: CacheEntry, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+    
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.embedding is not None:
+            self._matrix_dirty = True
+    
+    def _semantic_lookup(self, normalized: str, params: Tuple[Any, ...], now: float) -> Optional[Dict[str, Any]]:
+        embedding = self._embed(normalized)
+        self._last_embedding = (normalized, embedding)
+        
+        if self._matrix_dirty:
+            keys = [key for key, entry in self._entries.items() if entry.embedding is not None]
+            self._matrix_keys = keys
+            self._matrix = np.stack([self._entries[key].embedding for key in keys]) if keys else None
+            self._matrix_dirty = False
+        
+        if self._matrix is None:
+            return None
+        
+        # One matmul against every cached question; embeddings are unit-normalized
+        similarities = self._matrix @ embedding
+        for index in np.argsort(-similarities):
+            if similarities[index] < self.similarity_threshold:
+                break
+            key = self._matrix_keys[index]
+            entry = self._entries.get(key)
+            if entry is None or entry.params != params or self._expired(entry, now):
+                continue
+            self._entries.move_to_end(key)
+            return entry.response
+        return None
+    
+    def get(self, question: str, params: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """Look up a cached response for a question and its query parameters."""
+        normalized = self.normalize(question)
+        key = self._make_key(normalized, params)
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry, now):
+                    self._entries.move_to_end(key)
+                    self._hits["exact"] += 1
+                    return entry.response
+                self._remove(key)
+            
+            if self.enable_semantic:
+                response = self._semantic_lookup(normalized, params, now)
+                if response is not None:
+                    self._hits["semantic"] += 1
+                    return response
+            
+            self._misses += 1
+            return None
+    
+    def put(self, question: str, params: Tuple[Any, ...], response: Dict[str, Any]) -> None:
+        """Store a response for a question and its query parameters."""
+        normalized = self.normalize(question)
+        key = self._make_key(normalized, params)
+        
+        with self._lock:
+            embedding = None
+            if self.enable_semantic:
+                if self._last_embedding and self._last_embedding[0] == normalized:
+                    embedding = self._last_embedding[1]
+                else:
+                    embedding = self._embed(normalized)
+                self._matrix_dirty = True
+            
+            self._remove(key)
+            self._entries[key] = CacheEntry(response, params, time.monotonic(), embedding)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._precomputed.clear()
+            self._matrix = None
+            self._matrix_keys = []
+            self._matrix_dirty = False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            hits = self._hits["exact"] + self._hits["semantic"]
+            total = hits + self._misses
+            return {
+                "size": len(self._entries),
+                "exact_hits": self._hits["exact"],
+                "semantic_hits": self._hits["semantic"],
+                "misses": self._misses,
+                "hit_rate": hits / total if total else 0.0
+            }
 
 
 class RAGAPIClient:
     """Client for interacting with the Graph-Enhanced Agentic RAG API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 0.2
+    RETRY_MAX_DELAY = 5.0
+    RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+    # Statuses a non-idempotent request is retried on, and only with Retry-After,
+    # since the server rejected them before doing any work
+    NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+    
+    # Mirrors the server-side QueryRequest constraints
+    MAX_RESULTS_LIMIT = 50
+    MAX_QUERY_LENGTH = 1000
+    _VALID_STRATEGIES = frozenset(strategy.value for strategy in Strategy)
+    
+    # Seconds a health/status response is reused before polling again
+    HEALTH_CACHE_TTL = 2.0
+    STATUS_CACHE_TTL = 5.0
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        cache: Optional[SmartRAGCache] = None
+    ):
         """Initialize the API client.
         
         Args:
             base_url: Base URL of the API server
+            cache: Response cache for queries (defaults to an exact-match cache)
         """
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+        
+        # Keep enough pooled keep-alive connections for concurrent callers.
+        # Retries are handled by _request_with_retry (full-jitter backoff).
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Advertise every encoding urllib3 can decode here (br/zstd when installed)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING
+        })
+        
+        self.cache = cache if cache is not None else SmartRAGCache()
+        
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._status_lock = threading.Lock()
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check system health status."""
-        response = self.session.get(f"{self.base_url}/health")
+    def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        **kwargs
+    ) -> requests.Response:
+        """Send a request, retrying transient failures with exponential backoff.
+        
+        Idempotent requests are retried on connection errors, timeouts and
+        RETRYABLE_STATUS_CODES. Other requests (uploads, which create a new
+        document each time) are only retried when the server cannot have seen
+        them: connect timeouts, refused connections, and 429/503 responses
+        carrying Retry-After. Retries happen up to MAX_RETRIES times using
+        full-jitter delays, honouring Retry-After when the server sends it.
+        The final response is returned unchecked.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            idempotent: Whether the request is safe to repeat; defaults to
+                True for every method except POST
+            **kwargs: Passed through to requests
+        """
+        if idempotent is None:
+            idempotent = method.upper() != "POST"
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            # Multipart file bodies are consumed on send; rewind before each attempt
+            for file_obj in (kwargs.get("files") or {}).values():
+                if hasattr(file_obj, "seek"):
+                    file_obj.seek(0)
+            
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.MAX_RETRIES or not (idempotent or self._is_connect_failure(e)):
+                    raise
+                retry_after = None
+            else:
+                retry_after = response.headers.get("Retry-After")
+                if idempotent:
+                    retryable = response.status_code in self.RETRYABLE_STATUS_CODES
+                else:
+                    retryable = (
+                        response.status_code in self.NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
+                        and retry_after is not None
+                    )
+                if not retryable or attempt == self.MAX_RETRIES:
+                    return response
+            
+            if retry_after is not None and retry_after.isdigit():
+                delay = min(self.RETRY_MAX_DELAY, float(retry_after))
+            else:
+                delay = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt))
+            time.sleep(delay)
+    
+    @staticmethod
+    def _is_connect_failure(error: requests.exceptions.RequestException) -> bool:
+        """Whether a request failed before the connection was made, so nothing was sent."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    
+    def _post_json(self, path: str, payload: Any, idempotent: bool = False) -> requests.Response:
+        """POST a JSON body to an API path; bytes payloads are sent as already encoded."""
+        body = payload if isinstance(payload, bytes) else dumps_json(payload)
+        return self._request_with_retry(
+            "POST", f"{self.base_url}{path}", idempotent=idempotent, data=body, headers=JSON_HEADERS
+        )
+    
+    @classmethod
+    def _validate_query(cls, question: str, max_results: int, strategy: Optional[Union[Strategy, str]]) -> None:
+        """Reject queries the server would refuse, without a round-trip.
+        
+        Raises:
+            ValueError: If the question, max_results or strategy is invalid
+        """
+        if not question or not question.strip():
+            raise ValueError("Query cannot be empty or whitespace only")
+        if len(question) > cls.MAX_QUERY_LENGTH:
+            raise ValueError(f"Query must be at most {cls.MAX_QUERY_LENGTH} characters")
+        if not 1 <= max_results <= cls.MAX_RESULTS_LIMIT:
+            raise ValueError(f"max_results must be between 1 and {cls.MAX_RESULTS_LIMIT}")
+        if strategy is not None and strategy not in cls._VALID_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy '{strategy}', expected one of {sorted(cls._VALID_STRATEGIES)}"
+            )
+    
+    @staticmethod
+    def _validate_document(title: str, content: str) -> None:
+        """Reject documents with a missing title or content, without a round-trip.
+        
+        Raises:
+            ValueError: If the title or content is empty
+        """
+        if not title or not title.strip():
+            raise ValueError("Document title cannot be empty")
+        if not content or not content.strip():
+            raise ValueError("Document content cannot be empty")
+    
+    def _get_status(self, path: str, ttl: float) -> Dict[str, Any]:
+        """GET a status endpoint, reusing the last response for `ttl` seconds."""
+        now = time.monotonic()
+        with self._status_lock:
+            cached = self._status_cache.get(path)
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
+        
+        response = self._request_with_retry("GET", f"{self.base_url}{path}")
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        
+        with self._status_lock:
+            self._status_cache[path] = (time.monotonic(), result)
+        return result
+    
+    def invalidate_status_cache(self) -> None:
+        """Force the next health/status call to hit the server."""
+        with self._status_lock:
+            self._status_cache.clear()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "RAGAPIClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def health_check(self) -> Dict[str, Any]:
+        """Check system health status (cached for HEALTH_CACHE_TTL seconds)."""
+        return self._get_status("/health", self.HEALTH_CACHE_TTL)
     
     def query(
         self, 
         question: str, 
         max_results: int = 10,
         include_reasoning: bool = True,
-        strategy: str = None
+        strategy: Optional[Union[Strategy, str]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """Submit a query to the RAG system.
         
@@ -42,23 +506,42 @@ class RAGAPIClient:
             question: The question to ask
             max_results: Maximum number of results to return
             include_reasoning: Whether to include reasoning path
-            strategy: Specific retrieval strategy ('vector_only', 'graph_only', 'hybrid')
+            strategy: Specific retrieval strategy (Strategy member or its string value)
+            use_cache: Whether to serve and store the response in the client cache
             
         Returns:
             Query response with answer, sources, and metadata
+            
+        Raises:
+            ValueError: If the query is rejected by client-side validation
         """
+        self._validate_query(question, max_results, strategy)
+        if strategy is not None:
+            strategy = Strategy(strategy)
+        
+        cache_params = (strategy, max_results, include_reasoning)
+        if use_cache:
+            cached = self.cache.get(question, cache_params)
+            if cached is not None:
+                return cached
+        
         payload = {
             "query": question,
             "max_results": max_results,
             "include_reasoning": include_reasoning
         }
         
-        if strategy:
-            payload["strategy"] = strategy
+        if strategy is not None:
+            payload["strategy"] = strategy.value
         
-        response = self.session.post(f"{self.base_url}/query", json=payload)
+        # Queries have no side effects, so they are retried like GETs
+        response = self._post_json("/query", payload, idempotent=True)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        
+        if use_cache:
+            self.cache.put(question, cache_params, result)
+        return result
     
     def upload_document(
         self,
@@ -79,7 +562,12 @@ class RAGAPIClient:
             
         Returns:
             Upload response with document ID and processing info
+            
+        Raises:
+            ValueError: If the title or content is empty
         """
+        self._validate_document(title, content)
+        
         payload = {
             "title": title,
             "content": content,
@@ -90,10 +578,89 @@ class RAGAPIClient:
         if source:
             payload["source"] = source
         
-        response = self.session.post(f"{self.base_url}/documents/upload", json=payload)
+        response = self._post_json("/documents/upload", payload)
+        response.raise_for_status()
+        return response.json()
+    
+    def upload_document_stream(
+        self,
+        title: str,
+        content_iter: Iterable[Any],
+        source: str = None,
+        domain: str = "general",
+        metadata: Dict[str, Any] = None,
+        filename: str = "document.txt"
+    ) -> Dict[str, Any]:
+        """Upload a large document by streaming its content as a multipart file.
+        
+        The body is sent with chunked transfer encoding, so memory use does
+        not grow with document size. Streamed bodies cannot be replayed, so
+        this call is not retried.
+        
+        Args:
+            title: Document title
+            content_iter: Iterable of str/bytes chunks making up the content
+            source: Source URL or reference
+            domain: Knowledge domain
+            metadata: Additional metadata
+            filename: File name reported to the server
+            
+        Returns:
+            Upload response with document ID and processing info
+        """
+        if not title or not title.strip():
+            raise ValueError("Document title cannot be empty")
+        
+        fields = {'title': title, 'domain': domain}
+        if source:
+            fields['source'] = source
+        if metadata:
+            fields['metadata'] = dumps_json(metadata).decode("utf-8")
+        
+        boundary = os.urandom(16).hex()
+        response = self.session.post(
+            f"{self.base_url}/documents/upload-file",
+            data=iter_multipart(fields, filename, content_iter, boundary),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def _upload_batch(self, docs: List[Union[Dict[str, Any], bytes]]) -> List[Dict[str, Any]]:
+        """POST a single chunk of documents to the batch upload endpoint."""
+        # Pre-encoded documents are spliced into the body without re-serializing
+        body = b'{"documents":[' + b",".join(
+            doc if isinstance(doc, bytes) else dumps_json(doc) for doc in docs
+        ) + b"]}"
+        response = self._post_json("/documents/upload-batch", body)
         response.raise_for_status()
         return response.json()
     
+    def upload_documents_batch(
+        self,
+        docs: Iterable[Union[Dict[str, Any], bytes]],
+        batch_size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Upload many documents through the batch endpoint.
+        
+        Documents are grouped into chunks of ``batch_size`` and the chunks are
+        submitted concurrently. Results are yielded per document, in input order.
+        
+        Args:
+            docs: Documents with title, content and optional source, domain,
+                metadata, either as dictionaries or as pre-encoded JSON bytes
+            batch_size: Maximum number of documents per request (server limit is 100)
+        
+        Returns:
+            Iterator of upload responses, one per document
+        """
+        docs = iter(docs)
+        chunks = iter(lambda: list(islice(docs, batch_size)), [])
+        
+        with ThreadPoolExecutor(max_workers=EXAMPLE_CONCURRENCY) as executor:
+            for results in executor.map(self._upload_batch, chunks):
+                yield from results
+    
     def upload_file(
         self,
         file_path: str,
@@ -122,7 +689,8 @@ class RAGAPIClient:
             if source:
                 data['source'] = source
             
-            response = self.session.post(
+            response = self._request_with_retry(
+                "POST",
                 f"{self.base_url}/documents/upload-file",
                 files=files,
                 data=data
@@ -130,17 +698,239 @@ class RAGAPIClient:
             response.raise_for_status()
             return response.json()
     
+    async def upload_document_async(
+        self,
+        session: "aiohttp.ClientSession",
+        title: str,
+        content: str,
+        source: str = None,
+        domain: str = "general",
+        metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Upload a document for ingestion using an aiohttp session.
+        
+        Args:
+            session: Shared aiohttp session
+            title: Document title
+            content: Document content
+            source: Source URL or reference
+            domain: Knowledge domain
+            metadata: Additional metadata
+            
+        Returns:
+            Upload response with document ID and processing info
+        """
+        payload = {
+            "title": title,
+            "content": content,
+            "domain": domain,
+            "metadata": metadata or {}
+        }
+        
+        if source:
+            payload["source"] = source
+        
+        async with session.post(
+            f"{self.base_url}/documents/upload", data=dumps_json(payload), headers=JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+    
+    async def upload_file_async(
+        self,
+        session: "aiohttp.ClientSession",
+        file_path: str,
+        title: str,
+        source: str = None,
+        domain: str = "general"
+    ) -> Dict[str, Any]:
+        """Upload a file for ingestion without blocking on disk reads.
+        
+        Args:
+            session: Shared aiohttp session
+            file_path: Path to the file to upload
+            title: Document title
+            source: Source URL or reference
+            domain: Knowledge domain
+            
+        Returns:
+            Upload response with document ID and processing info
+        """
+        form = aiohttp.FormData()
+        form.add_field('file', iter_file_async(file_path), filename=os.path.basename(file_path))
+        form.add_field('title', title)
+        form.add_field('domain', domain)
+        if source:
+            form.add_field('source', source)
+        
+        async with session.post(f"{self.base_url}/documents/upload-file", data=form) as response:
+            response.raise_for_status()
+            return await response.json()
+    
     def get_agent_status(self) -> Dict[str, Any]:
-        """Get status of all agents."""
-        response = self.session.get(f"{self.base_url}/agents/status")
+        """Get status of all agents (cached for STATUS_CACHE_TTL seconds)."""
+        return self._get_status("/agents/status", self.STATUS_CACHE_TTL)
+    
+    def get_system_status(self) -> Dict[str, Any]:
+        """Get comprehensive system status (cached for STATUS_CACHE_TTL seconds)."""
+        return self._get_status("/system/status", self.STATUS_CACHE_TTL)
+
+
+class AsyncRAGAPIClient:
+    """Async client multiplexing requests over one HTTP/2 connection pool."""
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        cache: Optional[SmartRAGCache] = None,
+        timeout: float = 60.0
+    ):
+        """Initialize the async API client.
+        
+        Args:
+            base_url: Base URL of the API server
+            cache: Response cache for queries (defaults to an exact-match cache)
+            timeout: Request timeout in seconds
+        """
+        self.base_url = base_url.rstrip('/')
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+        self.cache = cache if cache is not None else SmartRAGCache()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self.client.aclose()
+    
+    async def __aenter__(self) -> "AsyncRAGAPIClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    async def _post_json(self, path: str, payload: Any) -> Dict[str, Any]:
+        response = await self.client.post(path, content=dumps_json(payload), headers=JSON_HEADERS)
         response.raise_for_status()
         return response.json()
     
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status."""
-        response = self.session.get(f"{self.base_url}/system/status")
+    async def _get_json(self, path: str) -> Dict[str, Any]:
+        response = await self.client.get(path)
         response.raise_for_status()
         return response.json()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check system health status."""
+        return await self._get_json("/health")
+    
+    async def query(
+        self,
+        question: str,
+        max_results: int = 10,
+        include_reasoning: bool = True,
+        strategy: Optional[Union[Strategy, str]] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Submit a query to the RAG system.
+        
+        Args:
+            question: The question to ask
+            max_results: Maximum number of results to return
+            include_reasoning: Whether to include reasoning path
+            strategy: Specific retrieval strategy (Strategy member or its string value)
+            use_cache: Whether to serve and store the response in the client cache
+            
+        Returns:
+            Query response with answer, sources, and metadata
+        """
+        RAGAPIClient._validate_query(question, max_results, strategy)
+        if strategy is not None:
+            strategy = Strategy(strategy)
+        
+        cache_params = (strategy, max_results, include_reasoning)
+        if use_cache:
+            cached = self.cache.get(question, cache_params)
+            if cached is not None:
+                return cached
+        
+        payload = {
+            "query": question,
+            "max_results": max_results,
+            "include_reasoning": include_reasoning
+        }
+        
+        if strategy is not None:
+            payload["strategy"] = strategy.value
+        
+        result = await self._post_json("/query", payload)
+        
+        if use_cache:
+            self.cache.put(question, cache_params, result)
+        return result
+    
+    async def upload_document(
+        self,
+        title: str,
+        content: str,
+        source: str = None,
+        domain: str = "general",
+        metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Upload a document for ingestion.
+        
+        Args:
+            title: Document title
+            content: Document content
+            source: Source URL or reference
+            domain: Knowledge domain
+            metadata: Additional metadata
+            
+        Returns:
+            Upload response with document ID and processing info
+        """
+        RAGAPIClient._validate_document(title, content)
+        
+        payload = {
+            "title": title,
+            "content": content,
+            "domain": domain,
+            "metadata": metadata or {}
+        }
+        
+        if source:
+            payload["source"] = source
+        
+        return await self._post_json("/documents/upload", payload)
+    
+    async def get_agent_status(self) -> Dict[str, Any]:
+        """Get status of all agents."""
+        return await self._get_json("/agents/status")
+    
+    async def get_system_status(self) -> Dict[str, Any]:
+        """Get comprehensive system status."""
+        return await self._get_json("/system/status")
+
+
+# Example queries of different types, shared by the sync and async basic examples
+BASIC_QUERIES = [
+    {
+        "question": "What is machine learning?",
+        "description": "Simple factual query (should use vector search)",
+        "strategy": Strategy.VECTOR_ONLY
+    },
+    {
+        "question": "How are neural networks related to deep learning?",
+        "description": "Relationship query (should use graph traversal)",
+        "strategy": Strategy.GRAPH_ONLY
+    },
+    {
+        "question": "What are the applications of machine learning in healthcare and how do they relate to AI ethics?",
+        "description": "Complex multi-hop query (should use hybrid approach)",
+        "strategy": Strategy.HYBRID
+    }
+]
 
 
 def example_basic_queries():
@@ -158,152 +948,272 @@ def example_basic_queries():
         print(f"Failed to connect to API: {e}")
         return
     
-    # Example queries of different types
-    queries = [
-        {
-            "question": "What is machine learning?",
-            "description": "Simple factual query (should use vector search)",
-            "strategy": "vector_only"
-        },
-        {
-            "question": "How are neural networks related to deep learning?",
-            "description": "Relationship query (should use graph traversal)",
-            "strategy": "graph_only"
-        },
-        {
-            "question": "What are the applications of machine learning in healthcare and how do they relate to AI ethics?",
-            "description": "Complex multi-hop query (should use hybrid approach)",
-            "strategy": "hybrid"
+    queries = BASIC_QUERIES
+    
+    def timed_query(query_info: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        t0 = time.perf_counter_ns()
+        result = client.query(
+            question=query_info['question'],
+            strategy=query_info['strategy'],
+            max_results=5,
+            include_reasoning=True
+        )
+        return result, (time.perf_counter_ns() - t0) / 1e6
+    
+    # Queries are independent, so submit them all and report as they finish
+    with ThreadPoolExecutor(max_workers=min(EXAMPLE_CONCURRENCY, len(queries))) as executor:
+        futures = {
+            executor.submit(timed_query, query_info): i
+            for i, query_info in enumerate(queries, 1)
         }
-    ]
+        
+        for future in as_completed(futures):
+            i = futures[future]
+            query_info = queries[i - 1]
+            print(f"Query {i}: {query_info['description']}")
+            print(f"Question: {query_info['question']}")
+            
+            try:
+                result, latency_ms = future.result()
+                
+                print(f"Strategy Used: {result.get('strategy_used', 'N/A')}")
+                logger.info(
+                    "query=%d latency_ms=%.2f processing_time_s=%.2f",
+                    i, latency_ms, result.get('processing_time') or 0.0
+                )
+                print(f"Confidence Score: {result.get('confidence_score', 0):.2%}")
+                print(f"Sources Found: {len(result.get('sources', []))}")
+                
+                # Previews are only built when debug output is enabled
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response Preview: %s...", result['response'][:200])
+                    if result.get('reasoning_path'):
+                        logger.debug("Reasoning: %s...", result['reasoning_path'][:100])
+                
+            except requests.exceptions.RequestException as e:
+                print(f"Query failed: {e}")
+            
+            print("-" * 50)
+
+
+async def example_basic_queries_async():
+    """Demonstrate basic queries multiplexed over HTTP/2 with httpx."""
+    print("=== Basic Query Examples (HTTP/2) ===")
+    
+    async with AsyncRAGAPIClient() as client:
+        try:
+            health = await client.health_check()
+            print(f"System Status: {health['status']}")
+            print()
+        except httpx.HTTPError as e:
+            print(f"Failed to connect to API: {e}")
+            return
+        
+        results = await asyncio.gather(
+            *(
+                client.query(query_info['question'], strategy=query_info['strategy'], max_results=5)
+                for query_info in BASIC_QUERIES
+            ),
+            return_exceptions=True
+        )
     
-    for i, query_info in enumerate(queries, 1):
+    for i, (query_info, result) in enumerate(zip(BASIC_QUERIES, results), 1):
         print(f"Query {i}: {query_info['description']}")
         print(f"Question: {query_info['question']}")
         
-        try:
-            start_time = time.time()
-            result = client.query(
-                question=query_info['question'],
-                strategy=query_info['strategy'],
-                max_results=5,
-                include_reasoning=True
-            )
-            end_time = time.time()
-            
+        if isinstance(result, Exception):
+            print(f"Query failed: {result}")
+        else:
             print(f"Strategy Used: {result.get('strategy_used', 'N/A')}")
-            print(f"Processing Time: {result.get('processing_time', 0):.2f}s")
             print(f"Confidence Score: {result.get('confidence_score', 0):.2%}")
             print(f"Sources Found: {len(result.get('sources', []))}")
-            print(f"Response Preview: {result['response'][:200]}...")
-            
-            if result.get('reasoning_path'):
-                print(f"Reasoning: {result['reasoning_path'][:100]}...")
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Query failed: {e}")
         
         print("-" * 50)
 
 
+# Example documents shared by the sync and async upload examples (read-only)
+_DOC_TEMPLATES: Tuple[Mapping[str, Any], ...] = tuple(map(MappingProxyType, [
+    {
+        "title": "Introduction to Neural Networks",
+        "content": """
+        Neural networks are computing systems inspired by biological neural networks.
+        They consist of interconnected nodes (neurons) that process information using
+        a connectionist approach to computation. The basic structure includes:
+
+        1. Input Layer: Receives input data
+        2. Hidden Layers: Process information through weighted connections
+        3. Output Layer: Produces final results
+
+        Key concepts include:
+        - Weights and biases that determine connection strength
+        - Activation functions that introduce non-linearity
+        - Backpropagation for training the network
+        - Gradient descent for optimization
+
+        Applications include image recognition, natural language processing,
+        and predictive modeling.
+        """,
+        "source": "https://example.com/neural-networks-intro",
+        "domain": "technical",
+        "metadata": {
+            "author": "AI Research Team",
+            "tags": ["neural networks", "deep learning", "AI"],
+            "difficulty": "intermediate"
+        }
+    },
+    {
+        "title": "Machine Learning Ethics Guidelines",
+        "content": """
+        Ethical considerations in machine learning are crucial for responsible AI development.
+        Key principles include:
+
+        1. Fairness: Ensuring algorithms don't discriminate against protected groups
+        2. Transparency: Making AI decisions explainable and interpretable
+        3. Privacy: Protecting user data and maintaining confidentiality
+        4. Accountability: Establishing clear responsibility for AI decisions
+        5. Beneficence: Ensuring AI systems benefit society
+
+        Common ethical challenges:
+        - Bias in training data leading to discriminatory outcomes
+        - Lack of transparency in complex models (black box problem)
+        - Privacy concerns with data collection and usage
+        - Job displacement due to automation
+        - Potential misuse of AI technologies
+
+        Best practices include diverse teams, bias testing, regular audits,
+        and stakeholder engagement throughout development.
+        """,
+        "source": "https://example.com/ml-ethics",
+        "domain": "research",
+        "metadata": {
+            "author": "Ethics Committee",
+            "tags": ["ethics", "AI", "fairness", "transparency"],
+            "publication_date": "2024-01-15"
+        }
+    }
+]))
+# The templates never change, so serialize them once per process
+_DOC_PAYLOADS: Tuple[bytes, ...] = tuple(dumps_json(dict(doc)) for doc in _DOC_TEMPLATES)
+
+
 def example_document_upload():
     """Demonstrate document upload functionality."""
     print("=== Document Upload Examples ===")
     
     client = RAGAPIClient()
     
-    # Example documents
-    documents = [
-        {
-            "title": "Introduction to Neural Networks",
-            "content": """
-            Neural networks are computing systems inspired by biological neural networks.
-            They consist of interconnected nodes (neurons) that process information using
-            a connectionist approach to computation. The basic structure includes:
-            
-            1. Input Layer: Receives input data
-            2. Hidden Layers: Process information through weighted connections
-            3. Output Layer: Produces final results
-            
-            Key concepts include:
-            - Weights and biases that determine connection strength
-            - Activation functions that introduce non-linearity
-            - Backpropagation for training the network
-            - Gradient descent for optimization
-            
-            Applications include image recognition, natural language processing,
-            and predictive modeling.
-            """,
-            "source": "https://example.com/neural-networks-intro",
-            "domain": "technical",
-            "metadata": {
-                "author": "AI Research Team",
-                "tags": ["neural networks", "deep learning", "AI"],
-                "difficulty": "intermediate"
-            }
-        },
-        {
-            "title": "Machine Learning Ethics Guidelines",
-            "content": """
-            Ethical considerations in machine learning are crucial for responsible AI development.
-            Key principles include:
-            
-            1. Fairness: Ensuring algorithms don't discriminate against protected groups
-            2. Transparency: Making AI decisions explainable and interpretable
-            3. Privacy: Protecting user data and maintaining confidentiality
-            4. Accountability: Establishing clear responsibility for AI decisions
-            5. Beneficence: Ensuring AI systems benefit society
-            
-            Common ethical challenges:
-            - Bias in training data leading to discriminatory outcomes
-            - Lack of transparency in complex models (black box problem)
-            - Privacy concerns with data collection and usage
-            - Job displacement due to automation
-            - Potential misuse of AI technologies
-            
-            Best practices include diverse teams, bias testing, regular audits,
-            and stakeholder engagement throughout development.
-            """,
-            "source": "https://example.com/ml-ethics",
-            "domain": "research",
-            "metadata": {
-                "author": "Ethics Committee",
-                "tags": ["ethics", "AI", "fairness", "transparency"],
-                "publication_date": "2024-01-15"
-            }
-        }
-    ]
+    documents = _DOC_TEMPLATES
     
     uploaded_docs = []
     
-    for i, doc in enumerate(documents, 1):
-        print(f"Uploading Document {i}: {doc['title']}")
-        
-        try:
-            result = client.upload_document(
-                title=doc['title'],
-                content=doc['content'],
-                source=doc['source'],
-                domain=doc['domain'],
-                metadata=doc['metadata']
-            )
+    print(f"Uploading {len(documents)} documents in batches...")
+    
+    try:
+        for i, (doc, result) in enumerate(zip(documents, client.upload_documents_batch(_DOC_PAYLOADS)), 1):
+            if result.get('status') == 'error':
+                print(f"✗ Document {i} failed: {result.get('message')}")
+                print("-" * 50)
+                continue
             
             uploaded_docs.append(result)
             
-            print(f"✓ Upload successful!")
+            print(f"✓ Uploaded Document {i}: {doc['title']}")
             print(f"  Document ID: {result['document_id']}")
             print(f"  Entities Extracted: {result.get('entities_extracted', 'N/A')}")
             print(f"  Relationships Created: {result.get('relationships_created', 'N/A')}")
             print(f"  Processing Time: {result.get('processing_time', 0):.2f}s")
+            print("-" * 50)
             
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Upload failed: {e}")
-        
-        print("-" * 50)
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Batch upload failed: {e}")
     
     return uploaded_docs
 
 
+async def example_document_upload_async(batch_size: int = 100):
+    """Demonstrate concurrent document upload with aiohttp."""
+    print("=== Async Document Upload Examples ===")
+    
+    client = RAGAPIClient()
+    documents = _DOC_TEMPLATES
+    uploaded_docs = []
+    
+    connector = aiohttp.TCPConnector(limit=EXAMPLE_UPLOAD_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            results = await asyncio.gather(
+                *(client.upload_document_async(session, **doc) for doc in batch),
+                return_exceptions=True
+            )
+            
+            for doc, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    print(f"✗ Upload failed: {doc['title']}: {result}")
+                else:
+                    uploaded_docs.append(result)
+                    print(f"✓ Uploaded: {doc['title']} (ID: {result['document_id']})")
+    
+    client.close()
+    print("-" * 50)
+    return uploaded_docs
+
+
+def _long_document_sections(sections: int = 200) -> Iterator[str]:
+    """Generate a long document section by section, so it is never held in memory whole."""
+    for i in range(1, sections + 1):
+        yield (
+            f"Section {i}. Retrieval-augmented generation combines a retriever with a "
+            f"language model. Knowledge graphs add explicit relationships between entities.\n\n"
+        )
+
+
+def example_streamed_upload():
+    """Demonstrate streaming a large document upload from a generator."""
+    print("=== Streamed Upload Example ===")
+    
+    client = RAGAPIClient()
+    
+    try:
+        result = client.upload_document_stream(
+            title="RAG Handbook (streamed)",
+            content_iter=_long_document_sections(),
+            domain="technical",
+            metadata={"category": "handbook", "streamed": True}
+        )
+        print(f"✓ Streamed upload: {result['document_id']}")
+        print(f"  Entities Extracted: {result.get('entities_extracted', 'N/A')}")
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Streamed upload failed: {e}")
+    
+    client.close()
+    print("-" * 50)
+
+
+async def example_file_upload_async():
+    """Demonstrate uploading a file read in chunks with aiofiles."""
+    print("=== Async File Upload Example ===")
+    
+    client = RAGAPIClient()
+    
+    # Write a sample file to upload; a real client would already have one on disk
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        f.writelines(_long_document_sections())
+        file_path = f.name
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            result = await client.upload_file_async(session, file_path, title="RAG Handbook (file)")
+        print(f"✓ Uploaded file: {result['document_id']}")
+    except aiohttp.ClientError as e:
+        print(f"✗ File upload failed: {e}")
+    finally:
+        os.remove(file_path)
+    
+    client.close()
+    print("-" * 50)
+
+
 def example_system_monitoring():
     """Demonstrate system monitoring functionality."""
     print("=== System Monitoring Examples ===")
@@ -351,62 +1261,71 @@ def example_advanced_queries():
     """Demonstrate advanced query scenarios."""
     print("=== Advanced Query Examples ===")
     
-    client = RAGAPIClient()
-    
     # Advanced query scenarios
     scenarios = [
         {
             "name": "Multi-domain Query",
             "question": "How do neural networks apply to healthcare AI and what are the ethical considerations?",
-            "strategy": "hybrid",
+            "strategy": Strategy.HYBRID,
             "max_results": 15
         },
         {
             "name": "Technical Deep Dive",
             "question": "Explain the mathematical foundations of backpropagation in neural networks",
-            "strategy": "vector_only",
+            "strategy": Strategy.VECTOR_ONLY,
             "max_results": 8
         },
         {
             "name": "Relationship Exploration",
             "question": "What are all the connections between machine learning, ethics, and healthcare?",
-            "strategy": "graph_only",
+            "strategy": Strategy.GRAPH_ONLY,
             "max_results": 20
         }
     ]
     
-    for scenario in scenarios:
-        print(f"Scenario: {scenario['name']}")
-        print(f"Question: {scenario['question']}")
-        
-        try:
-            result = client.query(
+    # Embed every scenario question in one batch for the semantic cache tier
+    cache = SmartRAGCache(enable_semantic=SEMANTIC_CACHE_AVAILABLE)
+    cache.precompute_embeddings([scenario['question'] for scenario in scenarios])
+    client = RAGAPIClient(cache=cache)
+    
+    with ThreadPoolExecutor(max_workers=min(EXAMPLE_CONCURRENCY, len(scenarios))) as executor:
+        futures = {
+            executor.submit(
+                client.query,
                 question=scenario['question'],
                 strategy=scenario['strategy'],
                 max_results=scenario['max_results'],
                 include_reasoning=True
-            )
-            
-            print(f"Strategy: {result.get('strategy_used', 'N/A')}")
-            print(f"Entities Found: {len(result.get('entities_found', []))}")
-            print(f"Sources: {len(result.get('sources', []))}")
-            print(f"Citations: {len(result.get('citations', []))}")
+            ): scenario
+            for scenario in scenarios
+        }
+        
+        for future in as_completed(futures):
+            scenario = futures[future]
+            print(f"Scenario: {scenario['name']}")
+            print(f"Question: {scenario['question']}")
             
-            # Show source types
-            if result.get('sources'):
-                source_types = {}
-                for source in result['sources']:
-                    source_type = source.get('source_type', 'unknown')
-                    source_types[source_type] = source_types.get(source_type, 0) + 1
+            try:
+                result = future.result()
                 
-                print(f"Source Types: {dict(source_types)}")
-            
-            print(f"Response Length: {len(result['response'])} characters")
+                print(f"Strategy: {result.get('strategy_used', 'N/A')}")
+                print(f"Entities Found: {len(result.get('entities_found', []))}")
+                print(f"Sources: {len(result.get('sources', []))}")
+                print(f"Citations: {len(result.get('citations', []))}")
+                
+                # Show source types
+                if result.get('sources'):
+                    source_types = Counter(
+                        source.get('source_type', 'unknown') for source in result['sources']
+                    )
+                    print(f"Source Types: {dict(source_types)}")
+                
+                print(f"Response Length: {len(result['response'])} characters")
+                
+            except requests.exceptions.RequestException as e:
+                print(f"Query failed: {e}")
             
-        except requests.exceptions.RequestException as e:
-            print(f"Query failed: {e}")
-        
-        print("-" * 50)
+            print("-" * 50)
 
 
 def example_error_handling():
@@ -449,6 +1368,8 @@ def example_error_handling():
                 print(f"    Message: {error_detail.get('message', 'No message')}")
             except:
                 print(f"    Raw error: {e.response.text}")
+        except ValueError as e:
+            print(f"  ✓ Rejected before sending: {e}")
         except Exception as e:
             print(f"  Unexpected error type: {type(e).__name__}: {e}")
         
@@ -462,10 +1383,21 @@ def main():
     
     try:
         # Run example scenarios
-        example_basic_queries()
+        if HTTPX_AVAILABLE:
+            asyncio.run(example_basic_queries_async())
+        else:
+            example_basic_queries()
+        print("\n")
+        
+        if ASYNC_UPLOAD_AVAILABLE:
+            asyncio.run(example_document_upload_async())
+        else:
+            example_document_upload()
         print("\n")
         
-        example_document_upload()
+        example_streamed_upload()
+        if ASYNC_UPLOAD_AVAILABLE:
+            asyncio.run(example_file_upload_async())
         print("\n")
         
         example_system_monitoring()
@@ -486,4 +1418,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
     main()
\ No newline at end of file
@@ -7,22 +7,30 @@ import sys
 import asyncio
 from datetime import datetime
 
+# uvloop is optional and only used to run the example's event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from core.database import (
-    Neo4jConnectionManager, ChromaConnectionManager,
-    initialize_databases, close_databases,
-    get_neo4j_manager, get_chroma_manager
-)
-from core.mapping_service import get_mapping_service
-from core.config import get_config
-
 
 async def main():
     """Demonstrate database connections and mapping service usage."""
     print("=== Database Connection and Mapping Service Example ===\n")
     
+    # Database drivers are heavy; import them only when the example runs
+    try:
+        from core.config import get_config
+        from core.database import Neo4jConnectionManager, ChromaConnectionManager
+    except ImportError as e:
+        print(f"Missing dependency: {e}")
+        print("Install the project requirements with: pip install -r requirements.txt")
+        return
+    
     try:
         # Load configuration
         config = get_config()
@@ -54,9 +62,15 @@ async def main():
             neo4j_manager.connect()
             print("   ✓ Neo4j connection successful")
             
-            # Test a simple query
-            result = neo4j_manager.execute_query("RETURN 'Hello Neo4j' as message")
-            print(f"   ✓ Neo4j query result: {result[0]['message']}")
+            # Run several diagnostic queries in one session and transaction
+            greeting, nodes, labels = neo4j_manager.execute_queries([
+                ("RETURN 'Hello Neo4j' as message", None),
+                ("MATCH (n) RETURN count(n) as node_count", None),
+                ("CALL db.labels() YIELD label RETURN collect(label) as labels", None)
+            ])
+            print(f"   ✓ Neo4j query result: {greeting[0]['message']}")
+            print(f"   ✓ Node count: {nodes[0]['node_count']}")
+            print(f"   ✓ Labels: {', '.join(labels[0]['labels']) or 'none'}")
             
         except Exception as e:
             print(f"   ✗ Neo4j connection failed: {e}")
@@ -65,9 +79,21 @@ async def main():
             chroma_manager.connect()
             print("   ✓ Chroma connection successful")
             
-            # Test collection creation
-            collection = chroma_manager.create_collection("test_collection")
-            print("   ✓ Chroma test collection created")
+            # Reuse the test collection across runs
+            collection = chroma_manager.get_or_create_collection("test_collection")
+            print("   ✓ Chroma test collection ready")
+            
+            # Write records in batches instead of one call per record; upsert
+            # so rerunning the example overwrites the fixed IDs
+            added = chroma_manager.batch_add(
+                "test_collection",
+                ids=[f"example_{i}" for i in range(10)],
+                documents=[f"Example document {i}" for i in range(10)],
+                metadatas=[{"index": i} for i in range(10)],
+                batch_size=5,
+                upsert=True
+            )
+            print(f"   ✓ Upserted {added} documents in batches")
             
         except Exception as e:
             print(f"   ✗ Chroma connection failed: {e}")
@@ -76,6 +102,7 @@ async def main():
         print("\n3. Testing Entity-Vector Mapping Service...")
         
         try:
+            from core.mapping_service import get_mapping_service
             mapping_service = get_mapping_service()
             print("   ✓ Mapping service instance created")
             
@@ -85,6 +112,7 @@ async def main():
             # Show what operations are available
             print("   Available operations:")
             print("     - create_mapping(entity_id, entity_type, vector_id, collection_name)")
+            print("     - create_mappings_bulk(mappings)")
             print("     - get_vectors_for_entity(entity_id)")
             print("     - get_entities_for_vector(vector_id, collection_name)")
             print("     - validate_mapping_integrity()")
@@ -127,10 +155,13 @@ async def main():
         print("\n6. Async operation example...")
         
         try:
-            # This would work if Neo4j is connected
-            # result = await neo4j_manager.execute_query_async("RETURN datetime() as current_time")
-            # print(f"   ✓ Async query result: {result}")
-            print("   ℹ Async operations available for Neo4j queries")
+            # Independent queries run concurrently on the async driver
+            current_time, node_count = await asyncio.gather(
+                neo4j_manager.execute_query_async("RETURN toString(datetime()) as current_time"),
+                neo4j_manager.execute_query_async("MATCH (n) RETURN count(n) as node_count")
+            )
+            print(f"   ✓ Async query result: {current_time[0]['current_time']}")
+            print(f"   ✓ Async node count: {node_count[0]['node_count']}")
         except Exception as e:
             print(f"   ✗ Async operation failed: {e}")
         
@@ -142,7 +173,7 @@ async def main():
     finally:
         # Clean up connections
         try:
-            neo4j_manager.disconnect()
+            await neo4j_manager.disconnect_async()
             chroma_manager.disconnect()
             print("\n✓ Connections closed")
         except:
@@ -169,6 +200,14 @@ def demonstrate_mapping_workflow():
            metadata={"source": "research_paper.pdf"}
        )
     
+       For many entities, create all mappings with one graph write:
+       links = mapping_service.create_mappings_bulk([
+           {"entity_id": "doc_123", "entity_type": "Document",
+            "vector_id": "vec_456", "collection_name": "documents"},
+           {"entity_id": "doc_124", "entity_type": "Document",
+            "vector_id": "vec_457", "collection_name": "documents"},
+       ])
+    
     3. Query mappings during retrieval:
        vectors = mapping_service.get_vectors_for_entity("doc_123")
        entities = mapping_service.get_entities_for_vector("vec_456", "documents")
@@ -185,8 +224,12 @@ def demonstrate_mapping_workflow():
 
 
 if __name__ == "__main__":
-    # Run the main example
-    asyncio.run(main())
+    # Run the main example, on uvloop when it is installed
+    if UVLOOP_AVAILABLE:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
     
     # Show the mapping workflow
     demonstrate_mapping_workflow()
\ No newline at end of file
@@ -11,35 +11,15 @@ This example shows how to:
 
 import sys
 import os
+from typing import Any, Dict, Iterable, List, Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.domain_processor import (
-    DomainType,
-    get_domain_manager,
-    TechnicalDocumentationExtractor,
-    ResearchPapersExtractor
-)
-from src.core.document_processor import DocumentProcessor
-from src.core.domain_config import (
-    get_domain_config_manager,
-    configure_system_domain
-)
-
+# The src.core modules are imported inside the demonstrations that need them, so
+# running a single demonstration does not load the NLP stack up front.
+_cache: Dict[str, Any] = {}
 
-def demonstrate_technical_documentation_processing():
-    """Demonstrate processing of technical documentation."""
-    print("=" * 60)
-    print("TECHNICAL DOCUMENTATION PROCESSING")
-    print("=" * 60)
-    
-    # Configure for technical documentation
-    configure_system_domain(DomainType.TECHNICAL_DOCUMENTATION)
-    
-    # Create document processor with domain
-    processor = DocumentProcessor(domain_type="technical_documentation")
-    
-    # Sample technical documentation text
-    tech_text = """
+# Sample technical documentation text
+TECH_TEXT = """
     This web application is built with React and TypeScript for the frontend.
     The backend API is implemented using Node.js and Express.js framework.
     Data is stored in a PostgreSQL database with Redis for caching.
@@ -53,117 +33,194 @@ def demonstrate_technical_documentation_processing():
     The UserService implements IUserService interface and depends on DatabaseService.
     Configuration is managed through config.json and docker-compose.yml files.
     """
+
+# Sample research paper text
+RESEARCH_TEXT = """
+    In this paper, we propose a novel transformer-based architecture for natural language processing.
+    Our model, called AdvancedBERT, is trained on the Common Crawl dataset and fine-tuned on GLUE benchmark.
+    
+    We compare our approach with existing methods including BERT, GPT, and LSTM networks.
+    The experimental results show that AdvancedBERT achieves 94.2% accuracy on sentiment classification,
+    outperforming BERT by 3.1% and GPT by 2.8%.
+    
+    The model uses attention mechanisms and is evaluated using standard metrics including F1-score,
+    precision, and recall. Training was performed using supervised learning on labeled datasets.
+    """
+
+# Mixed content that could benefit from different domain processing
+MIXED_TEXT = "The React application uses machine learning algorithms implemented in Python."
+
+# (text, domain) pairs whose entities main() extracts in one batch
+DEMO_BATCH = (
+    (TECH_TEXT, "technical_documentation"),
+    (RESEARCH_TEXT, "research_papers"),
+    (MIXED_TEXT, "technical_documentation"),
+    (MIXED_TEXT, "research_papers"),
+)
+
+# Section banners, formatted once
+_BAR60 = "=" * 60
+_RULE40 = "\n" + "-" * 40  # preceded by a blank line
+_TECH_HEADER = f"{_BAR60}\nTECHNICAL DOCUMENTATION PROCESSING\n{_BAR60}"
+_RESEARCH_HEADER = f"{_BAR60}\nRESEARCH PAPERS PROCESSING\n{_BAR60}"
+_SWITCHING_HEADER = f"{_BAR60}\nDOMAIN SWITCHING DEMONSTRATION\n{_BAR60}"
+_CUSTOM_DOMAIN_HEADER = f"{_BAR60}\nCUSTOM DOMAIN CREATION\n{_BAR60}"
+_CONFIG_HEADER = f"{_BAR60}\nCONFIGURATION MANAGEMENT\n{_BAR60}"
+_COMPLETED_HEADER = f"{_BAR60}\nDEMONSTRATION COMPLETED SUCCESSFULLY\n{_BAR60}"
+
+
+def write_lines(lines: Iterable[str]):
+    """Write lines to stdout in one call instead of one print() per line."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+def entity_lines(entities) -> Iterable[str]:
+    """Format extracted entities as bullet lines."""
+    return (
+        f"  • {entity.text} ({entity.label}) - {entity.properties.get('extraction_method', 'general')}"
+        for entity in entities
+    )
+
+
+def relationship_lines(relationships) -> Iterable[str]:
+    """Format identified relationships as bullet lines."""
+    return (
+        f"  • {rel.source_entity} --[{rel.relationship_type}]--> {rel.target_entity}"
+        for rel in relationships
+    )
+
+
+def get_processor():
+    """Return the DocumentProcessor shared by all demonstrations, creating it on first use."""
+    if "processor" not in _cache:
+        from src.core.document_processor import DocumentProcessor, default_ner_backend
+        
+        # DeepSparse on CPU-only machines, accelerated spaCy on CUDA, when installed
+        _cache["processor"] = DocumentProcessor(backend=default_ner_backend())
+    return _cache["processor"]
+
+
+def demonstrate_technical_documentation_processing(entities: Optional[List[Any]] = None):
+    """
+    Demonstrate processing of technical documentation.
+    
+    Args:
+        entities: Entities already extracted from TECH_TEXT, e.g. by a batch call
+    """
+    from src.core.domain_processor import DomainType
+    from src.core.domain_config import configure_system_domain
+    
+    print(_TECH_HEADER)
+    
+    # Configure for technical documentation
+    configure_system_domain(DomainType.TECHNICAL_DOCUMENTATION)
+    
+    # Point the shared document processor at the domain
+    processor = get_processor()
+    processor.set_domain("technical_documentation")
     
     print("Sample Text:")
-    print(tech_text.strip())
-    print("\n" + "-" * 40)
+    print(TECH_TEXT.strip())
+    print(_RULE40)
     
     # Extract entities
-    entities = processor.extract_entities(tech_text, use_domain_specific=True)
+    if entities is None:
+        entities = processor.extract_entities(TECH_TEXT, use_domain_specific=True)
     
     print(f"\nExtracted Entities ({len(entities)}):")
-    for entity in entities:
-        extraction_method = entity.properties.get("extraction_method", "general")
-        print(f"  • {entity.text} ({entity.label}) - {extraction_method}")
+    write_lines(entity_lines(entities))
     
     # Extract relationships
-    relationships = processor.identify_relationships(tech_text, entities, use_domain_specific=True)
+    relationships = processor.identify_relationships(TECH_TEXT, entities, use_domain_specific=True)
     
     print(f"\nIdentified Relationships ({len(relationships)}):")
-    for rel in relationships:
-        print(f"  • {rel.source_entity} --[{rel.relationship_type}]--> {rel.target_entity}")
+    write_lines(relationship_lines(relationships))
     
     print("\n")
 
 
-def demonstrate_research_papers_processing():
-    """Demonstrate processing of research papers."""
-    print("=" * 60)
-    print("RESEARCH PAPERS PROCESSING")
-    print("=" * 60)
-    
-    # Configure for research papers
-    configure_system_domain(DomainType.RESEARCH_PAPERS)
+def demonstrate_research_papers_processing(entities: Optional[List[Any]] = None):
+    """
+    Demonstrate processing of research papers.
     
-    # Create document processor with domain
-    processor = DocumentProcessor(domain_type="research_papers")
+    Args:
+        entities: Entities already extracted from RESEARCH_TEXT, e.g. by a batch call
+    """
+    from src.core.domain_processor import DomainType
+    from src.core.domain_config import configure_system_domain
     
-    # Sample research paper text
-    research_text = """
-    In this paper, we propose a novel transformer-based architecture for natural language processing.
-    Our model, called AdvancedBERT, is trained on the Common Crawl dataset and fine-tuned on GLUE benchmark.
+    print(_RESEARCH_HEADER)
     
-    We compare our approach with existing methods including BERT, GPT, and LSTM networks.
-    The experimental results show that AdvancedBERT achieves 94.2% accuracy on sentiment classification,
-    outperforming BERT by 3.1% and GPT by 2.8%.
+    # Configure for research papers
+    configure_system_domain(DomainType.RESEARCH_PAPERS)
     
-    The model uses attention mechanisms and is evaluated using standard metrics including F1-score,
-    precision, and recall. Training was performed using supervised learning on labeled datasets.
-    """
+    # Point the shared document processor at the domain
+    processor = get_processor()
+    processor.set_domain("research_papers")
     
     print("Sample Text:")
-    print(research_text.strip())
-    print("\n" + "-" * 40)
+    print(RESEARCH_TEXT.strip())
+    print(_RULE40)
     
     # Extract entities
-    entities = processor.extract_entities(research_text, use_domain_specific=True)
+    if entities is None:
+        entities = processor.extract_entities(RESEARCH_TEXT, use_domain_specific=True)
     
     print(f"\nExtracted Entities ({len(entities)}):")
-    for entity in entities:
-        extraction_method = entity.properties.get("extraction_method", "general")
-        print(f"  • {entity.text} ({entity.label}) - {extraction_method}")
+    write_lines(entity_lines(entities))
     
     # Extract relationships
-    relationships = processor.identify_relationships(research_text, entities, use_domain_specific=True)
+    relationships = processor.identify_relationships(RESEARCH_TEXT, entities, use_domain_specific=True)
     
     print(f"\nIdentified Relationships ({len(relationships)}):")
-    for rel in relationships:
-        print(f"  • {rel.source_entity} --[{rel.relationship_type}]--> {rel.target_entity}")
+    write_lines(relationship_lines(relationships))
     
     print("\n")
 
 
-def demonstrate_domain_switching():
-    """Demonstrate switching between domains."""
-    print("=" * 60)
-    print("DOMAIN SWITCHING DEMONSTRATION")
-    print("=" * 60)
+def demonstrate_domain_switching(tech_entities: Optional[List[Any]] = None,
+                                 research_entities: Optional[List[Any]] = None):
+    """
+    Demonstrate switching between domains.
     
-    processor = DocumentProcessor()
+    Args:
+        tech_entities: Entities already extracted from MIXED_TEXT in the technical domain
+        research_entities: Entities already extracted from MIXED_TEXT in the research domain
+    """
+    print(_SWITCHING_HEADER)
     
-    # Mixed content that could benefit from different domain processing
-    mixed_text = "The React application uses machine learning algorithms implemented in Python."
+    processor = get_processor()
     
     print("Sample Text:")
-    print(mixed_text)
-    print("\n" + "-" * 40)
+    print(MIXED_TEXT)
+    print(_RULE40)
     
     # Process with technical documentation domain
     print("\n1. Processing with TECHNICAL_DOCUMENTATION domain:")
     processor.set_domain("technical_documentation")
-    tech_entities = processor.extract_entities(mixed_text, use_domain_specific=True)
+    if tech_entities is None:
+        tech_entities = processor.extract_entities(MIXED_TEXT, use_domain_specific=True)
     
-    for entity in tech_entities:
-        extraction_method = entity.properties.get("extraction_method", "general")
-        print(f"  • {entity.text} ({entity.label}) - {extraction_method}")
+    write_lines(entity_lines(tech_entities))
     
     # Process with research papers domain
     print("\n2. Processing with RESEARCH_PAPERS domain:")
     processor.set_domain("research_papers")
-    research_entities = processor.extract_entities(mixed_text, use_domain_specific=True)
+    if research_entities is None:
+        research_entities = processor.extract_entities(MIXED_TEXT, use_domain_specific=True)
     
-    for entity in research_entities:
-        extraction_method = entity.properties.get("extraction_method", "general")
-        print(f"  • {entity.text} ({entity.label}) - {extraction_method}")
+    write_lines(entity_lines(research_entities))
     
     print("\n")
 
 
 def demonstrate_custom_domain_creation():
     """Demonstrate creating a custom domain configuration."""
-    print("=" * 60)
-    print("CUSTOM DOMAIN CREATION")
-    print("=" * 60)
+    from src.core.domain_config import get_domain_config_manager
+    
+    print(_CUSTOM_DOMAIN_HEADER)
     
     config_manager = get_domain_config_manager()
     
@@ -196,14 +253,14 @@ def demonstrate_custom_domain_creation():
     relationship_patterns = [
         {
             "name": "legal_action",
-            "pattern": r"(\w+)\s+(?:sues|files against|brings action against)\s+(\w+)",
+            "pattern": r"(\w++)\s++(?:sues|files against|brings action against)\s++(\w++)",
             "relationship_type": "LEGAL_ACTION",
             "confidence": 0.9,
             "description": "Legal action relationship"
         },
         {
             "name": "legal_precedent",
-            "pattern": r"(\w+)\s+(?:cites|references|relies on)\s+(\w+)",
+            "pattern": r"(\w++)\s++(?:cites|references|relies on)\s++(\w++)",
             "relationship_type": "CITES",
             "confidence": 0.8,
             "description": "Legal precedent citation"
@@ -233,17 +290,16 @@ def demonstrate_custom_domain_creation():
 
 def demonstrate_configuration_management():
     """Demonstrate domain configuration management."""
-    print("=" * 60)
-    print("CONFIGURATION MANAGEMENT")
-    print("=" * 60)
+    from src.core.domain_config import get_domain_config_manager
+    
+    print(_CONFIG_HEADER)
     
     config_manager = get_domain_config_manager()
     
     # List available domains
     domains = config_manager.list_configured_domains()
     print("Available Domains:")
-    for domain in domains:
-        print(f"  • {domain.value}")
+    write_lines(f"  • {domain.value}" for domain in domains)
     
     # Get current active domain
     active_domain = config_manager.get_active_domain()
@@ -266,16 +322,26 @@ def main():
     print("DOMAIN-SPECIFIC PROCESSING DEMONSTRATION")
     print("This example shows the capabilities of the domain-specific processing system.\n")
     
+    from src.core.domain_processor import get_domain_manager
+    
+    # Reuse extraction results across runs of this script when diskcache is installed
+    get_domain_manager().enable_disk_cache(".nlp_cache")
+    
     try:
-        demonstrate_technical_documentation_processing()
-        demonstrate_research_papers_processing()
-        demonstrate_domain_switching()
+        # Run the NER model over every sample text in one batch, then hand the
+        # results to the demonstrations that print them
+        texts, domains = zip(*DEMO_BATCH)
+        tech, research, mixed_tech, mixed_research = get_processor().extract_entities_batch(
+            list(texts), domain_types=list(domains)
+        )
+        
+        demonstrate_technical_documentation_processing(tech)
+        demonstrate_research_papers_processing(research)
+        demonstrate_domain_switching(mixed_tech, mixed_research)
         demonstrate_custom_domain_creation()
         demonstrate_configuration_management()
         
-        print("=" * 60)
-        print("DEMONSTRATION COMPLETED SUCCESSFULLY")
-        print("=" * 60)
+        print(_COMPLETED_HEADER)
         print("\nKey Features Demonstrated:")
         print("✓ Domain-specific entity extraction")
         print("✓ Domain-specific relationship identification")
@@ -8,24 +8,92 @@ This example demonstrates how to use the Graph Navigator Agent to:
 """
 
 import asyncio
+import io
 import logging
-from typing import List
+import sys
+from contextlib import aclosing, redirect_stdout
+from contextvars import ContextVar
+from textwrap import shorten
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from src.agents.graph_navigator import GraphNavigatorAgent
-from src.core.interfaces import Entity, MessageType, AgentMessage
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# The agent stack (Neo4j driver, pydantic models) and NumPy are imported where they
+# are first needed, so importing this module for a single example stays cheap.
+if TYPE_CHECKING:
+    from src.agents.graph_navigator import GraphNavigatorAgent
+    from src.core.interfaces import Entity
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_BAR50 = "=" * 50
+_CLOSING_BAR50 = "\n" + _BAR50
+
+# Technology entities and their neighbours. Values are passed as parameters so the
+# query text stays constant and Neo4j can reuse its cached plan across calls.
+_TECH_ENTITIES_CYPHER = """
+MATCH (tech:Entity)
+WHERE tech.entity_type = $etype
+OPTIONAL MATCH (tech)-[r]-(related)
+RETURN tech, type(r) as relationship_type, related
+ORDER BY tech.name
+LIMIT $limit
+"""
+
+
+# Output buffer of the example running in the current task, if any
+_example_output: ContextVar[Optional[io.StringIO]] = ContextVar("_example_output", default=None)
+
+
+class _TaskLocalStdout:
+    """Stdout proxy that writes to the current task's buffer when it has one."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        return (_example_output.get() or self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def run_buffered(example):
+    """Await an example with its output buffered, then print the output in one block."""
+    buffer = io.StringIO()
+    token = _example_output.set(buffer)
+    try:
+        return await example
+    finally:
+        _example_output.reset(token)
+        sys.stdout.write(buffer.getvalue())
+
+
+def write_lines(lines: Iterable[str]):
+    """Write lines to stdout in one call instead of one print() per line."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+def entity_lines(entities: Iterable["Entity"], with_description: bool = False) -> Iterable[str]:
+    """Format entities as a numbered list, optionally with their descriptions."""
+    for i, entity in enumerate(entities, 1):
+        yield f"  {i}. {entity.name} ({entity.type})"
+        if with_description and entity.description:
+            yield f"     Description: {shorten(entity.description, width=100, placeholder='...')}"
+
 
-async def example_entity_search():
+async def example_entity_search(agent: "GraphNavigatorAgent"):
     """Example of finding entities in the graph."""
     print("\n=== Entity Search Example ===")
     
-    # Initialize the Graph Navigator Agent
-    agent = GraphNavigatorAgent("example-graph-navigator")
-    
     # Search for entities related to "Python"
     query = "What is Python and how does it relate to web development?"
     print(f"Searching for entities in query: {query}")
@@ -34,10 +102,7 @@ async def example_entity_search():
         entities = await agent.find_entities(query)
         
         print(f"Found {len(entities)} entities:")
-        for i, entity in enumerate(entities, 1):
-            print(f"  {i}. {entity.name} ({entity.type})")
-            if entity.description:
-                print(f"     Description: {entity.description[:100]}...")
+        write_lines(entity_lines(entities, with_description=True))
         
         return entities
         
@@ -46,24 +111,22 @@ async def example_entity_search():
         return []
 
 
-async def example_relationship_traversal(entities: List[Entity]):
+async def example_relationship_traversal(agent: "GraphNavigatorAgent", entities: List["Entity"]):
     """Example of traversing relationships from entities."""
+    import numpy as np
+    
     print("\n=== Relationship Traversal Example ===")
     
     if not entities:
         print("No entities to traverse from")
         return
     
-    agent = GraphNavigatorAgent("example-graph-navigator")
-    
-    # Take the first few entities for traversal
-    start_entities = entities[:2]
-    print(f"Traversing relationships from {len(start_entities)} entities:")
-    for entity in start_entities:
-        print(f"  - {entity.name}")
+    # The traverser queries each start entity concurrently, so use all of them
+    print(f"Traversing relationships from {len(entities)} entities:")
+    write_lines(f"  - {entity.name}" for entity in entities)
     
     try:
-        result = await agent.traverse_relationships(start_entities, depth=2)
+        result = await agent.traverse_relationships(entities, depth=2)
         
         print(f"\nTraversal Results:")
         print(f"  - Found {len(result.entities)} connected entities")
@@ -73,19 +136,27 @@ async def example_relationship_traversal(entities: List[Entity]):
         # Show some of the connected entities
         if result.entities:
             print(f"\nConnected entities (showing first 5):")
-            for i, entity in enumerate(result.entities[:5], 1):
-                print(f"  {i}. {entity.name} ({entity.type})")
+            write_lines(entity_lines(result.entities[:5]))
         
         # Show some relationship types
         if result.relationships:
-            rel_types = set(rel.get('type', 'Unknown') for rel in result.relationships)
-            print(f"\nRelationship types found: {', '.join(rel_types)}")
+            rel_types, counts = np.unique(result.relationship_columns()['type'], return_counts=True)
+            order = np.argsort(-counts, kind='stable')
+            summary = ', '.join(f"{rel_types[i] or 'Unknown'} ({counts[i]})" for i in order)
+            print(f"\nRelationship types found: {summary}")
         
         # Show some paths
         if result.paths:
+            path_lengths = np.fromiter((len(path) for path in result.paths), dtype=np.int64, count=len(result.paths))
+            lengths, counts = np.unique(path_lengths, return_counts=True)
+            summary = ', '.join(f"{length}: {count}" for length, count in zip(lengths.tolist(), counts.tolist()))
+            print(f"\nPath lengths (length: count): {summary}")
+            
             print(f"\nExample paths (showing first 3):")
-            for i, path in enumerate(result.paths[:3], 1):
-                print(f"  {i}. Path length {len(path)}: {' -> '.join(path[:3])}{'...' if len(path) > 3 else ''}")
+            write_lines(
+                f"  {i}. Path length {len(path)}: {' -> '.join(path[:3])}{'...' if len(path) > 3 else ''}"
+                for i, path in enumerate(result.paths[:3], 1)
+            )
         
         return result
         
@@ -94,49 +165,45 @@ async def example_relationship_traversal(entities: List[Entity]):
         return None
 
 
-async def example_cypher_query():
+async def example_cypher_query(agent: "GraphNavigatorAgent"):
     """Example of executing a custom Cypher query."""
     print("\n=== Custom Cypher Query Example ===")
     
-    agent = GraphNavigatorAgent("example-graph-navigator")
-    
     # Example query to find technology entities and their relationships
-    cypher_query = """
-    MATCH (tech:Entity)
-    WHERE tech.entity_type = 'Technology'
-    OPTIONAL MATCH (tech)-[r]-(related)
-    RETURN tech, type(r) as relationship_type, related
-    ORDER BY tech.name
-    LIMIT 10
-    """
+    parameters = {"etype": "Technology", "limit": 10}
     
     print("Executing Cypher query:")
-    print(cypher_query)
+    print(_TECH_ENTITIES_CYPHER)
+    print(f"Parameters: {parameters}")
     
     try:
-        result = await agent.execute_cypher_query(cypher_query)
+        # Stream the records and stop after the preview; the rest is never fetched
+        preview = []
+        async with aclosing(agent.stream_cypher_query(_TECH_ENTITIES_CYPHER, parameters)) as stream:
+            async for entity in stream:
+                preview.append(entity)
+                if len(preview) >= 5:
+                    break
         
         print(f"\nQuery Results:")
-        print(f"  - Found {len(result.entities)} entities")
-        print(f"  - Query: {result.cypher_query[:50]}...")
+        print(f"  - Previewing {len(preview)} entities")
         
-        if result.entities:
+        if preview:
             print(f"\nEntities found:")
-            for i, entity in enumerate(result.entities[:5], 1):
-                print(f"  {i}. {entity.name} ({entity.type})")
+            write_lines(entity_lines(preview))
         
-        return result
+        return preview
         
     except Exception as e:
         print(f"Error executing Cypher query: {e}")
         return None
 
 
-async def example_message_processing():
+async def example_message_processing(agent: "GraphNavigatorAgent"):
     """Example of processing messages through the agent."""
-    print("\n=== Message Processing Example ===")
+    from src.core.interfaces import MessageType, AgentMessage
     
-    agent = GraphNavigatorAgent("example-graph-navigator")
+    print("\n=== Message Processing Example ===")
     
     # Create a graph search message
     message = AgentMessage(
@@ -183,26 +250,37 @@ async def example_message_processing():
         return None
 
 
+async def example_search_and_traversal(agent: "GraphNavigatorAgent"):
+    """Run the entity search, then traverse from whatever it found."""
+    entities = await example_entity_search(agent)
+    
+    if entities:
+        await example_relationship_traversal(agent, entities)
+    
+    return entities
+
+
 async def main():
     """Main example function."""
+    from src.agents.graph_navigator import GraphNavigatorAgent
+    
     print("Graph Navigator Agent Examples")
-    print("=" * 50)
+    print(_BAR50)
     
     try:
-        # Example 1: Entity Search
-        entities = await example_entity_search()
-        
-        # Example 2: Relationship Traversal
-        if entities:
-            await example_relationship_traversal(entities)
-        
-        # Example 3: Custom Cypher Query
-        await example_cypher_query()
-        
-        # Example 4: Message Processing
-        await example_message_processing()
+        # One agent (and so one connection pool) is shared by all examples
+        async with GraphNavigatorAgent("example-graph-navigator") as agent:
+            # Only the traversal depends on the entity search, so the search/traversal
+            # chain, the custom Cypher query and the message processing run concurrently.
+            # Each example's output is buffered and printed in one block once it completes.
+            with redirect_stdout(_TaskLocalStdout(sys.stdout)):
+                await asyncio.gather(
+                    run_buffered(example_search_and_traversal(agent)),
+                    run_buffered(example_cypher_query(agent)),
+                    run_buffered(example_message_processing(agent))
+                )
         
-        print("\n" + "=" * 50)
+        print(_CLOSING_BAR50)
         print("Examples completed successfully!")
         
     except Exception as e:
@@ -211,5 +289,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the examples
-    asyncio.run(main())
\ No newline at end of file
+    # Run the examples, on uvloop when installed since every example is bound by
+    # Neo4j round-trips
+    if UVLOOP_AVAILABLE:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -9,19 +9,69 @@ This script demonstrates how to use the Vector Retrieval Agent for:
 """
 
 import asyncio
-import tempfile
-import shutil
+import logging
+import logging.handlers
+import sys
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from src.agents.vector_retrieval import VectorRetrievalAgent, EmbeddingGenerationService
-from src.core.vector_models import DocumentEmbedding
+from src.core.vector_models import DocumentEmbedding, VectorStoreType
 from src.core.interfaces import AgentMessage, MessageType
 
+# Log records of the demo running in the current task, while demos run concurrently
+_demo_records: ContextVar[Optional[List[logging.LogRecord]]] = ContextVar("_demo_records", default=None)
+
+
+class _PerTaskMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that sets aside the records of a task started by run_demo."""
+    
+    def emit(self, record: logging.LogRecord):
+        records = _demo_records.get()
+        if records is None:
+            super().emit(record)
+        else:
+            records.append(record)
+
+
+# Demo output goes through a buffered handler, written out once per demo rather
+# than with a blocking write per line
+log_handler = _PerTaskMemoryHandler(
+    capacity=256, target=logging.StreamHandler(sys.stdout)
+)
+logger = logging.getLogger(__name__)
+logger.addHandler(log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Contents of the sample documents. The embedding service demo embeds these, and the
+# vector agent demo reuses those embeddings instead of encoding the texts again.
+SAMPLE_CONTENTS = [
+    "Machine learning is a subset of artificial intelligence that focuses on algorithms that can learn from data.",
+    "Natural language processing enables computers to understand, interpret, and generate human language.",
+    "Computer vision allows machines to interpret and understand visual information from the world.",
+    "Deep learning uses neural networks with multiple layers to model complex patterns in data.",
+    "Data science combines statistics, programming, and domain expertise to extract insights from data."
+]
+
+
+async def run_demo(demo):
+    """Await a demo with its log records held back, then write them out in one block."""
+    records: List[logging.LogRecord] = []
+    token = _demo_records.set(records)
+    try:
+        return await demo
+    finally:
+        _demo_records.reset(token)
+        for record in records:
+            log_handler.handle(record)
+        log_handler.flush()
+
 
 async def demonstrate_embedding_service():
     """Demonstrate the embedding generation service."""
-    print("=== Embedding Generation Service Demo ===")
+    logger.info("=== Embedding Generation Service Demo ===")
     
     # Initialize embedding service
     embedding_service = EmbeddingGenerationService(
@@ -31,34 +81,32 @@ async def demonstrate_embedding_service():
     
     # Generate single embedding
     text = "This is a sample text for embedding generation."
-    print(f"Generating embedding for: '{text}'")
+    logger.info(f"Generating embedding for: '{text}'")
     
     embedding = await embedding_service.generate_embedding(text)
-    print(f"Generated embedding with dimension: {embedding.dimension}")
-    print(f"Model used: {embedding.model_name}")
-    print(f"First 5 values: {embedding.to_list()[:5]}")
-    
-    # Generate batch embeddings
-    texts = [
-        "First document about machine learning and artificial intelligence.",
-        "Second document discussing natural language processing techniques.",
-        "Third document covering computer vision and image recognition.",
-        "Fourth document about deep learning and neural networks.",
-        "Fifth document on data science and statistical analysis."
-    ]
+    logger.info(f"Generated embedding with dimension: {embedding.dimension}")
+    logger.info(f"Model used: {embedding.model_name}")
+    logger.info(f"First 5 values: {embedding.to_list()[:5]}")
     
-    print(f"\nGenerating batch embeddings for {len(texts)} texts...")
+    # Generate batch embeddings for the sample documents
+    texts = SAMPLE_CONTENTS
+    
+    logger.info(f"\nGenerating batch embeddings for {len(texts)} texts...")
     batch_embeddings = await embedding_service.generate_embeddings_batch(texts)
-    print(f"Generated {len(batch_embeddings)} embeddings in batch")
+    logger.info(f"Generated {len(batch_embeddings)} embeddings in batch")
     
     # Test caching
-    print("\nTesting embedding cache...")
+    logger.info("\nTesting embedding cache...")
     cached_embedding = await embedding_service.generate_embedding(text)
-    print(f"Cache hit - same embedding retrieved: {embedding.created_at == cached_embedding.created_at}")
+    logger.info(f"Cache hit - same embedding retrieved: {embedding.created_at == cached_embedding.created_at}")
     
     # Show cache statistics
     cache_stats = embedding_service.get_cache_stats()
-    print(f"Cache statistics: {cache_stats}")
+    logger.info(f"Cache statistics: {cache_stats}")
+    log_handler.flush()
+    
+    # Stop the micro-batching worker
+    await embedding_service.close()
     
     return batch_embeddings
 
@@ -67,13 +115,7 @@ async def create_sample_documents(embeddings: List) -> List[DocumentEmbedding]:
     """Create sample documents with embeddings."""
     documents = []
     
-    contents = [
-        "Machine learning is a subset of artificial intelligence that focuses on algorithms that can learn from data.",
-        "Natural language processing enables computers to understand, interpret, and generate human language.",
-        "Computer vision allows machines to interpret and understand visual information from the world.",
-        "Deep learning uses neural networks with multiple layers to model complex patterns in data.",
-        "Data science combines statistics, programming, and domain expertise to extract insights from data."
-    ]
+    contents = SAMPLE_CONTENTS
     
     titles = [
         "Introduction to Machine Learning",
@@ -105,275 +147,262 @@ async def create_sample_documents(embeddings: List) -> List[DocumentEmbedding]:
     return documents
 
 
-async def demonstrate_vector_agent():
-    """Demonstrate the Vector Retrieval Agent functionality."""
-    print("\n=== Vector Retrieval Agent Demo ===")
+async def demonstrate_vector_agent(embeddings: List):
+    """
+    Demonstrate the Vector Retrieval Agent functionality.
     
-    # Create temporary directory for Chroma
-    temp_dir = tempfile.mkdtemp()
+    Args:
+        embeddings: Embeddings of SAMPLE_CONTENTS from demonstrate_embedding_service
+    """
+    logger.info("\n=== Vector Retrieval Agent Demo ===")
     
-    try:
-        # Initialize vector agent
-        vector_agent = VectorRetrievalAgent(
-            agent_id="demo_vector_agent",
-            model_name="all-MiniLM-L6-v2",
-            chroma_persist_directory=temp_dir,
-            collection_name="demo_collection"
-        )
-        
-        print("Vector Retrieval Agent initialized")
-        
-        # Generate embeddings and create documents
-        embedding_service = EmbeddingGenerationService()
-        texts = [
-            "Machine learning is a subset of artificial intelligence that focuses on algorithms that can learn from data.",
-            "Natural language processing enables computers to understand, interpret, and generate human language.",
-            "Computer vision allows machines to interpret and understand visual information from the world.",
-            "Deep learning uses neural networks with multiple layers to model complex patterns in data.",
-            "Data science combines statistics, programming, and domain expertise to extract insights from data."
-        ]
-        
-        embeddings = await embedding_service.generate_embeddings_batch(texts)
-        documents = await create_sample_documents(embeddings)
-        
-        # Add documents to vector database
-        print(f"\nAdding {len(documents)} documents to vector database...")
-        await vector_agent.add_documents(documents)
-        
-        doc_count = await vector_agent.get_document_count()
-        print(f"Total documents in database: {doc_count}")
-        
-        # Demonstrate similarity search
-        print("\n--- Similarity Search Demo ---")
-        query = "algorithms that learn from data"
-        print(f"Query: '{query}'")
-        
-        result = await vector_agent.similarity_search(query, k=3)
-        print(f"Found {len(result.documents)} similar documents:")
-        
-        for i, (doc, similarity) in enumerate(zip(result.documents, result.similarities)):
-            print(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
-            print(f"   Similarity: {similarity:.4f}")
-            print(f"   Content: {doc.content[:100]}...")
-            print()
-        
-        # Demonstrate filtered search
-        print("--- Filtered Search Demo ---")
-        query = "computer understanding"
-        filters = {"topic": "nlp"}
-        print(f"Query: '{query}' with filter: {filters}")
-        
-        filtered_result = await vector_agent.similarity_search(query, k=5, filters=filters)
-        print(f"Found {len(filtered_result.documents)} filtered results:")
-        
-        for i, (doc, similarity) in enumerate(zip(filtered_result.documents, filtered_result.similarities)):
-            print(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
-            print(f"   Topic: {doc.metadata.get('topic', 'N/A')}")
-            print(f"   Similarity: {similarity:.4f}")
-            print()
-        
-        # Demonstrate hybrid search
-        print("--- Hybrid Search Demo ---")
-        query = "neural networks deep learning"
-        print(f"Query: '{query}'")
-        
-        hybrid_result = await vector_agent.hybrid_search(query, semantic_weight=0.7, k=3)
-        print(f"Found {len(hybrid_result.documents)} hybrid search results:")
-        
-        for i, (doc, score) in enumerate(zip(hybrid_result.documents, hybrid_result.similarities)):
-            print(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
-            print(f"   Hybrid Score: {score:.4f}")
-            print(f"   Content: {doc.content[:100]}...")
-            print()
-        
-        # Demonstrate agent messaging
-        print("--- Agent Messaging Demo ---")
-        message = AgentMessage(
-            agent_id="demo_coordinator",
-            message_type=MessageType.VECTOR_SEARCH,
-            payload={
-                "query": "artificial intelligence machine learning",
-                "k": 2,
-                "search_type": "hybrid",
-                "semantic_weight": 0.8
-            },
-            correlation_id="demo_correlation_123"
-        )
-        
-        print(f"Sending message: {message.message_type.value}")
-        response = await vector_agent.process_message(message)
-        
-        if response:
-            print(f"Received response: {response.message_type.value}")
-            print(f"Correlation ID: {response.correlation_id}")
-            print(f"Found {len(response.payload['documents'])} documents via messaging")
-        
-        # Show agent information
-        print("\n--- Agent Information ---")
-        agent_info = vector_agent.get_agent_info()
-        print(f"Agent ID: {agent_info['agent_id']}")
-        print(f"Agent Type: {agent_info['agent_type']}")
-        print(f"Model: {agent_info['model_info']['model_name']}")
-        print(f"Document Count: {agent_info['document_count']}")
-        print(f"Cache Size: {agent_info['cache_stats']['cache_size']}")
-        
-        # Health check
-        print("\n--- Health Check ---")
-        health = await vector_agent.health_check()
-        print(f"Overall Status: {health['status']}")
-        print(f"Embedding Service: {health['checks']['embedding_service']['status']}")
-        print(f"Vector Database: {health['checks']['vector_database']['status']}")
-        
-        # Demonstrate document update
-        print("\n--- Document Update Demo ---")
-        updated_doc = documents[0]
-        updated_doc.content = "Updated: Machine learning and AI are transforming how we process and understand data."
-        updated_doc.title = "Updated: ML and AI Overview"
-        
-        await vector_agent.update_document(updated_doc)
-        print("Document updated successfully")
-        
-        # Search for updated content
-        update_result = await vector_agent.similarity_search("transforming data processing", k=1)
-        if update_result.documents:
-            print(f"Found updated document: {update_result.documents[0].metadata.get('title')}")
-        
-        # Demonstrate document deletion
-        print("\n--- Document Deletion Demo ---")
-        initial_count = await vector_agent.get_document_count()
-        await vector_agent.delete_document(documents[1].id)
-        final_count = await vector_agent.get_document_count()
-        
-        print(f"Documents before deletion: {initial_count}")
-        print(f"Documents after deletion: {final_count}")
-        print(f"Successfully deleted 1 document")
-        
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir)
-        print(f"\nCleaned up temporary directory: {temp_dir}")
+    # Initialize vector agent
+    vector_agent = VectorRetrievalAgent(
+        agent_id="demo_vector_agent",
+        model_name="all-MiniLM-L6-v2",
+        vector_store=VectorStoreType.FAISS,
+        vector_quantization="int8",
+        collection_name="demo_collection"
+    )
+    
+    logger.info("Vector Retrieval Agent initialized")
+    
+    # Create documents from the embeddings already computed by the embedding demo
+    documents = await create_sample_documents(embeddings)
+    
+    # Add documents to vector database
+    logger.info(f"\nAdding {len(documents)} documents to vector database...")
+    await vector_agent.add_documents(documents)
+    
+    doc_count = await vector_agent.get_document_count()
+    logger.info(f"Total documents in database: {doc_count}")
+    
+    # Demonstrate similarity search
+    logger.info("\n--- Similarity Search Demo ---")
+    query = "algorithms that learn from data"
+    logger.info(f"Query: '{query}'")
+    
+    result = await vector_agent.similarity_search(query, k=3)
+    logger.info(f"Found {len(result.documents)} similar documents:")
+    
+    for i, (doc, similarity) in enumerate(zip(result.documents, result.similarities)):
+        logger.info(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
+        logger.info(f"   Similarity: {similarity:.4f}")
+        logger.info(f"   Content: {doc.content[:100]}...")
+        logger.info("")
+    
+    # Demonstrate filtered search
+    logger.info("--- Filtered Search Demo ---")
+    query = "computer understanding"
+    filters = {"topic": "nlp"}
+    logger.info(f"Query: '{query}' with filter: {filters}")
+    
+    filtered_result = await vector_agent.similarity_search(query, k=5, filters=filters)
+    logger.info(f"Found {len(filtered_result.documents)} filtered results:")
+    
+    for i, (doc, similarity) in enumerate(zip(filtered_result.documents, filtered_result.similarities)):
+        logger.info(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
+        logger.info(f"   Topic: {doc.metadata.get('topic', 'N/A')}")
+        logger.info(f"   Similarity: {similarity:.4f}")
+        logger.info("")
+    
+    # Demonstrate hybrid search
+    logger.info("--- Hybrid Search Demo ---")
+    query = "neural networks deep learning"
+    logger.info(f"Query: '{query}'")
+    
+    hybrid_result = await vector_agent.hybrid_search(query, semantic_weight=0.7, k=3)
+    logger.info(f"Found {len(hybrid_result.documents)} hybrid search results:")
+    
+    for i, (doc, score) in enumerate(zip(hybrid_result.documents, hybrid_result.similarities)):
+        logger.info(f"{i+1}. Title: {doc.metadata.get('title', 'N/A')}")
+        logger.info(f"   Hybrid Score: {score:.4f}")
+        logger.info(f"   Content: {doc.content[:100]}...")
+        logger.info("")
+    
+    # Demonstrate agent messaging
+    logger.info("--- Agent Messaging Demo ---")
+    message = AgentMessage(
+        agent_id="demo_coordinator",
+        message_type=MessageType.VECTOR_SEARCH,
+        payload={
+            "query": "artificial intelligence machine learning",
+            "k": 2,
+            "search_type": "hybrid",
+            "semantic_weight": 0.8
+        },
+        correlation_id="demo_correlation_123"
+    )
+    
+    logger.info(f"Sending message: {message.message_type.value}")
+    response = await vector_agent.process_message(message)
+    
+    if response:
+        logger.info(f"Received response: {response.message_type.value}")
+        logger.info(f"Correlation ID: {response.correlation_id}")
+        logger.info(f"Found {len(response.payload['documents'])} documents via messaging")
+    
+    # Show agent information
+    logger.info("\n--- Agent Information ---")
+    agent_info = vector_agent.get_agent_info()
+    logger.info(f"Agent ID: {agent_info['agent_id']}")
+    logger.info(f"Agent Type: {agent_info['agent_type']}")
+    logger.info(f"Model: {agent_info['model_info']['model_name']}")
+    logger.info(f"Document Count: {agent_info['document_count']}")
+    logger.info(f"Cache Size: {agent_info['cache_stats']['cache_size']}")
+    
+    # Health check
+    logger.info("\n--- Health Check ---")
+    health = await vector_agent.health_check()
+    logger.info(f"Overall Status: {health['status']}")
+    logger.info(f"Embedding Service: {health['checks']['embedding_service']['status']}")
+    logger.info(f"Vector Database: {health['checks']['vector_database']['status']}")
+    
+    # Demonstrate document update
+    logger.info("\n--- Document Update Demo ---")
+    updated_doc = documents[0]
+    updated_doc.content = "Updated: Machine learning and AI are transforming how we process and understand data."
+    updated_doc.title = "Updated: ML and AI Overview"
+    
+    await vector_agent.update_document(updated_doc)
+    logger.info("Document updated successfully")
+    
+    # Search for updated content
+    update_result = await vector_agent.similarity_search("transforming data processing", k=1)
+    if update_result.documents:
+        logger.info(f"Found updated document: {update_result.documents[0].metadata.get('title')}")
+    
+    # Demonstrate document deletion
+    logger.info("\n--- Document Deletion Demo ---")
+    initial_count = await vector_agent.get_document_count()
+    await vector_agent.delete_document(documents[1].id)
+    final_count = await vector_agent.get_document_count()
+    
+    logger.info(f"Documents before deletion: {initial_count}")
+    logger.info(f"Documents after deletion: {final_count}")
+    logger.info(f"Successfully deleted 1 document")
+    
+    await vector_agent.aclose()
 
 
 async def demonstrate_advanced_features():
     """Demonstrate advanced features of the vector retrieval system."""
-    print("\n=== Advanced Features Demo ===")
+    logger.info("\n=== Advanced Features Demo ===")
     
-    # Create temporary directory
-    temp_dir = tempfile.mkdtemp()
+    vector_agent = VectorRetrievalAgent(
+        agent_id="advanced_demo_agent",
+        vector_store=VectorStoreType.MEMORY,
+        vector_quantization="binary",
+        vector_dtype="float16",
+        collection_name="advanced_collection"
+    )
     
-    try:
-        vector_agent = VectorRetrievalAgent(
-            agent_id="advanced_demo_agent",
-            chroma_persist_directory=temp_dir,
-            collection_name="advanced_collection"
-        )
-        
-        # Create documents with different characteristics
-        diverse_documents = []
-        
-        # Short document
-        short_doc = DocumentEmbedding(
-            content="AI is powerful.",
-            title="Short AI Note",
-            embedding=[0.1] * 384,  # Mock embedding
-            embedding_model="all-MiniLM-L6-v2",
-            embedding_dimension=384,
-            metadata={"length": "short", "category": "note"}
-        )
-        diverse_documents.append(short_doc)
-        
-        # Long document
-        long_content = " ".join([
-            "Artificial intelligence represents one of the most significant technological advances of our time.",
-            "It encompasses machine learning, deep learning, natural language processing, computer vision,",
-            "and many other subfields that are revolutionizing industries and changing how we interact with technology.",
-            "The applications are vast, from autonomous vehicles to medical diagnosis, from financial trading",
-            "to creative content generation. As AI continues to evolve, we must consider both its tremendous",
-            "potential and the ethical implications of its widespread adoption."
-        ])
-        
-        long_doc = DocumentEmbedding(
-            content=long_content,
-            title="Comprehensive AI Overview",
-            embedding=[0.2] * 384,  # Mock embedding
-            embedding_model="all-MiniLM-L6-v2",
-            embedding_dimension=384,
-            metadata={"length": "long", "category": "article"}
-        )
-        diverse_documents.append(long_doc)
-        
-        # Document with exact phrase match
-        exact_doc = DocumentEmbedding(
-            content="This document contains the exact phrase we will search for: machine learning algorithms.",
-            title="Exact Match Document",
-            embedding=[0.3] * 384,  # Mock embedding
-            embedding_model="all-MiniLM-L6-v2",
-            embedding_dimension=384,
-            metadata={"type": "exact_match", "category": "technical"}
-        )
-        diverse_documents.append(exact_doc)
-        
-        await vector_agent.add_documents(diverse_documents)
-        
-        # Demonstrate re-ranking
-        print("--- Re-ranking Demo ---")
-        query = "machine learning algorithms"
-        
-        # First, get results without re-ranking
-        basic_result = await vector_agent.similarity_search(query, k=3)
-        print(f"Basic search results for '{query}':")
-        for i, (doc, sim) in enumerate(zip(basic_result.documents, basic_result.similarities)):
-            print(f"{i+1}. {doc.metadata.get('title', 'N/A')} (sim: {sim:.4f})")
-        
-        # Now demonstrate re-ranking
-        reranked_docs, reranked_scores = await vector_agent.rerank_results(
-            basic_result.documents, 
-            basic_result.similarities, 
-            query
-        )
-        
-        print(f"\nRe-ranked results:")
-        for i, (doc, score) in enumerate(zip(reranked_docs, reranked_scores)):
-            print(f"{i+1}. {doc.metadata.get('title', 'N/A')} (enhanced score: {score:.4f})")
-        
-        # Demonstrate different semantic weights in hybrid search
-        print("\n--- Semantic Weight Comparison ---")
-        query = "AI technology applications"
-        
-        for weight in [0.3, 0.5, 0.7, 0.9]:
-            result = await vector_agent.hybrid_search(query, semantic_weight=weight, k=2)
-            print(f"Semantic weight {weight}: {len(result.documents)} results")
-            if result.documents:
-                top_doc = result.documents[0]
-                print(f"  Top result: {top_doc.metadata.get('title', 'N/A')} (score: {result.similarities[0]:.4f})")
-        
-    finally:
-        shutil.rmtree(temp_dir)
-        print(f"\nCleaned up temporary directory: {temp_dir}")
+    # Create documents with different characteristics
+    diverse_documents = []
+    
+    # Short document
+    short_doc = DocumentEmbedding(
+        content="AI is powerful.",
+        title="Short AI Note",
+        embedding=[0.1] * 384,  # Mock embedding
+        embedding_model="all-MiniLM-L6-v2",
+        embedding_dimension=384,
+        metadata={"length": "short", "category": "note"}
+    )
+    diverse_documents.append(short_doc)
+    
+    # Long document
+    long_content = " ".join([
+        "Artificial intelligence represents one of the most significant technological advances of our time.",
+        "It encompasses machine learning, deep learning, natural language processing, computer vision,",
+        "and many other subfields that are revolutionizing industries and changing how we interact with technology.",
+        "The applications are vast, from autonomous vehicles to medical diagnosis, from financial trading",
+        "to creative content generation. As AI continues to evolve, we must consider both its tremendous",
+        "potential and the ethical implications of its widespread adoption."
+    ])
+    
+    long_doc = DocumentEmbedding(
+        content=long_content,
+        title="Comprehensive AI Overview",
+        embedding=[0.2] * 384,  # Mock embedding
+        embedding_model="all-MiniLM-L6-v2",
+        embedding_dimension=384,
+        metadata={"length": "long", "category": "article"}
+    )
+    diverse_documents.append(long_doc)
+    
+    # Document with exact phrase match
+    exact_doc = DocumentEmbedding(
+        content="This document contains the exact phrase we will search for: machine learning algorithms.",
+        title="Exact Match Document",
+        embedding=[0.3] * 384,  # Mock embedding
+        embedding_model="all-MiniLM-L6-v2",
+        embedding_dimension=384,
+        metadata={"type": "exact_match", "category": "technical"}
+    )
+    diverse_documents.append(exact_doc)
+    
+    await vector_agent.add_documents(diverse_documents)
+    
+    # Demonstrate re-ranking
+    logger.info("--- Re-ranking Demo ---")
+    query = "machine learning algorithms"
+    
+    # First, get results without re-ranking
+    basic_result = await vector_agent.similarity_search(query, k=3)
+    logger.info(f"Basic search results for '{query}':")
+    for i, (doc, sim) in enumerate(zip(basic_result.documents, basic_result.similarities)):
+        logger.info(f"{i+1}. {doc.metadata.get('title', 'N/A')} (sim: {sim:.4f})")
+    
+    # Now demonstrate re-ranking
+    reranked_docs, reranked_scores = await vector_agent.rerank_results(
+        basic_result.documents, 
+        basic_result.similarities, 
+        query
+    )
+    
+    logger.info(f"\nRe-ranked results:")
+    for i, (doc, score) in enumerate(zip(reranked_docs, reranked_scores)):
+        logger.info(f"{i+1}. {doc.metadata.get('title', 'N/A')} (enhanced score: {score:.4f})")
+    
+    # Demonstrate different semantic weights in hybrid search
+    logger.info("\n--- Semantic Weight Comparison ---")
+    query = "AI technology applications"
+    
+    weights = [0.3, 0.5, 0.7, 0.9]
+    results = await vector_agent.hybrid_search_sweep(query, weights, k=2)
+    for weight, result in zip(weights, results):
+        logger.info(f"Semantic weight {weight}: {len(result.documents)} results")
+        if result.documents:
+            top_doc = result.documents[0]
+            logger.info(f"  Top result: {top_doc.metadata.get('title', 'N/A')} (score: {result.similarities[0]:.4f})")
+    
+    await vector_agent.aclose()
 
 
 async def main():
     """Run all demonstrations."""
-    print("Vector Retrieval Agent Demonstration")
-    print("=" * 50)
+    logger.info("Vector Retrieval Agent Demonstration")
+    logger.info("=" * 50)
     
     try:
         # Demonstrate embedding service
         embeddings = await demonstrate_embedding_service()
         
-        # Demonstrate vector agent
-        await demonstrate_vector_agent()
-        
-        # Demonstrate advanced features
-        await demonstrate_advanced_features()
+        # The vector agent and advanced feature demos build independent agents,
+        # so run them concurrently; each writes its output in one block when done
+        await asyncio.gather(
+            run_demo(demonstrate_vector_agent(embeddings)),
+            run_demo(demonstrate_advanced_features())
+        )
         
-        print("\n" + "=" * 50)
-        print("All demonstrations completed successfully!")
+        logger.info("\n" + "=" * 50)
+        logger.info("All demonstrations completed successfully!")
         
-    except Exception as e:
-        print(f"\nError during demonstration: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # Log with the traceback and let the error propagate out of asyncio.run
+        logger.exception("\nError during demonstration")
+        raise
 
 
 if __name__ == "__main__":
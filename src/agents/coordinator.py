@@ -839,14 +839,13 @@ class CoordinatorAgent(CoordinatorAgentInterface):
                 from ..core.config import get_config
                 
                 config = get_config()
-                vector_agent = VectorRetrievalAgent(
+                # Process the message using the real agent, then stop its embedding worker
+                async with VectorRetrievalAgent(
                     agent_id="vector_retrieval",
                     model_name=config.llm.embedding_model,
                     collection_name=config.database.chroma_collection_name
-                )
-                
-                # Process the message using the real agent
-                response = await vector_agent.process_message(message)
+                ) as vector_agent:
+                    response = await vector_agent.process_message(message)
                 
                 if response and response.message_type == MessageType.RESPONSE:
                     return response.payload
@@ -13,7 +13,7 @@ This implements task 5: Implement Graph Navigator Agent
 import re
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Any, Union
+from typing import Dict, List, Optional, Set, Tuple, Any, Union, AsyncIterator
 from datetime import datetime
 from difflib import SequenceMatcher
 
@@ -353,6 +353,7 @@ class GraphTraverser:
         self.neo4j_manager = neo4j_manager
         self.max_traversal_depth = 4
         self.max_paths_per_query = 50
+        self.max_concurrent_traversals = 8
     
     async def traverse_relationships(
         self, 
@@ -383,14 +384,23 @@ class GraphTraverser:
             all_relationships = []
             all_paths = []
             
-            for start_entity in start_entities:
-                result = await self._traverse_from_entity(
-                    start_entity.id, 
-                    depth, 
-                    relationship_types, 
-                    direction
-                )
-                
+            # Overlap the per-entity queries, bounded to stay within the driver's pool
+            semaphore = asyncio.Semaphore(self.max_concurrent_traversals)
+            
+            async def traverse_one(start_entity: Entity) -> Dict[str, List]:
+                async with semaphore:
+                    return await self._traverse_from_entity(
+                        start_entity.id, 
+                        depth, 
+                        relationship_types, 
+                        direction
+                    )
+            
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(traverse_one(entity)) for entity in start_entities]
+            
+            for task in tasks:
+                result = task.result()
                 all_entities.extend(result['entities'])
                 all_relationships.extend(result['relationships'])
                 all_paths.extend(result['paths'])
@@ -950,6 +960,14 @@ class GraphNavigatorAgent(GraphNavigatorInterface):
         
         logger.info(f"Graph Navigator Agent {agent_id} initialized")
     
+    async def __aenter__(self) -> "GraphNavigatorAgent":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Release the async connection pool bound to this event loop; the shared
+        # sync driver stays open for other users of the Neo4j manager
+        await self.neo4j_manager.close_async_driver()
+    
     async def find_entities(self, query: str) -> List[Entity]:
         """
         Find entities in the graph matching the query.
@@ -1043,18 +1061,7 @@ class GraphNavigatorAgent(GraphNavigatorInterface):
             relationships = []
             
             for record in results:
-                # Extract entities from record
-                for key, value in record.items():
-                    if isinstance(value, dict) and value.get('id'):
-                        # This looks like an entity
-                        entity = Entity(
-                            id=value.get('id', ''),
-                            name=value.get('name', ''),
-                            type=value.get('entity_type', 'unknown'),
-                            description=value.get('description'),
-                            properties=value.get('properties', {})
-                        )
-                        entities.append(entity)
+                entities.extend(self._entities_from_record(record))
             
             # Deduplicate entities
             unique_entities = self.graph_traverser._deduplicate_entities_by_id(entities)
@@ -1072,6 +1079,57 @@ class GraphNavigatorAgent(GraphNavigatorInterface):
             logger.error(f"Error executing Cypher query: {str(e)}")
             return GraphResult(cypher_query=cypher)
     
+    async def stream_cypher_query(
+        self, 
+        cypher: str, 
+        parameters: Dict = None
+    ) -> AsyncIterator[Entity]:
+        """
+        Execute a Cypher query and yield entities as records arrive.
+        
+        Unlike execute_cypher_query, results are not materialized, so callers
+        that only need a prefix can stop early. Entities are deduplicated by ID.
+        
+        Args:
+            cypher: Cypher query string
+            parameters: Query parameters
+            
+        Yields:
+            Entity: Entities found in the result records
+        """
+        try:
+            logger.info(f"Streaming Cypher query: {cypher[:100]}...")
+            
+            optimized_query, opt_params = self.query_generator.optimize_query_for_performance(
+                cypher, 
+                parameters or {}
+            )
+            
+            seen_ids = set()
+            async for record in self.neo4j_manager.stream_query_async(optimized_query, opt_params):
+                for entity in self._entities_from_record(record):
+                    if entity.id not in seen_ids:
+                        seen_ids.add(entity.id)
+                        yield entity
+            
+        except Exception as e:
+            logger.error(f"Error streaming Cypher query: {str(e)}")
+    
+    @staticmethod
+    def _entities_from_record(record: Dict[str, Any]) -> List[Entity]:
+        """Build entities from the record values that look like entity nodes."""
+        entities = []
+        for value in record.values():
+            if isinstance(value, dict) and value.get('id'):
+                entities.append(Entity(
+                    id=value.get('id', ''),
+                    name=value.get('name', ''),
+                    type=value.get('entity_type', 'unknown'),
+                    description=value.get('description'),
+                    properties=value.get('properties', {})
+                ))
+        return entities
+    
     async def process_message(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Process incoming messages."""
         try:
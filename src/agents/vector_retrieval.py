@@ -6,34 +6,99 @@ and hybrid search capabilities using sentence transformers and Pinecone vector d
 """
 
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 import numpy as np
-from sentence_transformers import SentenceTransformer
 # Vector database imports handled through database manager
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from ..core.interfaces import VectorRetrievalInterface, MessageType, VectorResult, Document
 from ..core.protocols import AgentMessage
-from ..core.vector_models import DocumentEmbedding, EmbeddingVector, EmbeddingValidationResult
+from ..core.vector_models import DocumentEmbedding, EmbeddingVector, EmbeddingValidationResult, VectorStoreType
+from ..core.vector_index import FAISS_AVAILABLE, DocumentStore, FaissVectorIndex, StoredDocument
+from ..core.embedding_service import get_sentence_transformer
 from ..core.models import ValidationResult
 
 
 logger = logging.getLogger(__name__)
 
+# Documents sent to the vector database per add call
+UPSERT_BATCH_SIZE = 1024
+
+
+class KeywordMatcher:
+    """
+    Counts which query words occur as whitespace-delimited tokens of a text.
+    
+    Gives the same result as len(query_words & set(text.split())), but with
+    pyahocorasick installed all query words are found in a single automaton pass
+    over the text instead of splitting it into a set of tokens.
+    """
+    
+    def __init__(self, words: Set[str]):
+        """
+        Build the matcher for a set of query words.
+        
+        Args:
+            words: Query words, none containing whitespace
+        """
+        self.words = words
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and words:
+            self._automaton = ahocorasick.Automaton()
+            for word in words:
+                self._automaton.add_word(word, word)
+            self._automaton.make_automaton()
+    
+    def count(self, text: str) -> int:
+        """Return the number of distinct query words that are tokens of text."""
+        if self._automaton is None:
+            return len(self.words.intersection(text.split()))
+        
+        text_length = len(text)
+        found = set()
+        for end_index, word in self._automaton.iter(text):
+            start = end_index - len(word) + 1
+            if start > 0 and not text[start - 1].isspace():
+                continue
+            if end_index + 1 < text_length and not text[end_index + 1].isspace():
+                continue
+            found.add(word)
+        return len(found)
+
 
 class EmbeddingGenerationService:
     """
     Service for generating text embeddings using sentence transformers.
     
     Provides text embedding generation with caching and batch processing capabilities.
+    Concurrent generate_embedding calls are queued and coalesced by a background
+    worker into micro-batches, so the model runs one forward pass per batch
+    instead of one per text.
     """
     
     def __init__(
         self, 
         model_name: str = "all-MiniLM-L6-v2",
         cache_size: int = 1000,
-        device: str = "cpu"
+        device: str = "cpu",
+        micro_batch_size: int = 32,
+        max_pending: int = 1024
     ):
         """
         Initialize the embedding generation service.
@@ -42,13 +107,24 @@ class EmbeddingGenerationService:
             model_name: Name of the sentence transformer model to use
             cache_size: Maximum number of embeddings to cache
             device: Device to run the model on ('cpu' or 'cuda')
+            micro_batch_size: Maximum number of queued texts encoded together
+            max_pending: Maximum number of queued texts before callers wait
         """
         self.model_name = model_name
         self.cache_size = cache_size
         self.device = device
+        self.micro_batch_size = micro_batch_size
+        self.max_pending = max_pending
         self._model = None
-        self._embedding_cache: Dict[str, EmbeddingVector] = {}
-        self._cache_order: List[str] = []
+        # LRU cache of content digest -> (float32 vector bytes, created_at)
+        self._embedding_cache: "OrderedDict[bytes, Tuple[bytes, datetime]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Micro-batching queue and worker, bound to the event loop that created them
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
         
         logger.info(f"Initializing EmbeddingGenerationService with model: {model_name}")
     
@@ -56,43 +132,134 @@ class EmbeddingGenerationService:
         """Load the sentence transformer model."""
         if self._model is None:
             try:
-                self._model = SentenceTransformer(self.model_name, device=self.device)
+                self._model = get_sentence_transformer(self.model_name, device=self.device)
                 logger.info(f"Loaded sentence transformer model: {self.model_name}")
             except Exception as e:
                 logger.error(f"Failed to load model {self.model_name}: {e}")
                 raise RuntimeError(f"Failed to load embedding model: {e}")
     
-    def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text."""
-        import hashlib
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+    def _get_cache_key(self, text: str) -> bytes:
+        """Generate cache key for text as a 128-bit content digest."""
+        data = text.encode('utf-8')
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_digest(data)
+        return hashlib.blake2b(data, digest_size=16).digest()
     
     def _add_to_cache(self, text: str, embedding: EmbeddingVector) -> None:
         """Add embedding to cache with LRU eviction."""
         cache_key = self._get_cache_key(text)
         
-        # Remove if already exists to update order
-        if cache_key in self._embedding_cache:
-            self._cache_order.remove(cache_key)
-        
-        # Add to cache
-        self._embedding_cache[cache_key] = embedding
-        self._cache_order.append(cache_key)
+        # Store only the raw vector bytes and timestamp, not the EmbeddingVector
+        self._embedding_cache[cache_key] = (
+            np.asarray(embedding.vector, dtype=np.float32).tobytes(),
+            embedding.created_at
+        )
+        self._embedding_cache.move_to_end(cache_key)
         
         # Evict oldest if cache is full
         while len(self._embedding_cache) > self.cache_size:
-            oldest_key = self._cache_order.pop(0)
-            del self._embedding_cache[oldest_key]
+            self._embedding_cache.popitem(last=False)
     
     def _get_from_cache(self, text: str) -> Optional[EmbeddingVector]:
         """Get embedding from cache."""
         cache_key = self._get_cache_key(text)
-        if cache_key in self._embedding_cache:
-            # Move to end (most recently used)
-            self._cache_order.remove(cache_key)
-            self._cache_order.append(cache_key)
-            return self._embedding_cache[cache_key]
-        return None
+        entry = self._embedding_cache.get(cache_key)
+        if entry is None:
+            self._cache_misses += 1
+            return None
+        
+        # Move to end (most recently used)
+        self._embedding_cache.move_to_end(cache_key)
+        self._cache_hits += 1
+        vector_bytes, created_at = entry
+        vector = np.frombuffer(vector_bytes, dtype=np.float32)
+        return EmbeddingVector(
+            vector=vector,
+            dimension=len(vector),
+            model_name=self.model_name,
+            created_at=created_at
+        )
+    
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the micro-batching worker on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker_loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._worker = loop.create_task(self._batch_worker(self._queue))
+            self._worker_loop = loop
+        return self._queue
+    
+    async def _enqueue(self, text: str) -> np.ndarray:
+        """Queue a text for the next micro-batch and wait for its embedding."""
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        if queue is not self._queue and not future.done():
+            # The service was closed while this call waited for queue space
+            future.set_exception(RuntimeError("Embedding service closed"))
+        return await future
+    
+    async def _batch_worker(self, queue: asyncio.Queue) -> None:
+        """Drain queued texts in micro-batches and encode each batch in one call."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await queue.get()]
+            while len(pending) < self.micro_batch_size and not queue.empty():
+                pending.append(queue.get_nowait())
+            
+            texts = [text for text, _ in pending]
+            try:
+                embedding_arrays = await loop.run_in_executor(
+                    None, partial(self._model.encode, texts, batch_size=self.micro_batch_size)
+                )
+            except asyncio.CancelledError:
+                # Closed mid-batch; callers waiting on this batch must not hang
+                self._fail_futures((future for _, future in pending), RuntimeError("Embedding service closed"))
+                raise
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), embedding_array in zip(pending, embedding_arrays):
+                    if not future.done():
+                        future.set_result(embedding_array)
+            finally:
+                for _ in pending:
+                    queue.task_done()
+            
+            logger.debug(f"Encoded micro-batch of {len(pending)} texts")
+    
+    @staticmethod
+    def _fail_futures(futures: Iterable[asyncio.Future], error: Exception) -> None:
+        """Fail every future that has not completed yet."""
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+    
+    async def close(self) -> None:
+        """Stop the micro-batching worker and fail embeddings still waiting on it."""
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        self._queue = None
+        self._worker_loop = None
+        
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        
+        if queue is not None:
+            # Each dequeued item lets a caller blocked on a full queue put its text,
+            # so drain until no more arrive
+            error = RuntimeError("Embedding service closed")
+            while not queue.empty():
+                while not queue.empty():
+                    _, future = queue.get_nowait()
+                    self._fail_futures((future,), error)
+                await asyncio.sleep(0)
     
     async def generate_embedding(self, text: str) -> EmbeddingVector:
         """
@@ -119,10 +286,8 @@ class EmbeddingGenerationService:
         self._load_model()
         
         try:
-            # Generate embedding
-            embedding_array = await asyncio.get_event_loop().run_in_executor(
-                None, self._model.encode, text
-            )
+            # Generate embedding as part of the next micro-batch
+            embedding_array = await self._enqueue(text)
             
             # Create EmbeddingVector
             embedding_vector = EmbeddingVector(
@@ -142,12 +307,13 @@ class EmbeddingGenerationService:
             logger.error(f"Failed to generate embedding for text: {e}")
             raise RuntimeError(f"Embedding generation failed: {e}")
     
-    async def generate_embeddings_batch(self, texts: List[str]) -> List[EmbeddingVector]:
+    async def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> List[EmbeddingVector]:
         """
         Generate embeddings for multiple texts in batch.
         
         Args:
             texts: List of texts to embed
+            batch_size: Number of texts per forward pass
             
         Returns:
             List[EmbeddingVector]: List of generated embedding vectors
@@ -178,9 +344,13 @@ class EmbeddingGenerationService:
         new_embeddings = {}
         if texts_to_process:
             try:
+                # Encode all uncached texts in a single call: SentenceTransformer.encode
+                # sorts them by token length before splitting into batches of batch_size,
+                # so each batch is padded only to its own longest text, and returns the
+                # embeddings in input order
                 batch_texts = [text for _, text in texts_to_process]
                 embedding_arrays = await asyncio.get_event_loop().run_in_executor(
-                    None, self._model.encode, batch_texts
+                    None, partial(self._model.encode, batch_texts, batch_size=batch_size)
                 )
                 
                 for (original_idx, text), embedding_array in zip(texts_to_process, embedding_arrays):
@@ -232,13 +402,14 @@ class EmbeddingGenerationService:
         return {
             "cache_size": len(self._embedding_cache),
             "max_cache_size": self.cache_size,
-            "cache_hit_ratio": len(self._embedding_cache) / max(1, len(self._cache_order))
+            "cache_hit_ratio": self._cache_hits / max(1, self._cache_hits + self._cache_misses)
         }
     
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
         self._embedding_cache.clear()
-        self._cache_order.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
         logger.info("Embedding cache cleared")
 
 
@@ -250,12 +421,19 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
     capabilities using Pinecone vector database and sentence transformers.
     """
     
+    # Vector stores held in process by the agent rather than a database manager
+    LOCAL_VECTOR_STORES = (VectorStoreType.FAISS, VectorStoreType.MEMORY)
+    
     def __init__(
         self,
         agent_id: str = "vector_retrieval_agent",
         model_name: str = "all-MiniLM-L6-v2",
         collection_name: str = "documents",
-        embedding_cache_size: int = 1000
+        embedding_cache_size: int = 1000,
+        vector_store: Optional[Union[str, VectorStoreType]] = None,
+        vector_quantization: Optional[str] = None,
+        vector_dtype: str = "float32",
+        vector_index_type: str = "hnsw"
     ):
         """
         Initialize the Vector Retrieval Agent.
@@ -265,11 +443,25 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             model_name: Sentence transformer model name
             collection_name: Name of the vector collection
             embedding_cache_size: Size of embedding cache
+            vector_store: Set to "faiss" to keep documents in an in-process HNSW
+                index, or "memory" for exact in-process search, instead of the
+                configured vector database
+            vector_quantization: Vector encoding for the local store: "int8" keeps one
+                byte per dimension in the FAISS index, "binary" adds a Hamming
+                prefilter to the memory store
+            vector_dtype: Element type of memory store vectors, "float32" or
+                "float16" to halve their memory
+            vector_index_type: FAISS index structure, "hnsw" or "ivf_pq" for
+                product-quantized inverted lists that scale to large collections
         """
         super().__init__(agent_id)
         
         self.model_name = model_name
         self.collection_name = collection_name
+        self.vector_store = VectorStoreType(vector_store) if vector_store else None
+        self.vector_quantization = vector_quantization
+        self.vector_dtype = vector_dtype
+        self.vector_index_type = vector_index_type
         
         # Initialize embedding service
         self.embedding_service = EmbeddingGenerationService(
@@ -277,15 +469,34 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             cache_size=embedding_cache_size
         )
         
-        # Initialize vector database manager
-        from ..core.database import get_vector_manager
-        self.vector_manager = get_vector_manager()
+        # Initialize vector database manager, or the local index built on first add
+        self.vector_index: Optional[Union[FaissVectorIndex, DocumentStore]] = None
+        if self.vector_store == VectorStoreType.FAISS and not FAISS_AVAILABLE:
+            raise ImportError("FAISS not available. Install with: pip install faiss-cpu")
+        if self.vector_store in self.LOCAL_VECTOR_STORES:
+            self.vector_manager = None
+        else:
+            from ..core.database import get_vector_manager
+            self.vector_manager = get_vector_manager()
         
         logger.info(f"Initialized VectorRetrievalAgent: {agent_id}")
     
+    async def aclose(self) -> None:
+        """Stop the embedding service's micro-batching worker."""
+        await self.embedding_service.close()
+    
+    async def __aenter__(self) -> "VectorRetrievalAgent":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
     def _initialize_vector_db(self) -> None:
         """Initialize vector database connection."""
         if not hasattr(self, '_vector_initialized'):
+            if self.vector_manager is None:
+                self._vector_initialized = True
+                return
             try:
                 # Create collection in vector database
                 self.vector_manager.create_collection(
@@ -300,6 +511,20 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
                 logger.error(f"Failed to initialize vector database: {e}")
                 raise RuntimeError(f"Vector database initialization failed: {e}")
     
+    def _create_vector_index(self, dimension: int) -> Union[FaissVectorIndex, DocumentStore]:
+        """Create the in-process index for the configured local vector store."""
+        if self.vector_store == VectorStoreType.FAISS:
+            return FaissVectorIndex(
+                dimension=dimension,
+                quantization=self.vector_quantization,
+                index_type=self.vector_index_type
+            )
+        return DocumentStore(
+            dimension=dimension,
+            quantization=self.vector_quantization,
+            vector_dtype=self.vector_dtype
+        )
+    
     async def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for given text.
@@ -358,6 +583,14 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             # Generate query embedding
             query_embedding = await self.generate_embedding(query)
             
+            if self.vector_store in self.LOCAL_VECTOR_STORES:
+                hits = self.vector_index.search(query_embedding, k, filters) if self.vector_index else []
+                return VectorResult(
+                    documents=[self._to_document(doc) for doc, _ in hits],
+                    similarities=[similarity for _, similarity in hits],
+                    query_embedding=query_embedding
+                )
+            
             # Prepare where clause for filtering
             where_clause = None
             if filters:
@@ -420,67 +653,43 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
     async def add_documents(
         self, 
         documents: List[DocumentEmbedding],
-        batch_size: int = 100
+        batch_size: int = UPSERT_BATCH_SIZE
     ) -> None:
         """
         Add documents to the vector database.
         
         Args:
             documents: List of DocumentEmbedding objects to add
-            batch_size: Number of documents to process in each batch
+            batch_size: Number of documents sent to the vector database per call
         """
         try:
             # Initialize vector database if needed
             self._initialize_vector_db()
             
-            # Process documents in batches
+            if self.vector_store in self.LOCAL_VECTOR_STORES:
+                if documents:
+                    if self.vector_index is None:
+                        self.vector_index = self._create_vector_index(documents[0].embedding_dimension)
+                    self.vector_index.add(documents)
+                logger.info(f"Successfully added {len(documents)} documents to {self.vector_store.value} vector store")
+                return
+            
+            # Build every record once, then upsert them in large batches; each call
+            # is a blocking database write, so it runs off the event loop
+            ids = [doc.id for doc in documents]
+            documents_content = [doc.content for doc in documents]
+            metadatas = [self._vector_metadata(doc) for doc in documents]
+            
             for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                
-                # Prepare batch data
-                ids = [doc.id for doc in batch]
-                embeddings = [doc.embedding for doc in batch]
-                documents_content = [doc.content for doc in batch]
-                metadatas = []
-                
-                for doc in batch:
-                    metadata = doc.metadata.copy()
-                    
-                    # Convert list fields to strings for vector database compatibility
-                    graph_entity_ids_str = ",".join(doc.graph_entity_ids) if doc.graph_entity_ids else ""
-                    
-                    metadata.update({
-                        "id": doc.id,
-                        "title": doc.title or "",
-                        "source": doc.source or "",
-                        "document_type": doc.document_type or "",
-                        "embedding_model": doc.embedding_model,
-                        "embedding_dimension": doc.embedding_dimension,
-                        "graph_entity_ids": graph_entity_ids_str,
-                        "created_at": doc.created_at.isoformat(),
-                        "updated_at": doc.updated_at.isoformat()
-                    })
-                    
-                    # Ensure all metadata values are vector database-compatible types
-                    for key, value in list(metadata.items()):
-                        if isinstance(value, list):
-                            metadata[key] = ",".join(str(v) for v in value)
-                        elif value is None:
-                            metadata[key] = ""
-                        elif not isinstance(value, (str, int, float, bool)):
-                            metadata[key] = str(value)
-                    
-                    metadatas.append(metadata)
-                
-                # Add to vector database using manager
-                self.vector_manager.add_documents(
+                await asyncio.to_thread(
+                    self.vector_manager.add_documents,
                     collection_name=self.collection_name,
-                    documents=documents_content,
-                    metadatas=metadatas,
-                    ids=ids
+                    documents=documents_content[i:i + batch_size],
+                    metadatas=metadatas[i:i + batch_size],
+                    ids=ids[i:i + batch_size]
                 )
                 
-                logger.debug(f"Added batch of {len(batch)} documents to vector database")
+                logger.debug(f"Added batch of {len(ids[i:i + batch_size])} documents to vector database")
             
             logger.info(f"Successfully added {len(documents)} documents to vector database")
             
@@ -499,32 +708,12 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             # Initialize vector database if needed
             self._initialize_vector_db()
             
+            if self.vector_store in self.LOCAL_VECTOR_STORES:
+                await self.add_documents([document])
+                return
+            
             # Prepare metadata
-            metadata = document.metadata.copy()
-            
-            # Convert list fields to strings for vector database compatibility
-            graph_entity_ids_str = ",".join(document.graph_entity_ids) if document.graph_entity_ids else ""
-            
-            metadata.update({
-                "id": document.id,
-                "title": document.title or "",
-                "source": document.source or "",
-                "document_type": document.document_type or "",
-                "embedding_model": document.embedding_model,
-                "embedding_dimension": document.embedding_dimension,
-                "graph_entity_ids": graph_entity_ids_str,
-                "created_at": document.created_at.isoformat(),
-                "updated_at": document.updated_at.isoformat()
-            })
-            
-            # Ensure all metadata values are vector database-compatible types
-            for key, value in list(metadata.items()):
-                if isinstance(value, list):
-                    metadata[key] = ",".join(str(v) for v in value)
-                elif value is None:
-                    metadata[key] = ""
-                elif not isinstance(value, (str, int, float, bool)):
-                    metadata[key] = str(value)
+            metadata = self._vector_metadata(document)
             
             # Update in vector database (Pinecone uses upsert for updates)
             self.vector_manager.add_documents(
@@ -552,7 +741,11 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             self._initialize_vector_db()
             
             # Delete from vector database
-            self.vector_manager.delete_documents([document_id])
+            if self.vector_store in self.LOCAL_VECTOR_STORES:
+                if self.vector_index is not None:
+                    self.vector_index.remove(document_id)
+            else:
+                self.vector_manager.delete_documents([document_id])
             
             logger.debug(f"Deleted document {document_id} from vector database")
             
@@ -571,7 +764,9 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             # Initialize vector database if needed
             self._initialize_vector_db()
             
-            if hasattr(self.vector_manager, 'get_index_stats'):
+            if self.vector_store in self.LOCAL_VECTOR_STORES:
+                return len(self.vector_index) if self.vector_index else 0
+            elif hasattr(self.vector_manager, 'get_index_stats'):
                 # Pinecone
                 stats = self.vector_manager.get_index_stats()
                 return stats.get('total_vectors', 0)
@@ -583,6 +778,54 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             logger.error(f"Failed to get document count: {e}")
             return 0
     
+    @staticmethod
+    def _vector_metadata(doc: DocumentEmbedding) -> Dict[str, Any]:
+        """Build the vector database metadata record for a document."""
+        metadata = doc.metadata.copy()
+        
+        # Convert list fields to strings for vector database compatibility
+        graph_entity_ids_str = ",".join(doc.graph_entity_ids) if doc.graph_entity_ids else ""
+        
+        metadata.update({
+            "id": doc.id,
+            "title": doc.title or "",
+            "source": doc.source or "",
+            "document_type": doc.document_type or "",
+            "embedding_model": doc.embedding_model,
+            "embedding_dimension": doc.embedding_dimension,
+            "graph_entity_ids": graph_entity_ids_str,
+            "created_at": doc.created_at.isoformat(),
+            "updated_at": doc.updated_at.isoformat()
+        })
+        
+        # Ensure all metadata values are vector database-compatible types
+        for key, value in list(metadata.items()):
+            if isinstance(value, list):
+                metadata[key] = ",".join(str(v) for v in value)
+            elif value is None:
+                metadata[key] = ""
+            elif not isinstance(value, (str, int, float, bool)):
+                metadata[key] = str(value)
+        
+        return metadata
+    
+    @staticmethod
+    def _to_document(doc: StoredDocument) -> Document:
+        """Convert a locally stored document to a search result Document."""
+        metadata = doc.metadata.copy()
+        metadata.update({
+            "id": doc.id,
+            "title": doc.title or "",
+            "source": doc.source or ""
+        })
+        return Document(
+            id=doc.id,
+            content=doc.content,
+            title=doc.title or f"Document {doc.id}",
+            metadata=metadata,
+            source=doc.source or "Unknown Source"
+        )
+    
     def _calculate_relevance_scores(
         self, 
         documents: List[Document], 
@@ -603,18 +846,20 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
         relevance_scores = []
         query_lower = query.lower()
         query_words = set(query_lower.split())
+        # One matcher for all documents and titles scored against this query
+        keyword_matcher = KeywordMatcher(query_words)
         
         for doc, similarity in zip(documents, similarities):
             # Start with similarity score
             relevance = similarity
+            content_lower = doc.content.lower()
             
             # Boost for exact phrase matches
-            if query_lower in doc.content.lower():
+            if query_lower in content_lower:
                 relevance *= 1.2
             
             # Boost for keyword matches
-            doc_words = set(doc.content.lower().split())
-            keyword_overlap = len(query_words.intersection(doc_words)) / len(query_words)
+            keyword_overlap = keyword_matcher.count(content_lower) / len(query_words)
             relevance *= (1.0 + keyword_overlap * 0.3)
             
             # Boost for title matches
@@ -623,8 +868,7 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
                 if query_lower in title_lower:
                     relevance *= 1.15
                 
-                title_words = set(title_lower.split())
-                title_overlap = len(query_words.intersection(title_words)) / len(query_words)
+                title_overlap = keyword_matcher.count(title_lower) / len(query_words)
                 relevance *= (1.0 + title_overlap * 0.2)
             
             # Penalize very short documents
@@ -688,35 +932,65 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
         Returns:
             VectorResult: Hybrid search results
         """
+        results = await self.hybrid_search_sweep(query, [semantic_weight], k)
+        return results[0]
+    
+    async def hybrid_search_sweep(
+        self,
+        query: str,
+        semantic_weights: List[float],
+        k: int = 10
+    ) -> List[VectorResult]:
+        """
+        Perform hybrid search for several semantic weights at once.
+        
+        The semantic search and keyword relevance scoring run once; the weighted
+        combination for every weight is computed in a single vectorized step.
+        
+        Args:
+            query: Query text
+            semantic_weights: Weights for semantic similarity (0.0 to 1.0)
+            k: Number of results to return per weight
+            
+        Returns:
+            List[VectorResult]: Hybrid search results, one per weight
+        """
         try:
             # Perform semantic search
             semantic_results = await self.similarity_search(query, k=k*2)  # Get more for filtering
+            documents = semantic_results.documents
+            
+            if not documents:
+                return [
+                    VectorResult(documents=[], similarities=[], query_embedding=semantic_results.query_embedding)
+                    for _ in semantic_weights
+                ]
             
-            # Re-rank results with hybrid scoring
-            reranked_docs, reranked_scores = await self.rerank_results(
-                semantic_results.documents,
+            # Keyword relevance for each document, kept in the semantic result order
+            relevance_scores = self._calculate_relevance_scores(
+                documents,
                 semantic_results.similarities,
                 query
             )
             
-            # Apply semantic weight to combine scores
-            final_scores = []
-            for semantic_score, relevance_score in zip(semantic_results.similarities, reranked_scores):
-                hybrid_score = (semantic_weight * semantic_score + 
-                              (1 - semantic_weight) * relevance_score)
-                final_scores.append(hybrid_score)
+            # Combine scores for all weights at once: rows are weights, columns documents
+            weights = np.asarray(semantic_weights, dtype=np.float64)[:, None]
+            semantic = np.asarray(semantic_results.similarities, dtype=np.float64)
+            relevance = np.asarray(relevance_scores, dtype=np.float64)
+            hybrid_scores = weights * semantic + (1.0 - weights) * relevance
+            rankings = np.argsort(-hybrid_scores, axis=1, kind="stable")[:, :k]
             
-            # Take top k results
-            top_k_docs = reranked_docs[:k]
-            top_k_scores = final_scores[:k]
+            results = []
+            for scores, ranking in zip(hybrid_scores, rankings):
+                results.append(VectorResult(
+                    documents=[documents[i] for i in ranking],
+                    similarities=scores[ranking].tolist(),
+                    query_embedding=semantic_results.query_embedding
+                ))
             
-            logger.debug(f"Hybrid search returned {len(top_k_docs)} results")
+            logger.debug(f"Hybrid search returned {len(rankings[0])} results for {len(semantic_weights)} weights")
             
-            return VectorResult(
-                documents=top_k_docs,
-                similarities=top_k_scores,
-                query_embedding=semantic_results.query_embedding
-            )
+            return results
             
         except Exception as e:
             logger.error(f"Hybrid search failed: {e}")
@@ -787,7 +1061,7 @@ class VectorRetrievalAgent(VectorRetrievalInterface):
             "model_info": model_info,
             "cache_stats": cache_stats,
             "vector_db_config": {
-                "type": "pinecone",
+                "type": self.vector_store.value if self.vector_store else "pinecone",
                 "collection_name": self.collection_name
             },
             "document_count": asyncio.run(self.get_document_count()) if hasattr(self, '_vector_initialized') else 0
@@ -9,6 +9,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, Field, validator
 from typing import Optional, Dict, Any, List
+import json
 import logging
 import time
 import uuid
@@ -281,6 +282,11 @@ class DocumentUploadRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
 
+class DocumentBatchUploadRequest(BaseModel):
+    """Request model for batch document upload."""
+    documents: List[DocumentUploadRequest] = Field(..., description="Documents to ingest", min_length=1, max_length=100)
+
+
 class DocumentUploadResponse(BaseModel):
     """Response model for document upload."""
     document_id: str = Field(..., description="Unique identifier for uploaded document")
@@ -747,29 +753,20 @@ async def upload_document(request: DocumentUploadRequest):
     - Domain-specific relationship types
     - Custom schema mapping
     """
-    start_time = time.time()
-    document_id = str(uuid.uuid4())
+    return await _ingest_document(request, _create_ingestion_pipeline())
+
+
+def _create_ingestion_pipeline():
+    """
+    Build a dual-storage ingestion pipeline backed by the configured databases.
     
+    Raises:
+        HTTPException: 500 if a database manager or service fails to initialize
+    """
     try:
-        logger.info(f"Ingesting document {document_id}: {request.title}")
-        
-        # Create document object
-        from src.core.models import Document, DocumentType
-        document = Document(
-            id=document_id,
-            title=request.title,
-            content=request.content,
-            document_type=DocumentType.TEXT,
-            source=request.source or "",
-            domain=request.domain or "general",
-            metadata=request.metadata or {}
-        )
-        
-        # Initialize and use ingestion pipeline
         from src.core.ingestion_pipeline import DualStorageIngestionPipeline
         from src.core.database import get_neo4j_manager, get_vector_manager
         from src.core.document_processor import DocumentProcessor
-        from src.core.domain_processor import DomainProcessorManager
         from src.core.mapping_service import EntityVectorMappingService
         
         # Get database managers
@@ -778,7 +775,6 @@ async def upload_document(request: DocumentUploadRequest):
         
         # Initialize processors
         document_processor = DocumentProcessor()
-        domain_processor = DomainProcessorManager()
         mapping_service = EntityVectorMappingService()
         
         # Initialize the mapping service
@@ -790,7 +786,7 @@ async def upload_document(request: DocumentUploadRequest):
         embedding_service.initialize()
         
         # Create ingestion pipeline
-        pipeline = DualStorageIngestionPipeline(
+        return DualStorageIngestionPipeline(
             document_processor=document_processor,
             graph_db_manager=neo4j_manager,
             vector_db_manager=vector_manager,
@@ -798,6 +794,34 @@ async def upload_document(request: DocumentUploadRequest):
             embedding_service=embedding_service
         )
         
+    except Exception as e:
+        logger.error(f"Error creating ingestion pipeline: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error during document ingestion: {str(e)}"
+        )
+
+
+async def _ingest_document(request: DocumentUploadRequest, pipeline) -> DocumentUploadResponse:
+    """Ingest a single uploaded document through an existing pipeline."""
+    start_time = time.time()
+    document_id = str(uuid.uuid4())
+    
+    try:
+        logger.info(f"Ingesting document {document_id}: {request.title}")
+        
+        # Create document object
+        from src.core.models import Document, DocumentType
+        document = Document(
+            id=document_id,
+            title=request.title,
+            content=request.content,
+            document_type=DocumentType.TEXT,
+            source=request.source or "",
+            domain=request.domain or "general",
+            metadata=request.metadata or {}
+        )
+        
         # Actually ingest the document
         logger.info(f"Processing document through ingestion pipeline...")
         result = await pipeline.ingest_document(document)
@@ -846,7 +870,8 @@ async def upload_document_file(
     file: UploadFile = File(..., description="Document file to upload"),
     title: str = Form(..., description="Document title"),
     source: Optional[str] = Form(None, description="Source URL or reference"),
-    domain: str = Form(default="general", description="Knowledge domain")
+    domain: str = Form(default="general", description="Knowledge domain"),
+    metadata: Optional[str] = Form(None, description="Additional metadata as a JSON object")
 ):
     """
     Upload a document file for ingestion.
@@ -877,6 +902,18 @@ async def upload_document_file(
                 detail="File must be valid UTF-8 text"
             )
         
+        extra_metadata = {}
+        if metadata:
+            try:
+                extra_metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                extra_metadata = None
+            if not isinstance(extra_metadata, dict):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="metadata must be a JSON object"
+                )
+        
         # Create document request
         doc_request = DocumentUploadRequest(
             title=title,
@@ -884,6 +921,7 @@ async def upload_document_file(
             source=source,
             domain=domain,
             metadata={
+                **extra_metadata,
                 "filename": file.filename,
                 "content_type": file.content_type,
                 "file_size": len(content)
@@ -913,6 +951,38 @@ async def upload_document_file(
         )
 
 
+@app.post("/documents/upload-batch", response_model=List[DocumentUploadResponse], tags=["documents"])
+async def upload_documents_batch(request: DocumentBatchUploadRequest):
+    """
+    Upload several documents for ingestion in one request.
+    
+    The ingestion pipeline is built once and reused for every document in
+    the batch. A failing document is reported with status "error" without
+    aborting the rest of the batch.
+    """
+    pipeline = _create_ingestion_pipeline()
+    responses = []
+    
+    for doc_request in request.documents:
+        try:
+            responses.append(await _ingest_document(doc_request, pipeline))
+        except HTTPException as e:
+            responses.append(DocumentUploadResponse(
+                document_id="",
+                status="error",
+                message=f"Document '{doc_request.title}' failed: {e.detail}"
+            ))
+        except Exception as e:
+            logger.error(f"Error ingesting batch document '{doc_request.title}': {str(e)}")
+            responses.append(DocumentUploadResponse(
+                document_id="",
+                status="error",
+                message=f"Document '{doc_request.title}' failed: {str(e)}"
+            ))
+    
+    return responses
+
+
 @app.get("/agents/status", response_model=AgentStatusResponse, tags=["agents"])
 async def get_agents_status():
     """
@@ -1842,6 +1912,13 @@ async def shutdown_event():
         # Shutdown message queue
         await shutdown_message_queue()
         
+        # Stop background workers owned by registered agents
+        if agent_registry is not None:
+            for agent_info in list(agent_registry.agents.values()):
+                aclose = getattr(agent_info.agent_instance, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        
         # Shutdown agent registry
         shutdown_agent_registry()
         
@@ -16,6 +16,8 @@ class DatabaseConfig(BaseSettings):
     neo4j_user: str = Field(default="neo4j", env="NEO4J_USER")
     neo4j_password: str = Field(default="password", env="NEO4J_PASSWORD")
     neo4j_database: str = Field(default="neo4j", env="NEO4J_DATABASE")
+    neo4j_pool_size: int = Field(default_factory=lambda: max(16, (os.cpu_count() or 1) * 2), env="NEO4J_POOL_SIZE")
+    neo4j_connection_acquisition_timeout: float = Field(default=30.0, env="NEO4J_CONNECTION_ACQUISITION_TIMEOUT")
     
     # Chroma Configuration
     chroma_host: str = Field(default="localhost", env="CHROMA_HOST")
@@ -4,12 +4,12 @@ Database connection management for Neo4j and Vector Databases (Pinecone/Chroma).
 
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
 from contextlib import asynccontextmanager, contextmanager
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-from neo4j import GraphDatabase, Driver, Session, Result
+from neo4j import GraphDatabase, AsyncGraphDatabase, Driver, AsyncDriver, Session, Result
 from neo4j.exceptions import ServiceUnavailable, TransientError, ClientError
 import chromadb
 from chromadb.api import ClientAPI
@@ -43,21 +43,28 @@ class Neo4jConnectionManager:
     Neo4j connection manager for local Neo4j instances.
     """
     
-    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j"):
+    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j",
+                 max_connection_pool_size: int = 100, connection_acquisition_timeout: float = 60.0):
         self.uri = uri
         self.user = user
         self.password = password
         self.database = database
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
         self.driver: Optional[Driver] = None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Async drivers are bound to the event loop they were created on
+        self._async_drivers: Dict[asyncio.AbstractEventLoop, AsyncDriver] = {}
         
     def connect(self) -> None:
         """Establish connection to Neo4j database."""
         try:
-            # Simple driver configuration for local Neo4j
+            # Pool is shared by every query issued through this manager
             self.driver = GraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                keep_alive=True
             )
             
             # Test the connection
@@ -70,12 +77,77 @@ class Neo4jConnectionManager:
             raise Neo4jConnectionError(f"Failed to connect to Neo4j: {e}")
     
     def disconnect(self) -> None:
-        """Close the Neo4j driver connection."""
+        """Close the Neo4j driver connection and any async drivers it can reach."""
+        self._discard_closed_loop_drivers()
+        if self._async_drivers:
+            try:
+                asyncio.get_running_loop()
+                logger.warning("disconnect() called inside an event loop; "
+                               "use disconnect_async() to close the async drivers")
+            except RuntimeError:
+                drivers, self._async_drivers = self._async_drivers, {}
+                for loop, driver in drivers.items():
+                    self._close_async_driver_blocking(loop, driver)
+        
         if self.driver:
             self.driver.close()
             self.driver = None
             logger.info("Disconnected from Neo4j")
     
+    async def disconnect_async(self) -> None:
+        """Close both the async and the sync Neo4j drivers."""
+        await self.close_async_driver()
+        self.disconnect()
+    
+    async def close_async_driver(self) -> None:
+        """Close the async drivers only; they are recreated on the next async query."""
+        self._discard_closed_loop_drivers()
+        drivers, self._async_drivers = self._async_drivers, {}
+        current_loop = asyncio.get_running_loop()
+        
+        for loop, driver in drivers.items():
+            if loop is current_loop:
+                try:
+                    await driver.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close Neo4j async driver: {e}")
+            else:
+                await asyncio.to_thread(self._close_async_driver_blocking, loop, driver)
+    
+    def _close_async_driver_blocking(self, loop: asyncio.AbstractEventLoop,
+                                     driver: AsyncDriver) -> None:
+        """Close an async driver on its own loop from a thread with no running loop."""
+        try:
+            if loop.is_running():
+                # The loop is serving another thread; schedule the close there
+                asyncio.run_coroutine_threadsafe(driver.close(), loop).result()
+            else:
+                loop.run_until_complete(driver.close())
+        except Exception as e:
+            logger.warning(f"Failed to close Neo4j async driver: {e}")
+    
+    def _discard_closed_loop_drivers(self) -> None:
+        """Drop drivers whose loop is closed; their connections can no longer be closed."""
+        for loop in [loop for loop in self._async_drivers if loop.is_closed()]:
+            logger.debug("Discarding Neo4j async driver bound to a closed event loop")
+            del self._async_drivers[loop]
+    
+    def _get_async_driver(self) -> AsyncDriver:
+        """Create the async driver for the running loop on first use, sharing the sync pool settings."""
+        loop = asyncio.get_running_loop()
+        driver = self._async_drivers.get(loop)
+        if driver is None:
+            self._discard_closed_loop_drivers()
+            driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                keep_alive=True
+            )
+            self._async_drivers[loop] = driver
+        return driver
+    
     @contextmanager
     def session(self, **kwargs):
         """Context manager for Neo4j sessions."""
@@ -104,13 +176,30 @@ class Neo4jConnectionManager:
             raise Neo4jConnectionError("Not connected to Neo4j. Call connect() first.")
         
         try:
-            with self.session() as session:
-                result = session.run(query, parameters or {})
-                return [record.data() for record in result]
+            # Driver-level execute_query manages session reuse and retries itself
+            records, _, _ = self.driver.execute_query(
+                query, parameters or {}, database_=self.database
+            )
+            return [record.data() for record in records]
         except Exception as e:
             logger.error(f"Query failed: {e}")
             raise Neo4jConnectionError(f"Query failed: {e}")
     
+    def execute_queries(self, queries: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several Cypher queries in one session and one write transaction.
+        
+        Args:
+            queries: (query, parameters) pairs, run in order
+            
+        Returns:
+            Result records as dictionaries, one list per query
+        """
+        def run_all(tx):
+            return [tx.run(query, parameters or {}).data() for query, parameters in queries]
+        
+        return self.execute_write_transaction(run_all)
+    
     async def execute_query_async(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query asynchronously.
@@ -122,8 +211,44 @@ class Neo4jConnectionManager:
         Returns:
             List of result records as dictionaries
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self.execute_query, query, parameters)
+        if not self.driver:
+            raise Neo4jConnectionError("Not connected to Neo4j. Call connect() first.")
+        
+        try:
+            records, _, _ = await self._get_async_driver().execute_query(
+                query, parameters or {}, database_=self.database
+            )
+            return [record.data() for record in records]
+        except Exception as e:
+            logger.error(f"Async query failed: {e}")
+            raise Neo4jConnectionError(f"Query failed: {e}")
+    
+    async def stream_query_async(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query asynchronously, yielding records as they arrive.
+        
+        Records are not buffered, so a consumer that stops early leaves the rest
+        of the result unfetched. Close the generator (e.g. with contextlib.aclosing)
+        to release the session promptly.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Yields:
+            Result records as dictionaries
+        """
+        if not self.driver:
+            raise Neo4jConnectionError("Not connected to Neo4j. Call connect() first.")
+        
+        try:
+            async with self._get_async_driver().session(database=self.database) as session:
+                result = await session.run(query, parameters or {})
+                async for record in result:
+                    yield record.data()
+        except Exception as e:
+            logger.error(f"Async streaming query failed: {e}")
+            raise Neo4jConnectionError(f"Query failed: {e}")
     
     def execute_write_transaction(self, transaction_function, **kwargs) -> Any:
         """
@@ -233,7 +358,9 @@ def get_neo4j_manager() -> Neo4jConnectionManager:
             uri=config.database.neo4j_uri,
             user=config.database.neo4j_user,
             password=config.database.neo4j_password,
-            database=config.database.neo4j_database  # Use the actual database name from config
+            database=config.database.neo4j_database,  # Use the actual database name from config
+            max_connection_pool_size=config.database.neo4j_pool_size,
+            connection_acquisition_timeout=config.database.neo4j_connection_acquisition_timeout
         )
     
     return _neo4j_manager
@@ -326,25 +453,36 @@ class ChromaConnectionManager:
         if not self.client:
             raise ChromaConnectionError("Not connected to Chroma. Call connect() first.")
         
+        return self.get_or_create_collection(name, metadata, embedding_function)
+    
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None,
+                                 embedding_function: Optional[Any] = None) -> Any:
+        """
+        Get a collection, creating it if it does not exist, in a single call.
+        
+        Args:
+            name: Collection name
+            metadata: Optional metadata used if the collection is created
+            embedding_function: Optional custom embedding function
+            
+        Returns:
+            Chroma collection object
+        """
+        if not self.client:
+            raise ChromaConnectionError("Not connected to Chroma. Call connect() first.")
+        
+        if name in self.collections:
+            return self.collections[name]
+        
         try:
-            # Check if collection already exists
-            try:
-                collection = self.client.get_collection(name=name, embedding_function=embedding_function)
-                logger.info(f"Collection '{name}' already exists, returning existing collection")
-                self.collections[name] = collection
-                return collection
-            except Exception:
-                # Collection doesn't exist, create it
-                pass
-            
-            collection = self.client.create_collection(
+            collection = self.client.get_or_create_collection(
                 name=name,
-                metadata=metadata or {},
+                metadata=metadata or None,
                 embedding_function=embedding_function
             )
             
             self.collections[name] = collection
-            logger.info(f"Created collection '{name}' in Chroma")
+            logger.info(f"Using collection '{name}' in Chroma")
             return collection
             
         except Exception as e:
@@ -442,6 +580,52 @@ class ChromaConnectionManager:
         except Exception as e:
             raise ChromaConnectionError(f"Failed to add documents to collection '{collection_name}': {e}")
     
+    def batch_add(self, collection_name: str, ids: List[str],
+                  embeddings: Optional[List[List[float]]] = None,
+                  metadatas: Optional[List[Dict[str, Any]]] = None,
+                  documents: Optional[List[str]] = None,
+                  batch_size: int = 256,
+                  upsert: bool = False) -> int:
+        """
+        Add records to a collection in chunks of `batch_size` per call.
+        
+        Args:
+            collection_name: Name of the collection
+            ids: Record IDs
+            embeddings: Optional precomputed embeddings (aligned with ids)
+            metadatas: Optional metadata dictionaries (aligned with ids)
+            documents: Optional document texts (aligned with ids)
+            batch_size: Maximum number of records per add call
+            upsert: Overwrite records whose IDs already exist instead of
+                rejecting them, so the same IDs can be written again
+            
+        Returns:
+            Number of records added or updated
+        """
+        collection = self.get_collection(collection_name)
+        write = collection.upsert if upsert else collection.add
+        
+        columns = {"embeddings": embeddings, "metadatas": metadatas, "documents": documents}
+        columns = {key: iter(values) for key, values in columns.items() if values is not None}
+        id_iter = iter(ids)
+        added = 0
+        
+        try:
+            while True:
+                batch_ids = list(islice(id_iter, batch_size))
+                if not batch_ids:
+                    break
+                batch = {key: list(islice(values, len(batch_ids))) for key, values in columns.items()}
+                write(ids=batch_ids, **batch)
+                added += len(batch_ids)
+            
+            action = "Upserted" if upsert else "Added"
+            logger.info(f"{action} {added} records to collection '{collection_name}' in batches of {batch_size}")
+            return added
+            
+        except Exception as e:
+            raise ChromaConnectionError(f"Failed to batch add to collection '{collection_name}': {e}")
+    
     def query_collection(self, collection_name: str, query_texts: List[str], 
                         n_results: int = 10, where: Optional[Dict[str, Any]] = None,
                         where_document: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -516,6 +700,39 @@ class ChromaConnectionManager:
         except Exception as e:
             raise ChromaConnectionError(f"Failed to delete documents from collection '{collection_name}': {e}")
     
+    def count_chunks_by_document(self, collection_name: str, 
+                                 document_ids: List[str]) -> Dict[str, int]:
+        """
+        Count stored chunks per document using a single metadata lookup.
+        
+        Args:
+            collection_name: Name of the collection
+            document_ids: Document IDs to count chunks for
+            
+        Returns:
+            Mapping of document ID to chunk count (documents without chunks are omitted)
+        """
+        if not document_ids:
+            return {}
+        
+        collection = self.get_collection(collection_name)
+        
+        try:
+            results = collection.get(
+                where={"document_id": {"$in": list(document_ids)}},
+                include=["metadatas"]
+            )
+            
+            counts: Dict[str, int] = {}
+            for metadata in results.get("metadatas") or []:
+                doc_id = (metadata or {}).get("document_id")
+                if doc_id is not None:
+                    counts[doc_id] = counts.get(doc_id, 0) + 1
+            return counts
+            
+        except Exception as e:
+            raise ChromaConnectionError(f"Failed to count chunks in collection '{collection_name}': {e}")
+    
     def get_collection_stats(self, collection_name: str) -> Dict[str, Any]:
         """
         Get statistics for a collection.
@@ -19,8 +19,50 @@ except ImportError:
     SPACY_AVAILABLE = False
     spacy = None
 
+try:
+    import spacy_accelerate
+    SPACY_ACCELERATE_AVAILABLE = True
+except ImportError:
+    SPACY_ACCELERATE_AVAILABLE = False
+
+try:
+    import deepsparse
+    DEEPSPARSE_AVAILABLE = True
+except ImportError:
+    DEEPSPARSE_AVAILABLE = False
+
 from .models import Document, Entity, EntityType, DocumentType
 
+# NER inference backends accepted by DocumentProcessor
+NER_BACKENDS = ("spacy", "spacy_accelerate", "deepsparse")
+
+# Pruned (80%) int8-quantized DistilBERT CoNLL-2003 NER model from SparseZoo
+DEEPSPARSE_NER_MODEL = "zoo:nlp/token_classification/distilbert-none/pytorch/huggingface/conll2003/pruned80_quant-none-vnni"
+
+
+def default_ner_backend() -> str:
+    """
+    Pick the fastest installed NER backend for this machine.
+    
+    CUDA is only probed when spacy-accelerate is installed, so torch is not
+    imported just to choose between the CPU backends.
+    
+    Returns:
+        "spacy_accelerate" on CUDA machines with spacy-accelerate, otherwise
+        "deepsparse" when DeepSparse is installed, otherwise "spacy"
+    """
+    if SPACY_ACCELERATE_AVAILABLE:
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return "spacy_accelerate"
+        except ImportError:
+            pass
+    
+    if DEEPSPARSE_AVAILABLE:
+        return "deepsparse"
+    return "spacy"
+
 
 class ChunkingStrategy(str, Enum):
     """Available text chunking strategies."""
@@ -68,16 +110,29 @@ class EntityRelationship:
 class DocumentProcessor:
     """Main document processing system."""
     
-    def __init__(self, spacy_model: str = "en_core_web_sm", domain_type: Optional[str] = None):
+    def __init__(self, spacy_model: str = "en_core_web_sm", domain_type: Optional[str] = None,
+                 backend: str = "spacy"):
         """
         Initialize the document processor.
         
         Args:
             spacy_model: Name of the spaCy model to use for NLP processing
             domain_type: Optional domain type for domain-specific processing
+            backend: NER inference backend. "spacy_accelerate" runs transformer
+                pipelines through ONNX Runtime (TensorRT, FP16) when spacy-accelerate
+                is installed; "deepsparse" runs a sparse int8 NER model on CPU
         """
+        if backend not in NER_BACKENDS:
+            raise ValueError(f"Unknown NER backend '{backend}', expected one of {NER_BACKENDS}")
+        
         self.nlp = None
         self.domain_type = domain_type
+        self.backend = backend
+        self._ner_pipeline = None
+        
+        if backend == "deepsparse" and not DEEPSPARSE_AVAILABLE:
+            print("Warning: DeepSparse not available. Using the spaCy backend.")
+            self.backend = "spacy"
         self.domain_manager = None
         
         # Initialize domain manager lazily to avoid circular imports
@@ -101,12 +156,16 @@ class DocumentProcessor:
                 except ValueError:
                     # Pipeline already has NER
                     pass
+            
+            if self.nlp and backend == "spacy_accelerate":
+                self.nlp = self._accelerate_pipeline(self.nlp)
         else:
             print("Warning: spaCy not available. Using fallback entity extraction.")
         
         # Entity type mapping from spaCy labels to our EntityType enum
         self.entity_type_mapping = {
             "PERSON": EntityType.PERSON,
+            "PER": EntityType.PERSON,
             "ORG": EntityType.ORGANIZATION,
             "GPE": EntityType.LOCATION,
             "LOC": EntityType.LOCATION,
@@ -382,6 +441,18 @@ class DocumentProcessor:
         
         return chunks
     
+    def _accelerate_pipeline(self, nlp):
+        """Convert the pipeline's transformer to ONNX Runtime, keeping it unchanged on failure."""
+        if not SPACY_ACCELERATE_AVAILABLE:
+            print("Warning: spacy-accelerate not available. Using the standard spaCy pipeline.")
+            return nlp
+        
+        try:
+            return spacy_accelerate.optimize(nlp, precision="fp16", provider="tensorrt")
+        except Exception as e:
+            print(f"Warning: spacy-accelerate optimization failed: {e}")
+            return nlp
+    
     def extract_entities(self, text: str, use_domain_specific: bool = True) -> List[ExtractedEntity]:
         """
         Extract entities from text using NLP processing and domain-specific patterns.
@@ -393,58 +464,150 @@ class DocumentProcessor:
         Returns:
             List of extracted entities
         """
-        entities = []
+        return self.extract_entities_batch([text], use_domain_specific=use_domain_specific)[0]
+    
+    def extract_entities_batch(
+        self,
+        texts: List[str],
+        use_domain_specific: bool = True,
+        domain_types: Optional[List[Optional[str]]] = None,
+        batch_size: int = 32
+    ) -> List[List[ExtractedEntity]]:
+        """
+        Extract entities from several texts, running the NER model over them in batches.
         
-        # Initialize domain manager if needed
+        Args:
+            texts: Texts to extract entities from
+            use_domain_specific: Whether to use domain-specific extraction
+            domain_types: Optional domain per text; None entries use the current domain
+            batch_size: Number of texts per NER model batch
+            
+        Returns:
+            Extracted entities for each text, in input order
+        """
+        if domain_types is not None and len(domain_types) != len(texts):
+            raise ValueError("domain_types must have one entry per text")
+        
+        results: List[List[ExtractedEntity]] = [[] for _ in texts]
+        
+        # First, try domain-specific extraction if enabled
         if use_domain_specific:
             self._initialize_domain_manager()
-        
-        # First, try domain-specific extraction if enabled and domain is set
-        if use_domain_specific and self.domain_manager and self.domain_manager.current_domain:
-            try:
-                domain_entities = self.domain_manager.extract_entities(text)
-                entities.extend(domain_entities)
-            except Exception as e:
-                print(f"Warning: Domain-specific extraction failed: {e}")
+            for i, text in enumerate(texts):
+                domain_type = domain_types[i] if domain_types else None
+                results[i].extend(self._extract_domain_entities(text, domain_type))
         
         # Then use general NLP extraction
-        if self.nlp:
+        ner_pipeline = self._get_ner_pipeline() if self.backend == "deepsparse" else None
+        if ner_pipeline is not None:
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start:start + batch_size]
+                output = ner_pipeline(inputs=batch)
+                for offset, predictions in enumerate(output.predictions):
+                    results[start + offset].extend(
+                        self._entities_from_predictions(predictions, batch[offset])
+                    )
+        elif self.nlp:
             # Use spaCy for entity extraction
-            doc = self.nlp(text)
-            
-            for ent in doc.ents:
-                # Get context around the entity (50 characters before and after)
-                context_start = max(0, ent.start_char - 50)
-                context_end = min(len(text), ent.end_char + 50)
-                context = text[context_start:context_end].strip()
-                
-                # Map spaCy label to our EntityType
-                entity_type = self.entity_type_mapping.get(ent.label_, EntityType.GENERIC)
-                
-                extracted_entity = ExtractedEntity(
-                    text=ent.text.strip(),
-                    label=entity_type.value,
-                    start_position=ent.start_char,
-                    end_position=ent.end_char,
-                    confidence=0.8,  # Default confidence for spaCy entities
-                    context=context,
-                    properties={
-                        "spacy_label": ent.label_,
-                        "lemma": ent.lemma_ if hasattr(ent, 'lemma_') else ent.text,
-                        "pos": ent.root.pos_ if hasattr(ent, 'root') else None,
-                        "extraction_method": "spacy"
-                    }
-                )
-                entities.append(extracted_entity)
+            for i, doc in enumerate(self.nlp.pipe(texts, batch_size=batch_size)):
+                results[i].extend(self._entities_from_doc(doc, texts[i]))
         else:
             # Fallback: simple pattern-based entity extraction
-            fallback_entities = self._extract_entities_fallback(text)
-            entities.extend(fallback_entities)
+            for i, text in enumerate(texts):
+                results[i].extend(self._extract_entities_fallback(text))
         
         # Remove duplicates while preserving domain-specific entities
-        unique_entities = self._deduplicate_entities(entities)
+        return [self._deduplicate_entities(entities) for entities in results]
+    
+    def _extract_domain_entities(self, text: str, domain_type: Optional[str] = None) -> List[ExtractedEntity]:
+        """Run domain-specific extraction for the given domain, or the current one."""
+        if not self.domain_manager:
+            return []
         
-        return unique_entities
+        domain_enum = None
+        if domain_type:
+            from .domain_processor import DomainType
+            domain_enum = DomainType(domain_type)
+        elif not self.domain_manager.current_domain:
+            return []
+        
+        try:
+            return self.domain_manager.extract_entities(text, domain_enum)
+        except Exception as e:
+            print(f"Warning: Domain-specific extraction failed: {e}")
+            return []
+    
+    def _entities_from_doc(self, doc, text: str) -> List[ExtractedEntity]:
+        """Convert the entities of a spaCy Doc into extracted entities."""
+        entities = []
+        
+        for ent in doc.ents:
+            # Get context around the entity (50 characters before and after)
+            context_start = max(0, ent.start_char - 50)
+            context_end = min(len(text), ent.end_char + 50)
+            context = text[context_start:context_end].strip()
+            
+            # Map spaCy label to our EntityType
+            entity_type = self.entity_type_mapping.get(ent.label_, EntityType.GENERIC)
+            
+            extracted_entity = ExtractedEntity(
+                text=ent.text.strip(),
+                label=entity_type.value,
+                start_position=ent.start_char,
+                end_position=ent.end_char,
+                confidence=0.8,  # Default confidence for spaCy entities
+                context=context,
+                properties={
+                    "spacy_label": ent.label_,
+                    "lemma": ent.lemma_ if hasattr(ent, 'lemma_') else ent.text,
+                    "pos": ent.root.pos_ if hasattr(ent, 'root') else None,
+                    "extraction_method": "spacy"
+                }
+            )
+            entities.append(extracted_entity)
+        
+        return entities
+    
+    def _get_ner_pipeline(self):
+        """Create the DeepSparse NER pipeline on first use."""
+        if self._ner_pipeline is None:
+            try:
+                self._ner_pipeline = deepsparse.Pipeline.create(
+                    task="ner",
+                    model_path=DEEPSPARSE_NER_MODEL,
+                    aggregation_strategy="simple"
+                )
+            except Exception as e:
+                print(f"Warning: Failed to load DeepSparse NER pipeline: {e}. Using the spaCy backend.")
+                self.backend = "spacy"
+        return self._ner_pipeline
+    
+    def _entities_from_predictions(self, predictions, text: str) -> List[ExtractedEntity]:
+        """Convert DeepSparse token classification predictions into extracted entities."""
+        entities = []
+        
+        for prediction in predictions:
+            # Aggregated predictions carry the bare CoNLL label (PER, ORG, LOC, MISC)
+            label = prediction.entity.split("-")[-1]
+            entity_type = self.entity_type_mapping.get(label, EntityType.GENERIC)
+            
+            context_start = max(0, prediction.start - 50)
+            context_end = min(len(text), prediction.end + 50)
+            
+            entities.append(ExtractedEntity(
+                text=text[prediction.start:prediction.end].strip(),
+                label=entity_type.value,
+                start_position=prediction.start,
+                end_position=prediction.end,
+                confidence=float(prediction.score),
+                context=text[context_start:context_end].strip(),
+                properties={
+                    "ner_label": label,
+                    "extraction_method": "deepsparse"
+                }
+            ))
+        
+        return entities
     
     def _extract_entities_fallback(self, text: str) -> List[ExtractedEntity]:
         """Fallback entity extraction using simple patterns."""
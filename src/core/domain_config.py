@@ -103,7 +103,7 @@ class DomainConfigurationManager:
             relationship_patterns=relationship_patterns,
             graph_constraints=schema_data.get('graph_constraints', []),
             metadata=schema_data.get('metadata', {})
-        )
+        ).compile_patterns()
     
     def _schema_to_dict(self, schema: DomainSchema) -> Dict[str, Any]:
         """Convert DomainSchema object to dictionary."""
@@ -204,69 +204,62 @@ class DomainConfigurationManager:
             if schema:
                 # Create a generic extractor with the loaded schema
                 from .domain_processor import BaseDomainExtractor
-                import re
                 
                 class ConfigurableExtractor(BaseDomainExtractor):
                     def extract_entities(self, text: str):
                         entities = []
                         seen_entities = set()
                         
-                        for pattern_name, pattern_info in self.entity_patterns.items():
-                            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
+                        for pattern_name, pattern_info, start, end in self._find_entity_matches(text):
+                            entity_text = text[start:end].strip()
+                            entity_key = (entity_text.lower(), pattern_info.entity_type.value)
                             
-                            for match in matches:
-                                entity_text = match.group().strip()
-                                entity_key = (entity_text.lower(), pattern_info.entity_type.value)
+                            if entity_key not in seen_entities:
+                                seen_entities.add(entity_key)
+                                
+                                context_start = max(0, start - 50)
+                                context_end = min(len(text), end + 50)
+                                context = text[context_start:context_end].strip()
                                 
-                                if entity_key not in seen_entities:
-                                    seen_entities.add(entity_key)
-                                    
-                                    context_start = max(0, match.start() - 50)
-                                    context_end = min(len(text), match.end() + 50)
-                                    context = text[context_start:context_end].strip()
-                                    
-                                    from .document_processor import ExtractedEntity
-                                    entity = ExtractedEntity(
-                                        text=entity_text,
-                                        label=pattern_info.entity_type.value,
-                                        start_position=match.start(),
-                                        end_position=match.end(),
-                                        confidence=pattern_info.confidence,
-                                        context=context,
-                                        properties={
-                                            "domain": self.domain_schema.domain_type.value,
-                                            "pattern_name": pattern_name,
-                                            "extraction_method": "domain_specific"
-                                        }
-                                    )
-                                    entities.append(entity)
+                                from .document_processor import ExtractedEntity
+                                entity = ExtractedEntity(
+                                    text=entity_text,
+                                    label=pattern_info.entity_type.value,
+                                    start_position=start,
+                                    end_position=end,
+                                    confidence=pattern_info.confidence,
+                                    context=context,
+                                    properties={
+                                        "domain": self.domain_schema.domain_type.value,
+                                        "pattern_name": pattern_name,
+                                        "extraction_method": "domain_specific"
+                                    }
+                                )
+                                entities.append(entity)
                         
                         return entities
                     
                     def identify_relationships(self, text: str, entities):
                         relationships = []
                         
-                        for pattern_name, pattern_info in self.relationship_patterns.items():
-                            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
+                        for pattern_name, pattern_info, match in self._find_relationship_matches(text):
+                            source_text = match.group(pattern_info.source_group).strip()
+                            target_text = match.group(pattern_info.target_group).strip()
                             
-                            for match in matches:
-                                source_text = match.group(pattern_info.source_group).strip()
-                                target_text = match.group(pattern_info.target_group).strip()
-                                
-                                source_entity = self._find_matching_entity(source_text, entities)
-                                target_entity = self._find_matching_entity(target_text, entities)
-                                
-                                if source_entity and target_entity and source_entity != target_entity:
-                                    from .document_processor import EntityRelationship
-                                    relationship = EntityRelationship(
-                                        source_entity=source_entity,
-                                        target_entity=target_entity,
-                                        relationship_type=pattern_info.relationship_type,
-                                        confidence=pattern_info.confidence,
-                                        context=match.group(0),
-                                        evidence_text=match.group(0)
-                                    )
-                                    relationships.append(relationship)
+                            source_entity = self._find_matching_entity(source_text, entities)
+                            target_entity = self._find_matching_entity(target_text, entities)
+                            
+                            if source_entity and target_entity and source_entity != target_entity:
+                                from .document_processor import EntityRelationship
+                                relationship = EntityRelationship(
+                                    source_entity=source_entity,
+                                    target_entity=target_entity,
+                                    relationship_type=pattern_info.relationship_type,
+                                    confidence=pattern_info.confidence,
+                                    context=match.group(0),
+                                    evidence_text=match.group(0)
+                                )
+                                relationships.append(relationship)
                         
                         return relationships
                     
@@ -378,7 +371,8 @@ class DomainConfigurationManager:
             }
         )
         
-        return schema
+        # Compile once here so later domain switches never touch the regex engine
+        return schema.compile_patterns()
     
     def export_domain_config(self, domain_type: DomainType, output_path: str):
         """
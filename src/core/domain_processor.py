@@ -7,15 +7,57 @@ for different knowledge domains like technical documentation, research papers, e
 
 import re
 import json
+import hashlib
+import inspect
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Set, Tuple, Type
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple, Type, Iterator, Pattern
+from dataclasses import dataclass, field, astuple
 from enum import Enum
 from pathlib import Path
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 from .document_processor import ExtractedEntity, EntityRelationship
 from .models import EntityType
 
+# Matches patterns of the form \b(?:alt1|alt2|...)\b
+_LITERAL_ALTERNATION = re.compile(r'^\\b\(\?:(.+)\)\\b$')
+# Matches relationship patterns of the form (\w+)\s+(?:verb1|verb2|...)\s+(\w+)
+_VERB_RELATIONSHIP = re.compile(
+    r'^\(\\w\+\+?\)\\s\+\+?(?:\(\?:(.+)\)|([^()|]+))\\s\+\+?\(\\w\+\+?\)$'
+)
+# Escapes that stand for a literal character inside an alternative
+_LITERAL_ESCAPES = set('.+-#/ ')
+_REGEX_METACHARS = set('.^$*+?()[]{}|\\')
+
+# Number of extraction results kept in memory by DomainProcessorManager
+EXTRACTION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str, flags: int) -> Pattern[str]:
+    """Compile a domain regex, shared by every schema that uses the same source."""
+    return re.compile(pattern, flags)
+
 
 class DomainType(str, Enum):
     """Supported knowledge domains."""
@@ -37,6 +79,14 @@ class EntityPattern:
     flags: int = re.IGNORECASE
     description: str = ""
     examples: List[str] = field(default_factory=list)
+    _compiled: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def compiled(self) -> Pattern[str]:
+        """Compiled regex, built once on first use."""
+        if self._compiled is None:
+            self._compiled = _compile_pattern(self.pattern, self.flags)
+        return self._compiled
 
 
 @dataclass
@@ -51,6 +101,14 @@ class RelationshipPattern:
     flags: int = re.IGNORECASE
     description: str = ""
     examples: List[str] = field(default_factory=list)
+    _compiled: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def compiled(self) -> Pattern[str]:
+        """Compiled regex, built once on first use."""
+        if self._compiled is None:
+            self._compiled = _compile_pattern(self.pattern, self.flags)
+        return self._compiled
 
 
 @dataclass
@@ -64,15 +122,468 @@ class DomainSchema:
     relationship_patterns: List[RelationshipPattern]
     graph_constraints: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def compile_patterns(self) -> "DomainSchema":
+        """
+        Compile every entity and relationship pattern up front.
+        
+        Invalid patterns raise re.error here instead of on first extraction.
+        
+        Returns:
+            The schema itself
+        """
+        for pattern_info in self.entity_patterns:
+            pattern_info.compiled
+        for pattern_info in self.relationship_patterns:
+            pattern_info.compiled
+        return self
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character is matched by regex \\w."""
+    return char.isalnum() or char == "_"
+
+
+def _parse_literal_alternation(pattern: str) -> Optional[List[str]]:
+    """
+    Split a \\b(?:a|b|c)\\b pattern into its literal alternatives.
+    
+    Returns:
+        The alternatives in pattern order, or None if the pattern is not a
+        plain ASCII literal alternation
+    """
+    match = _LITERAL_ALTERNATION.match(pattern)
+    if not match:
+        return None
+    return _split_literal_alternatives(match.group(1))
+
+
+def _split_literal_alternatives(body: str) -> Optional[List[str]]:
+    """
+    Split the inside of an alternation group into its literal alternatives.
+    
+    Returns:
+        The alternatives in pattern order, or None if any alternative uses
+        regex syntax or non-ASCII characters
+    """
+    alternatives = []
+    current = []
+    chars = iter(body)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, None)
+            if escaped not in _LITERAL_ESCAPES:
+                return None
+            current.append(escaped)
+        elif char == '|':
+            alternatives.append(''.join(current))
+            current = []
+        elif char in _REGEX_METACHARS:
+            return None
+        else:
+            current.append(char)
+    alternatives.append(''.join(current))
+    
+    if not all(alt and alt.isascii() for alt in alternatives):
+        return None
+    return alternatives
+
+
+class LiteralPatternMatcher:
+    """
+    Scans text once for every literal-alternation pattern of a domain.
+    
+    Patterns like \\b(?:React|Angular|Vue\\.js)\\b are compiled into a single
+    Aho-Corasick automaton. Results reproduce re.finditer exactly: leftmost,
+    non-overlapping matches, preferring earlier alternatives at the same start.
+    """
+    
+    SUPPORTED_FLAGS = (0, re.IGNORECASE)
+    
+    def __init__(self, patterns: Dict[str, Any]):
+        """
+        Build the automaton from patterns that are plain literal alternations.
+        
+        Args:
+            patterns: Mapping of pattern name to EntityPattern
+        """
+        self.pattern_names: List[str] = []
+        self._automaton = ahocorasick.Automaton()
+        
+        words: Dict[str, List[Tuple[int, int, str, bool]]] = {}
+        for name, pattern_info in patterns.items():
+            if pattern_info.flags not in self.SUPPORTED_FLAGS:
+                continue
+            alternatives = _parse_literal_alternation(pattern_info.pattern)
+            if alternatives is None:
+                continue
+            
+            pattern_index = len(self.pattern_names)
+            self.pattern_names.append(name)
+            ignore_case = bool(pattern_info.flags & re.IGNORECASE)
+            for alt_index, alternative in enumerate(alternatives):
+                words.setdefault(alternative.lower(), []).append(
+                    (pattern_index, alt_index, alternative, ignore_case)
+                )
+        
+        for word, targets in words.items():
+            self._automaton.add_word(word, (len(word), targets))
+        if words:
+            self._automaton.make_automaton()
+    
+    def __bool__(self) -> bool:
+        return bool(self.pattern_names)
+    
+    def scan(self, text: str) -> Optional[Dict[str, List[Tuple[int, int]]]]:
+        """
+        Find (start, end) spans for every literal pattern in one pass.
+        
+        Returns:
+            Spans keyed by pattern name, or None if the text is not ASCII and
+            callers should fall back to regex matching
+        """
+        if not text.isascii():
+            return None
+        
+        text_length = len(text)
+        hits: List[List[Tuple[int, int, int]]] = [[] for _ in self.pattern_names]
+        
+        for end_index, (length, targets) in self._automaton.iter(text.lower()):
+            start = end_index - length + 1
+            end = end_index + 1
+            for pattern_index, alt_index, alternative, ignore_case in targets:
+                if not ignore_case and text[start:end] != alternative:
+                    continue
+                # Emulate the \b anchors on both sides of the alternation
+                before = start > 0 and _is_word_char(text[start - 1])
+                after = end < text_length and _is_word_char(text[end])
+                if before == _is_word_char(alternative[0]) or after == _is_word_char(alternative[-1]):
+                    continue
+                hits[pattern_index].append((start, alt_index, end))
+        
+        spans: Dict[str, List[Tuple[int, int]]] = {}
+        for name, pattern_hits in zip(self.pattern_names, hits):
+            pattern_hits.sort()
+            pattern_spans = []
+            last_end = 0
+            for start, _, end in pattern_hits:
+                if start < last_end:
+                    continue
+                pattern_spans.append((start, end))
+                last_end = end
+            spans[name] = pattern_spans
+        
+        return spans
+
+
+class VerbRelationshipMatch:
+    """Minimal stand-in for re.Match produced by VerbRelationshipMatcher."""
+    
+    __slots__ = ("string", "_spans")
+    
+    def __init__(self, string: str, spans: Tuple[Tuple[int, int], ...]):
+        self.string = string
+        self._spans = spans
+    
+    def group(self, index: int = 0) -> str:
+        start, end = self._spans[index]
+        return self.string[start:end]
+    
+    def start(self, index: int = 0) -> int:
+        return self._spans[index][0]
+    
+    def end(self, index: int = 0) -> int:
+        return self._spans[index][1]
+
+
+class VerbRelationshipMatcher:
+    """
+    Scans text once for the verb phrases of every (\\w+)\\s+(?:verb|...)\\s+(\\w+)
+    relationship pattern of a domain.
+    
+    Verb phrases from all such patterns share one Aho-Corasick automaton; the
+    subject and object words are then read off the flanks of each verb hit
+    instead of running the regex over the whole document. Results reproduce
+    re.finditer exactly, including leftmost non-overlapping selection and
+    alternative order.
+    """
+    
+    SUPPORTED_FLAGS = (0, re.IGNORECASE)
+    
+    def __init__(self, patterns: Dict[str, Any]):
+        """
+        Build the automaton from relationship patterns with a literal verb group.
+        
+        Args:
+            patterns: Mapping of pattern name to RelationshipPattern
+        """
+        self.pattern_names: List[str] = []
+        self._automaton = ahocorasick.Automaton()
+        
+        words: Dict[str, List[Tuple[int, int, str, bool]]] = {}
+        for name, pattern_info in patterns.items():
+            if pattern_info.flags not in self.SUPPORTED_FLAGS:
+                continue
+            if (pattern_info.source_group, pattern_info.target_group) != (1, 2):
+                continue
+            shape = _VERB_RELATIONSHIP.match(pattern_info.pattern)
+            if not shape:
+                continue
+            alternatives = _split_literal_alternatives(shape.group(1) or shape.group(2))
+            if alternatives is None or any(
+                alt[0].isspace() or alt[-1].isspace() for alt in alternatives
+            ):
+                continue
+            
+            pattern_index = len(self.pattern_names)
+            self.pattern_names.append(name)
+            ignore_case = bool(pattern_info.flags & re.IGNORECASE)
+            for alt_index, alternative in enumerate(alternatives):
+                words.setdefault(alternative.lower(), []).append(
+                    (pattern_index, alt_index, alternative, ignore_case)
+                )
+        
+        for word, targets in words.items():
+            self._automaton.add_word(word, (len(word), targets))
+        if words:
+            self._automaton.make_automaton()
+    
+    def __bool__(self) -> bool:
+        return bool(self.pattern_names)
+    
+    def scan(self, text: str) -> Optional[Dict[str, List[VerbRelationshipMatch]]]:
+        """
+        Find relationship matches for every verb pattern in one pass.
+        
+        Returns:
+            Matches keyed by pattern name, or None if the text is not ASCII and
+            callers should fall back to regex matching
+        """
+        if not text.isascii():
+            return None
+        
+        text_length = len(text)
+        hits: List[List[Tuple[int, int, int]]] = [[] for _ in self.pattern_names]
+        
+        for end_index, (length, targets) in self._automaton.iter(text.lower()):
+            start = end_index - length + 1
+            end = end_index + 1
+            # The verb must sit between two whitespace runs
+            if start == 0 or end == text_length:
+                continue
+            if not text[start - 1].isspace() or not text[end].isspace():
+                continue
+            for pattern_index, alt_index, alternative, ignore_case in targets:
+                if not ignore_case and text[start:end] != alternative:
+                    continue
+                hits[pattern_index].append((start, alt_index, end))
+        
+        matches: Dict[str, List[VerbRelationshipMatch]] = {}
+        for name, pattern_hits in zip(self.pattern_names, hits):
+            pattern_hits.sort()
+            pattern_matches = []
+            last_end = 0
+            last_verb_start = -1
+            for verb_start, _, verb_end in pattern_hits:
+                if verb_start == last_verb_start:
+                    # An earlier alternative already matched at this position
+                    continue
+                spans = self._flank_spans(text, verb_start, verb_end)
+                if spans is None or spans[1][0] < last_end:
+                    continue
+                pattern_matches.append(VerbRelationshipMatch(text, spans))
+                last_end = spans[0][1]
+                last_verb_start = verb_start
+            matches[name] = pattern_matches
+        
+        return matches
+    
+    @staticmethod
+    def _flank_spans(text: str, verb_start: int, verb_end: int) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """Return (whole, source, target) spans around a verb hit, or None."""
+        source_end = verb_start
+        while source_end > 0 and text[source_end - 1].isspace():
+            source_end -= 1
+        source_start = source_end
+        while source_start > 0 and _is_word_char(text[source_start - 1]):
+            source_start -= 1
+        if source_start == source_end:
+            return None
+        
+        text_length = len(text)
+        target_start = verb_end
+        while target_start < text_length and text[target_start].isspace():
+            target_start += 1
+        target_end = target_start
+        while target_end < text_length and _is_word_char(text[target_end]):
+            target_end += 1
+        if target_start == target_end:
+            return None
+        
+        return (source_start, target_end), (source_start, source_end), (target_start, target_end)
+
+
+@lru_cache(maxsize=64)
+def _prefilter_database(expressions: Tuple[bytes, ...], flags: Tuple[int, ...]):
+    """Compile a Hyperscan prefilter database once per pattern set, or None if Hyperscan rejects it."""
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=list(expressions),
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=list(flags),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+class RegexPrefilter:
+    """
+    Rules out regex patterns that cannot match a text with one Hyperscan scan.
+    
+    All patterns are compiled into a single Hyperscan database in prefilter
+    mode, which reports a superset of the real matches. Patterns without a hit
+    are skipped; the rest still run through re so captures and finditer's
+    non-overlapping semantics are unchanged. The database is compiled on the
+    first scan and shared by every prefilter with the same patterns.
+    """
+    
+    FLAG_MAP = {re.IGNORECASE: "HS_FLAG_CASELESS", re.MULTILINE: "HS_FLAG_MULTILINE", re.DOTALL: "HS_FLAG_DOTALL"}
+    
+    def __init__(self, patterns: Dict[str, Any]):
+        """
+        Collect the patterns whose flags Hyperscan supports.
+        
+        Args:
+            patterns: Mapping of pattern name to EntityPattern or RelationshipPattern
+        """
+        self.pattern_names: List[str] = []
+        expressions: List[bytes] = []
+        flags: List[int] = []
+        for name, pattern_info in patterns.items():
+            hs_flags = self._convert_flags(pattern_info.flags)
+            if hs_flags is None or not pattern_info.pattern.isascii():
+                continue
+            self.pattern_names.append(name)
+            expressions.append(pattern_info.pattern.encode("ascii"))
+            flags.append(hs_flags)
+        
+        self._expressions = tuple(expressions)
+        self._flags = tuple(flags)
+    
+    def __bool__(self) -> bool:
+        return bool(self.pattern_names)
+    
+    @classmethod
+    def _convert_flags(cls, re_flags: int) -> Optional[int]:
+        """Translate re flags to Hyperscan flags, or None if unsupported."""
+        hs_flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+        for re_flag, hs_flag_name in cls.FLAG_MAP.items():
+            if re_flags & re_flag:
+                hs_flags |= getattr(hyperscan, hs_flag_name)
+                re_flags &= ~re_flag
+        return hs_flags if re_flags == 0 else None
+    
+    def ruled_out(self, text: str) -> Set[str]:
+        """
+        Return the names of patterns that have no match anywhere in text.
+        
+        Non-ASCII text is never filtered, since Hyperscan's \\w and \\b are
+        ASCII-only while re's are Unicode-aware. Nothing is filtered either if
+        Hyperscan rejects any of the patterns.
+        """
+        if not self.pattern_names or not text.isascii():
+            return set()
+        database = _prefilter_database(self._expressions, self._flags)
+        if database is None:
+            return set()
+        
+        matched: Set[int] = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+        
+        database.scan(text.encode("ascii"), match_event_handler=on_match)
+        return {
+            name for index, name in enumerate(self.pattern_names)
+            if index not in matched
+        }
 
 
 class BaseDomainExtractor(ABC):
     """Abstract base class for domain-specific entity extractors."""
     
     def __init__(self, domain_schema: DomainSchema):
-        self.domain_schema = domain_schema
+        self.domain_schema = domain_schema.compile_patterns()
         self.entity_patterns = {p.name: p for p in domain_schema.entity_patterns}
         self.relationship_patterns = {p.name: p for p in domain_schema.relationship_patterns}
+        self._literal_matcher = LiteralPatternMatcher(self.entity_patterns) if AHOCORASICK_AVAILABLE else None
+        self._verb_matcher = VerbRelationshipMatcher(self.relationship_patterns) if AHOCORASICK_AVAILABLE else None
+        self._entity_prefilter = self._build_prefilter(self.entity_patterns, self._literal_matcher)
+        self._relationship_prefilter = self._build_prefilter(self.relationship_patterns, self._verb_matcher)
+    
+    @staticmethod
+    def _build_prefilter(patterns: Dict[str, Any], matcher: Any) -> Optional[RegexPrefilter]:
+        """Build a Hyperscan prefilter for the patterns an automaton matcher does not handle."""
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        handled = set(matcher.pattern_names) if matcher else set()
+        prefilter = RegexPrefilter({
+            name: info for name, info in patterns.items() if name not in handled
+        })
+        return prefilter or None
+    
+    def _find_entity_matches(self, text: str) -> Iterator[Tuple[str, EntityPattern, int, int]]:
+        """
+        Yield (pattern_name, pattern_info, start, end) for every entity pattern match.
+        
+        Literal-alternation patterns are matched in a single Aho-Corasick pass
+        when pyahocorasick is installed; the rest use re.finditer, skipping
+        patterns a Hyperscan prefilter rules out. Matches are yielded in pattern
+        order, then by position, as with per-pattern finditer.
+        """
+        literal_spans = self._literal_matcher.scan(text) if self._literal_matcher else None
+        ruled_out = self._entity_prefilter.ruled_out(text) if self._entity_prefilter else set()
+        
+        for pattern_name, pattern_info in self.entity_patterns.items():
+            if pattern_name in ruled_out:
+                continue
+            if literal_spans is not None and pattern_name in literal_spans:
+                spans = literal_spans[pattern_name]
+            else:
+                spans = (
+                    (match.start(), match.end())
+                    for match in pattern_info.compiled.finditer(text)
+                )
+            
+            for start, end in spans:
+                yield pattern_name, pattern_info, start, end
+    
+    def _find_relationship_matches(self, text: str) -> Iterator[Tuple[str, RelationshipPattern, Any]]:
+        """
+        Yield (pattern_name, pattern_info, match) for every relationship pattern match.
+        
+        Verb-phrase patterns are matched in a single Aho-Corasick pass when
+        pyahocorasick is installed and yield VerbRelationshipMatch objects; the
+        rest yield re.Match objects from re.finditer, after a Hyperscan prefilter
+        drops patterns with no hit. Both support group() and start() and are
+        yielded in pattern order, then by position.
+        """
+        verb_matches = self._verb_matcher.scan(text) if self._verb_matcher else None
+        ruled_out = self._relationship_prefilter.ruled_out(text) if self._relationship_prefilter else set()
+        
+        for pattern_name, pattern_info in self.relationship_patterns.items():
+            if pattern_name in ruled_out:
+                continue
+            if verb_matches is not None and pattern_name in verb_matches:
+                matches = verb_matches[pattern_name]
+            else:
+                matches = pattern_info.compiled.finditer(text)
+            
+            for match in matches:
+                yield pattern_name, pattern_info, match
     
     @abstractmethod
     def extract_entities(self, text: str) -> List[ExtractedEntity]:
@@ -181,7 +692,7 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
         relationship_patterns = [
             RelationshipPattern(
                 name="implements_interface",
-                pattern=r'(\w+)\s+implements\s+(\w+)',
+                pattern=r'(\w++)\s++implements\s++(\w++)',
                 relationship_type="IMPLEMENTS",
                 confidence=0.9,
                 source_group=1,
@@ -191,7 +702,7 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
             ),
             RelationshipPattern(
                 name="extends_class",
-                pattern=r'(\w+)\s+extends\s+(\w+)',
+                pattern=r'(\w++)\s++extends\s++(\w++)',
                 relationship_type="EXTENDS",
                 confidence=0.9,
                 source_group=1,
@@ -211,7 +722,7 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
             ),
             RelationshipPattern(
                 name="depends_on",
-                pattern=r'(\w+)\s+(?:depends on|requires|needs)\s+(\w+)',
+                pattern=r'(\w++)\s++(?:depends on|requires|needs)\s++(\w++)',
                 relationship_type="DEPENDS_ON",
                 confidence=0.8,
                 source_group=1,
@@ -221,7 +732,7 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
             ),
             RelationshipPattern(
                 name="configures",
-                pattern=r'(\w+)\s+(?:configures?|sets up|initializes)\s+(\w+)',
+                pattern=r'(\w++)\s++(?:configures?|sets up|initializes)\s++(\w++)',
                 relationship_type="CONFIGURES",
                 confidence=0.7,
                 source_group=1,
@@ -258,37 +769,34 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
         entities = []
         seen_entities = set()
         
-        for pattern_name, pattern_info in self.entity_patterns.items():
-            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
+        for pattern_name, pattern_info, start, end in self._find_entity_matches(text):
+            entity_text = text[start:end].strip()
+            entity_key = (entity_text.lower(), pattern_info.entity_type.value)
             
-            for match in matches:
-                entity_text = match.group().strip()
-                entity_key = (entity_text.lower(), pattern_info.entity_type.value)
-                
-                # Skip duplicates
-                if entity_key in seen_entities:
-                    continue
-                seen_entities.add(entity_key)
-                
-                # Get context around the entity
-                context_start = max(0, match.start() - 50)
-                context_end = min(len(text), match.end() + 50)
-                context = text[context_start:context_end].strip()
-                
-                entity = ExtractedEntity(
-                    text=entity_text,
-                    label=pattern_info.entity_type.value,
-                    start_position=match.start(),
-                    end_position=match.end(),
-                    confidence=pattern_info.confidence,
-                    context=context,
-                    properties={
-                        "domain": self.domain_schema.domain_type.value,
-                        "pattern_name": pattern_name,
-                        "extraction_method": "domain_specific"
-                    }
-                )
-                entities.append(entity)
+            # Skip duplicates
+            if entity_key in seen_entities:
+                continue
+            seen_entities.add(entity_key)
+            
+            # Get context around the entity
+            context_start = max(0, start - 50)
+            context_end = min(len(text), end + 50)
+            context = text[context_start:context_end].strip()
+            
+            entity = ExtractedEntity(
+                text=entity_text,
+                label=pattern_info.entity_type.value,
+                start_position=start,
+                end_position=end,
+                confidence=pattern_info.confidence,
+                context=context,
+                properties={
+                    "domain": self.domain_schema.domain_type.value,
+                    "pattern_name": pattern_name,
+                    "extraction_method": "domain_specific"
+                }
+            )
+            entities.append(entity)
         
         return entities
     
@@ -299,54 +807,51 @@ class TechnicalDocumentationExtractor(BaseDomainExtractor):
         # Create entity lookup for quick access
         entity_lookup = {ent.text.lower(): ent.text for ent in entities}
         
-        for pattern_name, pattern_info in self.relationship_patterns.items():
-            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
-            
-            for match in matches:
-                # Handle special case for "uses_technology" pattern
-                if pattern_name == "uses_technology":
-                    # Find the subject entity from context
-                    context_start = max(0, match.start() - 100)
-                    context_text = text[context_start:match.start()]
-                    
-                    # Look for entities in the preceding context
-                    source_entity = None
-                    for entity in entities:
-                        if entity.text.lower() in context_text.lower():
-                            source_entity = entity.text
-                            break
-                    
-                    target_text = match.group(pattern_info.target_group).strip()
-                    target_entity = self._find_matching_entity(target_text, entities)
-                    
-                    if source_entity and target_entity:
-                        relationship = EntityRelationship(
-                            source_entity=source_entity,
-                            target_entity=target_entity,
-                            relationship_type=pattern_info.relationship_type,
-                            confidence=pattern_info.confidence,
-                            context=match.group(0),
-                            evidence_text=match.group(0)
-                        )
-                        relationships.append(relationship)
-                else:
-                    # Standard pattern processing
-                    source_text = match.group(pattern_info.source_group).strip()
-                    target_text = match.group(pattern_info.target_group).strip()
-                    
-                    source_entity = self._find_matching_entity(source_text, entities)
-                    target_entity = self._find_matching_entity(target_text, entities)
-                    
-                    if source_entity and target_entity and source_entity != target_entity:
-                        relationship = EntityRelationship(
-                            source_entity=source_entity,
-                            target_entity=target_entity,
-                            relationship_type=pattern_info.relationship_type,
-                            confidence=pattern_info.confidence,
-                            context=match.group(0),
-                            evidence_text=match.group(0)
-                        )
-                        relationships.append(relationship)
+        for pattern_name, pattern_info, match in self._find_relationship_matches(text):
+            # Handle special case for "uses_technology" pattern
+            if pattern_name == "uses_technology":
+                # Find the subject entity from context
+                context_start = max(0, match.start() - 100)
+                context_text = text[context_start:match.start()]
+                
+                # Look for entities in the preceding context
+                source_entity = None
+                for entity in entities:
+                    if entity.text.lower() in context_text.lower():
+                        source_entity = entity.text
+                        break
+                
+                target_text = match.group(pattern_info.target_group).strip()
+                target_entity = self._find_matching_entity(target_text, entities)
+                
+                if source_entity and target_entity:
+                    relationship = EntityRelationship(
+                        source_entity=source_entity,
+                        target_entity=target_entity,
+                        relationship_type=pattern_info.relationship_type,
+                        confidence=pattern_info.confidence,
+                        context=match.group(0),
+                        evidence_text=match.group(0)
+                    )
+                    relationships.append(relationship)
+            else:
+                # Standard pattern processing
+                source_text = match.group(pattern_info.source_group).strip()
+                target_text = match.group(pattern_info.target_group).strip()
+                
+                source_entity = self._find_matching_entity(source_text, entities)
+                target_entity = self._find_matching_entity(target_text, entities)
+                
+                if source_entity and target_entity and source_entity != target_entity:
+                    relationship = EntityRelationship(
+                        source_entity=source_entity,
+                        target_entity=target_entity,
+                        relationship_type=pattern_info.relationship_type,
+                        confidence=pattern_info.confidence,
+                        context=match.group(0),
+                        evidence_text=match.group(0)
+                    )
+                    relationships.append(relationship)
         
         return relationships
     
@@ -466,34 +971,31 @@ class ResearchPapersExtractor(BaseDomainExtractor):
         entities = []
         seen_entities = set()
         
-        for pattern_name, pattern_info in self.entity_patterns.items():
-            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
+        for pattern_name, pattern_info, start, end in self._find_entity_matches(text):
+            entity_text = text[start:end].strip()
+            entity_key = (entity_text.lower(), pattern_info.entity_type.value)
             
-            for match in matches:
-                entity_text = match.group().strip()
-                entity_key = (entity_text.lower(), pattern_info.entity_type.value)
+            if entity_key not in seen_entities:
+                seen_entities.add(entity_key)
                 
-                if entity_key not in seen_entities:
-                    seen_entities.add(entity_key)
-                    
-                    context_start = max(0, match.start() - 50)
-                    context_end = min(len(text), match.end() + 50)
-                    context = text[context_start:context_end].strip()
-                    
-                    entity = ExtractedEntity(
-                        text=entity_text,
-                        label=pattern_info.entity_type.value,
-                        start_position=match.start(),
-                        end_position=match.end(),
-                        confidence=pattern_info.confidence,
-                        context=context,
-                        properties={
-                            "domain": self.domain_schema.domain_type.value,
-                            "pattern_name": pattern_name,
-                            "extraction_method": "domain_specific"
-                        }
-                    )
-                    entities.append(entity)
+                context_start = max(0, start - 50)
+                context_end = min(len(text), end + 50)
+                context = text[context_start:context_end].strip()
+                
+                entity = ExtractedEntity(
+                    text=entity_text,
+                    label=pattern_info.entity_type.value,
+                    start_position=start,
+                    end_position=end,
+                    confidence=pattern_info.confidence,
+                    context=context,
+                    properties={
+                        "domain": self.domain_schema.domain_type.value,
+                        "pattern_name": pattern_name,
+                        "extraction_method": "domain_specific"
+                    }
+                )
+                entities.append(entity)
         
         return entities
     
@@ -501,26 +1003,23 @@ class ResearchPapersExtractor(BaseDomainExtractor):
         """Identify research paper relationships."""
         relationships = []
         
-        for pattern_name, pattern_info in self.relationship_patterns.items():
-            matches = re.finditer(pattern_info.pattern, text, pattern_info.flags)
+        for pattern_name, pattern_info, match in self._find_relationship_matches(text):
+            source_text = match.group(pattern_info.source_group).strip()
+            target_text = match.group(pattern_info.target_group).strip()
             
-            for match in matches:
-                source_text = match.group(pattern_info.source_group).strip()
-                target_text = match.group(pattern_info.target_group).strip()
-                
-                source_entity = self._find_matching_entity(source_text, entities)
-                target_entity = self._find_matching_entity(target_text, entities)
-                
-                if source_entity and target_entity:
-                    relationship = EntityRelationship(
-                        source_entity=source_entity,
-                        target_entity=target_entity,
-                        relationship_type=pattern_info.relationship_type,
-                        confidence=pattern_info.confidence,
-                        context=match.group(0),
-                        evidence_text=match.group(0)
-                    )
-                    relationships.append(relationship)
+            source_entity = self._find_matching_entity(source_text, entities)
+            target_entity = self._find_matching_entity(target_text, entities)
+            
+            if source_entity and target_entity:
+                relationship = EntityRelationship(
+                    source_entity=source_entity,
+                    target_entity=target_entity,
+                    relationship_type=pattern_info.relationship_type,
+                    confidence=pattern_info.confidence,
+                    context=match.group(0),
+                    evidence_text=match.group(0)
+                )
+                relationships.append(relationship)
         
         return relationships
     
@@ -540,14 +1039,68 @@ class ResearchPapersExtractor(BaseDomainExtractor):
         return None
 
 
+def _content_digest(text: str) -> bytes:
+    """Return a short content hash used as an extraction cache key."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+@lru_cache(maxsize=None)
+def _source_version(path: str) -> str:
+    """Hash a source file so on-disk cache entries are dropped when the code changes."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return ''
+
+
+def _extractor_code_version(extractor: BaseDomainExtractor) -> str:
+    """Combine the source hashes of this module and every module in the extractor's class hierarchy."""
+    paths = {__file__}
+    for cls in type(extractor).__mro__:
+        try:
+            paths.add(inspect.getfile(cls))
+        except TypeError:
+            # Built-in classes have no source file
+            continue
+    return ','.join(_source_version(path) for path in sorted(paths))
+
+
+def _extractor_fingerprint(extractor: BaseDomainExtractor) -> bytes:
+    """
+    Hash an extractor's class, source and patterns so cached results are
+    dropped whenever a domain is re-registered with a different configuration
+    or the extraction code changes.
+    """
+    schema = extractor.domain_schema
+    parts = [
+        type(extractor).__qualname__,
+        _extractor_code_version(extractor),
+        schema.domain_type.value,
+        repr([(p.name, p.pattern, p.flags, p.entity_type.value, p.confidence)
+              for p in schema.entity_patterns]),
+        repr([(p.name, p.pattern, p.flags, p.relationship_type, p.confidence,
+               p.source_group, p.target_group)
+              for p in schema.relationship_patterns]),
+    ]
+    return _content_digest('\x1f'.join(parts))
+
+
 class DomainProcessorManager:
     """Manager for domain-specific processing capabilities."""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = EXTRACTION_CACHE_SIZE):
         self.extractors: Dict[DomainType, BaseDomainExtractor] = {}
         self.schemas: Dict[DomainType, DomainSchema] = {}
         self.current_domain: Optional[DomainType] = None
         
+        # Extraction results keyed by (kind, extractor fingerprint, content digest)
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._fingerprints: Dict[DomainType, bytes] = {}
+        self._disk_cache = None
+        
         # Register default extractors
         self._register_default_extractors()
     
@@ -565,6 +1118,7 @@ class DomainProcessorManager:
         """Register a domain-specific extractor."""
         self.extractors[domain_type] = extractor
         self.schemas[domain_type] = extractor.domain_schema
+        self._fingerprints[domain_type] = _extractor_fingerprint(extractor)
     
     def set_domain(self, domain_type: DomainType):
         """Set the current active domain."""
@@ -588,7 +1142,15 @@ class DomainProcessorManager:
         if not extractor:
             raise ValueError(f"No extractor registered for domain {domain}")
         
-        return extractor.extract_entities(text)
+        key = ("entities", self._fingerprints[domain], _content_digest(text))
+        cached = self._cache_get(key)
+        if cached is not None:
+            # Fresh objects per call so callers may mutate them freely
+            return [ExtractedEntity(*fields[:-1], dict(fields[-1])) for fields in cached]
+        
+        entities = extractor.extract_entities(text)
+        self._cache_put(key, tuple(astuple(entity) for entity in entities))
+        return entities
     
     def identify_relationships(self, text: str, entities: List[ExtractedEntity], 
                             domain_type: Optional[DomainType] = None) -> List[EntityRelationship]:
@@ -601,7 +1163,72 @@ class DomainProcessorManager:
         if not extractor:
             raise ValueError(f"No extractor registered for domain {domain}")
         
-        return extractor.identify_relationships(text, entities)
+        entity_key = repr([
+            (ent.text, ent.label, ent.start_position, ent.end_position) for ent in entities
+        ])
+        key = (
+            "relationships",
+            self._fingerprints[domain],
+            _content_digest(text),
+            _content_digest(entity_key),
+        )
+        cached = self._cache_get(key)
+        if cached is not None:
+            return [EntityRelationship(*fields) for fields in cached]
+        
+        relationships = extractor.identify_relationships(text, entities)
+        self._cache_put(key, tuple(astuple(rel) for rel in relationships))
+        return relationships
+    
+    def enable_disk_cache(self, directory: str = ".nlp_cache") -> bool:
+        """
+        Back the in-memory extraction cache with an on-disk diskcache tier,
+        so results survive across processes.
+        
+        Args:
+            directory: Cache directory
+            
+        Returns:
+            True if enabled, False if diskcache is not installed
+        """
+        if not DISKCACHE_AVAILABLE:
+            return False
+        self._disk_cache = diskcache.Cache(directory)
+        return True
+    
+    def clear_cache(self):
+        """Drop all cached extraction results, including the disk tier."""
+        with self._cache_lock:
+            self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+    
+    def _cache_get(self, key: Tuple) -> Optional[Tuple]:
+        """Look up a cached extraction result, promoting disk hits to memory."""
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                return value
+        
+        if self._disk_cache is not None:
+            value = self._disk_cache.get(key)
+            if value is not None:
+                self._cache_put(key, value, persist=False)
+        return value
+    
+    def _cache_put(self, key: Tuple, value: Tuple, persist: bool = True):
+        """Store an extraction result, evicting the least recently used entry."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, value)
     
     def get_domain_schema(self, domain_type: DomainType) -> Optional[DomainSchema]:
         """Get schema for a specific domain."""
@@ -640,7 +1267,7 @@ class DomainProcessorManager:
             metadata=schema_data.get('metadata', {})
         )
         
-        return schema
+        return schema.compile_patterns()
     
     def save_schema(self, domain_type: DomainType, output_path: str):
         """Save a domain schema to file."""
@@ -6,12 +6,42 @@ dual storage ingestion pipeline to generate vector embeddings for documents and
 """
 
 import logging
-from typing import List, Optional, Union
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Loaded sentence-transformers models keyed by (model_name, device), shared by every
+# service and agent in the process
+_model_cache: Dict[Tuple[str, Optional[str]], Any] = {}
+_model_cache_lock = threading.Lock()
+
+
+def get_sentence_transformer(model_name: str = "all-MiniLM-L6-v2", device: Optional[str] = None) -> Any:
+    """
+    Get a shared sentence-transformers model, loading it on first use.
+    
+    Args:
+        model_name: Name of the sentence-transformers model
+        device: Device to load the model on, or None for the library default
+        
+    Returns:
+        SentenceTransformer instance
+    """
+    key = (model_name, device)
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            
+            logger.info(f"Loading sentence-transformers model: {model_name}")
+            model = SentenceTransformer(model_name, device=device)
+            _model_cache[key] = model
+    
+    return model
+
 
 class EmbeddingService:
     """
@@ -192,10 +222,7 @@ class SentenceTransformerEmbeddingService(EmbeddingService):
             return
         
         try:
-            from sentence_transformers import SentenceTransformer
-            
-            logger.info(f"Loading sentence-transformers model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            self.model = get_sentence_transformer(self.model_name)
             
             # Get embedding dimension from model
             test_embedding = self.model.encode("test")
@@ -601,6 +601,7 @@ class GraphConstraints:
             "CREATE INDEX entity_name_index IF NOT EXISTS FOR (e:Entity) ON (e.name)",
             "CREATE INDEX document_title_index IF NOT EXISTS FOR (d:Document) ON (d.title)",
             "CREATE INDEX concept_name_index IF NOT EXISTS FOR (c:Concept) ON (c.name)",
+            "CREATE FULLTEXT INDEX docFts IF NOT EXISTS FOR (d:Document) ON EACH [d.title, d.content]",
             
             # Type-based indexes
             "CREATE INDEX entity_type_index IF NOT EXISTS FOR (e:Entity) ON (e.entity_type)",
@@ -257,66 +257,73 @@ class DualStorageIngestionPipeline:
                 "updated_at": document.updated_at.isoformat()
             })
             
-            # Create entity nodes and link to document
-            for entity in entities:
-                # Create or merge entity
+            # Create entity nodes and link to document in a single UNWIND round-trip
+            if entities:
                 entity_query = """
-                MERGE (e:Entity {name: $name, type: $type})
+                MATCH (d:Document {id: $doc_id})
+                UNWIND $entities AS entity
+                MERGE (e:Entity {name: entity.name, type: entity.type})
                 ON CREATE SET 
-                    e.id = $entity_id,
+                    e.id = entity.entity_id,
                     e.description = $description,
-                    e.created_at = $created_at,
-                    e.updated_at = $updated_at,
-                    e.properties = $properties
+                    e.created_at = $timestamp,
+                    e.updated_at = $timestamp,
+                    e.properties = entity.properties
                 ON MATCH SET
-                    e.updated_at = $updated_at
-                WITH e
-                MATCH (d:Document {id: $doc_id})
+                    e.updated_at = $timestamp
                 MERGE (e)-[:MENTIONED_IN {
                     frequency: 1,
-                    context: $context,
-                    confidence: $confidence
+                    context: entity.context,
+                    confidence: entity.confidence
                 }]->(d)
-                RETURN e
+                RETURN count(e) as entity_count
                 """
                 
-                entity_id = str(uuid.uuid4())
                 self.graph_db.execute_query(entity_query, {
-                    "entity_id": entity_id,
-                    "name": entity.text,
-                    "type": entity.label,
-                    "description": f"Entity extracted from document {document.id}",
                     "doc_id": document.id,
-                    "context": entity.context[:1000],  # Limit context size
-                    "confidence": entity.confidence,
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat(),
-                    "properties": json.dumps(entity.properties) if entity.properties else "{}"
+                    "description": f"Entity extracted from document {document.id}",
+                    "timestamp": datetime.now().isoformat(),
+                    "entities": [
+                        {
+                            "entity_id": str(uuid.uuid4()),
+                            "name": entity.text,
+                            "type": entity.label,
+                            "context": entity.context[:1000],  # Limit context size
+                            "confidence": entity.confidence,
+                            "properties": json.dumps(entity.properties) if entity.properties else "{}"
+                        }
+                        for entity in entities
+                    ]
                 })
             
             # Create relationships between entities
-            if self.config.create_graph_relationships:
-                for relationship in relationships:
-                    rel_query = """
-                    MATCH (e1:Entity {name: $source_entity})
-                    MATCH (e2:Entity {name: $target_entity})
-                    MERGE (e1)-[r:RELATED_TO {
-                        type: $rel_type,
-                        confidence: $confidence,
-                        context: $context,
-                        evidence: $evidence
-                    }]->(e2)
-                    RETURN r
-                    """
-                    
-                    self.graph_db.execute_query(rel_query, {
-                        "source_entity": relationship.source_entity,
-                        "target_entity": relationship.target_entity,
-                        "rel_type": relationship.relationship_type,
-                        "confidence": relationship.confidence,
-                        "context": relationship.context[:1000],
-                        "evidence": relationship.evidence_text[:500]
-                    })
+            if self.config.create_graph_relationships and relationships:
+                rel_query = """
+                UNWIND $relationships AS rel
+                MATCH (e1:Entity {name: rel.source_entity})
+                MATCH (e2:Entity {name: rel.target_entity})
+                MERGE (e1)-[r:RELATED_TO {
+                    type: rel.rel_type,
+                    confidence: rel.confidence,
+                    context: rel.context,
+                    evidence: rel.evidence
+                }]->(e2)
+                RETURN count(r) as relationship_count
+                """
+                
+                self.graph_db.execute_query(rel_query, {
+                    "relationships": [
+                        {
+                            "source_entity": relationship.source_entity,
+                            "target_entity": relationship.target_entity,
+                            "rel_type": relationship.relationship_type,
+                            "confidence": relationship.confidence,
+                            "context": relationship.context[:1000],
+                            "evidence": relationship.evidence_text[:500]
+                        }
+                        for relationship in relationships
+                    ]
+                })
             
         except Exception as e:
             raise Exception(f"Failed to store document in graph database: {e}")
@@ -88,6 +88,20 @@ class GraphResult(BaseModel):
     relationships: List[Dict[str, Any]] = Field(default_factory=list)
     paths: List[List[str]] = Field(default_factory=list)
     cypher_query: Optional[str] = None
+    
+    def relationship_columns(self) -> Dict[str, Any]:
+        """
+        Return the relationships as parallel NumPy string arrays.
+        
+        Keys are 'type', 'start_node' and 'end_node'. The columnar layout allows
+        vectorized summaries such as np.unique(columns['type'], return_counts=True).
+        """
+        import numpy as np
+        
+        return {
+            key: np.array([rel.get(key, '') for rel in self.relationships], dtype=str)
+            for key in ('type', 'start_node', 'end_node')
+        }
 
 
 class VectorResult(BaseModel):
@@ -142,7 +142,87 @@ class EntityVectorMappingService:
         except Exception as e:
             raise MappingValidationError(f"Failed to create mapping for entity {entity_id}: {e}")
     
-    def _update_entity_vector_reference(self, entity_id: str, vector_id: str, 
+    def create_mappings_bulk(self, mappings: List[Dict[str, Any]]) -> List[EntityVectorLink]:
+        """
+        Create many entity-vector mappings with one graph write and one vector write.
+        
+        Args:
+            mappings: Dictionaries with entity_id, entity_type, vector_id,
+                collection_name and optional metadata
+        
+        Returns:
+            EntityVectorLink objects for the mappings whose entity exists in the graph
+        """
+        if not self._initialized:
+            self.initialize()
+        
+        if not mappings:
+            return []
+        
+        now = datetime.now()
+        links = {
+            row["entity_id"]: EntityVectorLink(
+                entity_id=row["entity_id"],
+                entity_type=row["entity_type"],
+                vector_id=row["vector_id"],
+                collection_name=row["collection_name"],
+                created_at=now,
+                updated_at=now,
+                metadata=row.get("metadata") or {}
+            )
+            for row in mappings
+        }
+        
+        query = """
+        UNWIND $rows AS row
+        MATCH (e:Entity {id: row.entity_id})
+        SET e.vector_id = row.vector_id,
+            e.vector_collection = row.collection_name,
+            e.updated_at = $updated_at
+        RETURN e.id as entity_id
+        """
+        
+        try:
+            result = self.neo4j_manager.execute_query(query, {
+                "rows": [
+                    {
+                        "entity_id": link.entity_id,
+                        "vector_id": link.vector_id,
+                        "collection_name": link.collection_name
+                    }
+                    for link in links.values()
+                ],
+                "updated_at": now.isoformat()
+            })
+            
+            found = {record["entity_id"] for record in result}
+            missing = links.keys() - found
+            if missing:
+                logger.warning(f"Skipped {len(missing)} mappings for entities not found in graph database")
+            
+            created = [link for entity_id, link in links.items() if entity_id in found]
+            if created:
+                self.vector_manager.add_documents(
+                    collection_name=self._mapping_collection,
+                    documents=[json.dumps(link.to_dict()) for link in created],
+                    metadatas=[{
+                        "entity_id": link.entity_id,
+                        "entity_type": link.entity_type,
+                        "vector_id": link.vector_id,
+                        "collection_name": link.collection_name,
+                        "created_at": link.created_at.isoformat(),
+                        "updated_at": link.updated_at.isoformat()
+                    } for link in created],
+                    ids=[self._generate_mapping_id(link.entity_id, link.vector_id) for link in created]
+                )
+            
+            logger.info(f"Created {len(created)} mappings in bulk")
+            return created
+        
+        except Exception as e:
+            raise MappingValidationError(f"Failed to create mappings in bulk: {e}")
+    
+    def _update_entity_vector_reference(self, entity_id: str, vector_id: str,
                                       collection_name: str, updated_at: datetime) -> None:
         """Update the graph entity with vector reference information."""
         query = """
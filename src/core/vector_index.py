@@ -0,0 +1,564 @@
+"""
+In-process vector indexes for document embeddings.
+
+This module provides a FAISS-backed HNSW or IVF-PQ index and an exact, NumPy-backed document
+store that the Vector Retrieval Agent can use instead of a remote vector database.
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+from .vector_models import DocumentEmbedding
+
+logger = logging.getLogger(__name__)
+
+# Margin added on each side of the value range learned for int8 quantization, as a
+# fraction of that range, so later documents are rarely clipped
+INT8_RANGE_MARGIN = 0.2
+
+# IVF-PQ defaults: subvectors per code, bits per subvector code, inverted lists
+# probed per query, and vectors collected before the index is trained
+IVF_PQ_M = 48
+IVF_PQ_NBITS = 8
+IVF_PQ_NPROBE = 16
+IVF_PQ_MIN_TRAIN = 10_000
+
+# With binary quantization, DocumentStore rescores this many candidates per result
+BINARY_RERANK_FACTOR = 10
+
+# Element types DocumentStore can keep its vectors in
+VECTOR_DTYPES = ("float32", "float16")
+
+# Rows converted to float32 at a time when scoring float16 vectors
+SCORE_BLOCK_ROWS = 4096
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so inner product equals cosine similarity."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _check_quantization(quantization: Optional[str], supported: Tuple[str, ...]) -> None:
+    """Raise ValueError for a quantization the index does not support."""
+    if quantization is not None and quantization not in supported:
+        raise ValueError(
+            f"Unknown vector quantization '{quantization}'. Choose from: {', '.join(supported)}"
+        )
+
+
+def _hamming_distances(codes: np.ndarray, query_code: np.ndarray) -> np.ndarray:
+    """Count differing bits between each row of packed codes and a packed query."""
+    diff = codes ^ query_code
+    if diff.shape[1] % 8 == 0:
+        # Popcount whole 64-bit words rather than single bytes
+        diff = np.ascontiguousarray(diff).view(np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(diff).sum(axis=1, dtype=np.int32)
+    return _POPCOUNT8[diff.view(np.uint8)].sum(axis=1, dtype=np.int32)
+
+
+def _matches_filters(metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Check document metadata against equality / membership filters."""
+    for key, value in filters.items():
+        if isinstance(value, list):
+            if metadata.get(key) not in value:
+                return False
+        elif metadata.get(key) != value:
+            return False
+    return True
+
+
+class StoredDocument:
+    """
+    Slotted copy of a DocumentEmbedding without its embedding.
+    
+    The local indexes already hold every vector in their own arrays, so keeping
+    the pydantic model and its list of Python floats alongside would store each
+    embedding twice. Search results carry these records instead.
+    """
+    
+    __slots__ = (
+        "id", "content", "title", "source", "document_type", "embedding_model",
+        "embedding_dimension", "metadata", "graph_entity_ids", "chunk_index",
+        "parent_document_id", "created_at", "updated_at"
+    )
+    
+    def __init__(self, document: DocumentEmbedding):
+        for name in self.__slots__:
+            setattr(self, name, getattr(document, name))
+    
+    def __repr__(self) -> str:
+        return f"StoredDocument(id={self.id!r}, title={self.title!r})"
+
+
+class FaissVectorIndex:
+    """
+    HNSW or IVF-PQ index over document embeddings with metadata post-filtering.
+    
+    Vectors are L2-normalized and stored in a faiss.IndexHNSWFlat using inner
+    product, so scores are cosine similarities. HNSW does not support removal,
+    so deleted or replaced documents are tombstoned and skipped at query time.
+    
+    With quantization="int8" the graph stores one byte per dimension instead of
+    four (faiss.IndexHNSWSQ with a uniform 8-bit scalar quantizer), and FAISS
+    computes the inner products with its SIMD int8 kernels. The value range is
+    learned from the first batch of documents added.
+    
+    With index_type="ivf_pq" vectors are product-quantized into m codes of nbits
+    each (48 bytes per 384-d vector with the defaults) and bucketed into
+    sqrt(N) inverted lists, of which nprobe are scanned per query. IVF-PQ must
+    be trained, so the first min_train vectors are searched exactly and the
+    index is trained on all of them once that many have been added.
+    """
+    
+    QUANTIZATIONS = ("int8",)
+    INDEX_TYPES = ("hnsw", "ivf_pq")
+    
+    def __init__(
+        self,
+        dimension: int = 384,
+        hnsw_m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        quantization: Optional[str] = None,
+        index_type: str = "hnsw",
+        pq_m: int = IVF_PQ_M,
+        pq_nbits: int = IVF_PQ_NBITS,
+        nprobe: int = IVF_PQ_NPROBE,
+        min_train: int = IVF_PQ_MIN_TRAIN
+    ):
+        """
+        Initialize an empty index.
+        
+        Args:
+            dimension: Dimension of the embedding vectors
+            hnsw_m: Number of neighbours per node in the HNSW graph
+            ef_construction: Candidate list size while building the graph
+            ef_search: Candidate list size while searching
+            quantization: None for float32 storage or "int8" for scalar quantization
+            index_type: "hnsw" for a graph index or "ivf_pq" for an inverted file
+                of product-quantized codes
+            pq_m: Number of IVF-PQ subvectors; must divide the dimension
+            pq_nbits: Bits per IVF-PQ subvector code
+            nprobe: Inverted lists scanned per IVF-PQ query
+            min_train: Vectors to collect before training the IVF-PQ index
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("FAISS not available. Install with: pip install faiss-cpu")
+        _check_quantization(quantization, self.QUANTIZATIONS)
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index type '{index_type}'. Choose from: {', '.join(self.INDEX_TYPES)}"
+            )
+        if index_type == "ivf_pq":
+            if quantization is not None:
+                raise ValueError("IVF-PQ indexes are already quantized; leave quantization unset")
+            if dimension % pq_m != 0:
+                raise ValueError(f"pq_m={pq_m} must divide the embedding dimension {dimension}")
+        
+        self.dimension = dimension
+        self.quantization = quantization
+        self.index_type = index_type
+        self.pq_m = pq_m
+        self.pq_nbits = pq_nbits
+        self.nprobe = nprobe
+        self.min_train = max(min_train, 2 ** pq_nbits)
+        
+        # Row i of the index holds self._documents[i]; None marks a tombstone
+        self._documents: List[Optional[StoredDocument]] = []
+        self._rows: Dict[str, int] = {}
+        
+        if index_type == "ivf_pq":
+            # Built once min_train vectors are collected; until then they are
+            # kept here and searched exactly
+            self.index = None
+            self._pending = np.empty((0, dimension), dtype=np.float32)
+            return
+        
+        if quantization == "int8":
+            self.index = faiss.IndexHNSWSQ(
+                dimension, faiss.ScalarQuantizer.QT_8bit_uniform, hnsw_m, faiss.METRIC_INNER_PRODUCT
+            )
+            quantizer = faiss.downcast_index(self.index.storage).sq
+            quantizer.rangestat = faiss.ScalarQuantizer.RS_minmax
+            quantizer.rangestat_arg = INT8_RANGE_MARGIN
+        else:
+            self.index = faiss.IndexHNSWFlat(dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        self.index.hnsw.efConstruction = ef_construction
+        self.index.hnsw.efSearch = ef_search
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def add(self, documents: Sequence[DocumentEmbedding]) -> None:
+        """
+        Add documents, replacing any already stored under the same ID.
+        
+        Args:
+            documents: Documents whose embeddings match the index dimension
+        """
+        if not documents:
+            return
+        
+        matrix = np.ascontiguousarray([doc.embedding for doc in documents], dtype=np.float32)
+        if matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} doesn't match index dimension {self.dimension}"
+            )
+        
+        for doc in documents:
+            self.remove(doc.id)
+            self._rows[doc.id] = len(self._documents)
+            self._documents.append(StoredDocument(doc))
+        
+        matrix = _normalize_rows(matrix)
+        if self.index_type == "ivf_pq" and self.index is None:
+            self._pending = np.vstack([self._pending, matrix])
+            if len(self._pending) >= self.min_train:
+                self._train_ivf_pq()
+        else:
+            if not self.index.is_trained:
+                self.index.train(matrix)
+            self.index.add(matrix)
+        logger.debug(f"Added {len(documents)} vectors to {self.index_type} index ({len(self)} live)")
+    
+    def _train_ivf_pq(self) -> None:
+        """Train the IVF-PQ index on the collected vectors and move them into it."""
+        nlist = max(1, int(math.sqrt(len(self._pending))))
+        quantizer = faiss.IndexFlatIP(self.dimension)
+        index = faiss.IndexIVFPQ(
+            quantizer, self.dimension, nlist, self.pq_m, self.pq_nbits, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(self._pending)
+        index.add(self._pending)
+        index.nprobe = self.nprobe
+        
+        # Keep the coarse quantizer alive alongside the index that references it
+        self._quantizer = quantizer
+        self.index = index
+        self._pending = None
+        logger.info(f"Trained IVF-PQ index with {nlist} lists on {index.ntotal} vectors")
+    
+    def _search_rows(self, query: np.ndarray, fetch: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the scores and rows of the fetch nearest vectors to a query."""
+        if self.index is not None:
+            return self.index.search(query, fetch)
+        
+        # IVF-PQ index not trained yet: exact search over the collected vectors
+        scores = self._pending @ query[0]
+        rows = np.argpartition(-scores, fetch - 1)[:fetch] if fetch < len(scores) else np.arange(len(scores))
+        rows = rows[np.argsort(-scores[rows])]
+        return scores[rows].reshape(1, -1), rows.reshape(1, -1)
+    
+    def remove(self, document_id: str) -> bool:
+        """
+        Tombstone a document so it is no longer returned.
+        
+        Returns:
+            True if the document was present
+        """
+        row = self._rows.pop(document_id, None)
+        if row is None:
+            return False
+        self._documents[row] = None
+        return True
+    
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[StoredDocument, float]]:
+        """
+        Return the k most similar live documents that pass the filters.
+        
+        Args:
+            query_vector: Query embedding
+            k: Number of results to return
+            filters: Optional metadata filters (value or list of allowed values)
+        
+        Returns:
+            (document, cosine similarity) pairs, most similar first
+        """
+        total = len(self._documents)
+        if k <= 0 or not self._rows:
+            return []
+        
+        query = _normalize_rows(np.asarray(query_vector, dtype=np.float32).reshape(1, -1))
+        
+        # Over-fetch to make room for tombstones and filtered-out rows, widening
+        # the search until k results survive or the whole index has been covered
+        fetch = min(total, k + total - len(self._rows))
+        while True:
+            scores, rows = self._search_rows(query, fetch)
+            results = []
+            for score, row in zip(scores[0], rows[0]):
+                if row < 0:
+                    continue
+                doc = self._documents[row]
+                if doc is None or (filters and not _matches_filters(doc.metadata, filters)):
+                    continue
+                results.append((doc, float(score)))
+                if len(results) == k:
+                    return results
+            if fetch >= total:
+                return results
+            fetch = min(total, fetch * 4)
+
+
+class DocumentStore:
+    """
+    Exact in-memory document store with embeddings in one contiguous matrix.
+    
+    Embeddings live row by row in a single float32 (capacity, dimension) array that
+    grows in power-of-two steps, with documents kept in a parallel list. A query is
+    scored against every row with one matrix-vector product. Removal moves the last
+    row into the freed slot so the live rows stay contiguous.
+    
+    With quantization="binary" the store also keeps the sign bit of every dimension
+    packed into a byte code. Search then ranks all rows by Hamming distance to the
+    query code with popcounts and rescores only the closest k * rerank_factor rows
+    with exact cosine similarity.
+    
+    With vector_dtype="float16" the matrix takes half the memory. Rows are widened
+    to float32 block by block while scoring, so products still accumulate in float32.
+    
+    Documents are kept as StoredDocument records; a document's normalized
+    embedding is its row of the matrix, available through get_vector.
+    
+    For every metadata key and hashable value the store also keeps a boolean
+    row mask, updated as documents are added and removed. Filters are resolved
+    by combining masks, so a filtered search scores only the matching rows
+    without looking at each document's metadata.
+    """
+    
+    QUANTIZATIONS = ("binary",)
+    
+    def __init__(
+        self,
+        dimension: int = 384,
+        initial_capacity: int = 64,
+        quantization: Optional[str] = None,
+        rerank_factor: int = BINARY_RERANK_FACTOR,
+        vector_dtype: str = "float32"
+    ):
+        """
+        Initialize an empty store.
+        
+        Args:
+            dimension: Dimension of the embedding vectors
+            initial_capacity: Number of rows allocated up front
+            quantization: None for exact search or "binary" for a Hamming prefilter
+            rerank_factor: Candidates rescored per requested result with "binary"
+            vector_dtype: Element type of the stored vectors, "float32" or "float16"
+        """
+        _check_quantization(quantization, self.QUANTIZATIONS)
+        if vector_dtype not in VECTOR_DTYPES:
+            raise ValueError(f"Unknown vector dtype '{vector_dtype}'. Choose from: {', '.join(VECTOR_DTYPES)}")
+        
+        self.dimension = dimension
+        self.quantization = quantization
+        self.rerank_factor = rerank_factor
+        self.vectors = np.zeros((initial_capacity, dimension), dtype=vector_dtype)
+        self.codes = np.zeros((initial_capacity, (dimension + 7) // 8), dtype=np.uint8)
+        self.documents: List[StoredDocument] = []
+        self._rows: Dict[str, int] = {}
+        
+        # metadata key -> value -> row mask; keys seen with unhashable values
+        # cannot be resolved from masks and fall back to a metadata scan
+        self._masks: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._unindexed_keys: Set[str] = set()
+    
+    def __len__(self) -> int:
+        return len(self.documents)
+    
+    def _reserve(self, size: int) -> None:
+        """Grow the vector matrix to the next power of two that holds size rows."""
+        capacity = self.vectors.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        grown = np.zeros((capacity, self.dimension), dtype=self.vectors.dtype)
+        grown[:len(self.documents)] = self.vectors[:len(self.documents)]
+        self.vectors = grown
+        grown_codes = np.zeros((capacity, self.codes.shape[1]), dtype=np.uint8)
+        grown_codes[:len(self.documents)] = self.codes[:len(self.documents)]
+        self.codes = grown_codes
+        for masks in self._masks.values():
+            for value, mask in masks.items():
+                masks[value] = np.concatenate([mask, np.zeros(capacity - len(mask), dtype=bool)])
+    
+    def _set_mask_bits(self, record: StoredDocument, row: int, present: bool) -> None:
+        """Set or clear a row's bit in the masks for each of its metadata values."""
+        for key, value in record.metadata.items():
+            try:
+                mask = self._masks.setdefault(key, {}).get(value)
+            except TypeError:
+                self._unindexed_keys.add(key)
+                continue
+            if mask is None:
+                if not present:
+                    continue
+                mask = self._masks[key][value] = np.zeros(self.vectors.shape[0], dtype=bool)
+            mask[row] = present
+    
+    def _filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Return the live rows whose metadata passes the filters."""
+        size = len(self.documents)
+        allowed = np.ones(size, dtype=bool)
+        for key, value in filters.items():
+            values = value if isinstance(value, list) else [value]
+            if key in self._unindexed_keys or any(v is None for v in values):
+                # Masks only cover hashable values that are present, so use the
+                # original per-document comparison for this filter
+                return np.array([
+                    row for row, doc in enumerate(self.documents)
+                    if _matches_filters(doc.metadata, filters)
+                ], dtype=np.intp)
+            masks = self._masks.get(key, {})
+            matched = np.zeros(size, dtype=bool)
+            for v in values:
+                try:
+                    mask = masks.get(v)
+                except TypeError:
+                    continue
+                if mask is not None:
+                    matched |= mask[:size]
+            allowed &= matched
+        return np.flatnonzero(allowed)
+    
+    def add(self, documents: Sequence[DocumentEmbedding]) -> None:
+        """
+        Add documents, replacing any already stored under the same ID.
+        
+        Args:
+            documents: Documents whose embeddings match the store dimension
+        """
+        if not documents:
+            return
+        
+        matrix = np.asarray([doc.embedding for doc in documents], dtype=np.float32)
+        if matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} doesn't match store dimension {self.dimension}"
+            )
+        matrix = _normalize_rows(matrix)
+        
+        self._reserve(len(self.documents) + len(documents))
+        for doc, vector in zip(documents, matrix):
+            record = StoredDocument(doc)
+            row = self._rows.get(doc.id)
+            if row is None:
+                row = len(self.documents)
+                self._rows[doc.id] = row
+                self.documents.append(record)
+            else:
+                self._set_mask_bits(self.documents[row], row, False)
+                self.documents[row] = record
+            self._set_mask_bits(record, row, True)
+            self.vectors[row] = vector
+            self.codes[row] = np.packbits(vector > 0)
+    
+    def remove(self, document_id: str) -> bool:
+        """
+        Remove a document, filling its row with the last one.
+        
+        Returns:
+            True if the document was present
+        """
+        row = self._rows.pop(document_id, None)
+        if row is None:
+            return False
+        
+        self._set_mask_bits(self.documents[row], row, False)
+        last = len(self.documents) - 1
+        if row != last:
+            moved = self.documents[last]
+            self._set_mask_bits(moved, last, False)
+            self._set_mask_bits(moved, row, True)
+            self.documents[row] = moved
+            self.vectors[row] = self.vectors[last]
+            self.codes[row] = self.codes[last]
+            self._rows[moved.id] = row
+        self.documents.pop()
+        return True
+    
+    def get_vector(self, document_id: str) -> Optional[np.ndarray]:
+        """Return a copy of a document's normalized embedding, or None if absent."""
+        row = self._rows.get(document_id)
+        if row is None:
+            return None
+        return self.vectors[row].astype(np.float32)
+    
+    @staticmethod
+    def _score(vectors: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Inner products of rows with the query, accumulated in float32."""
+        if vectors.dtype == np.float32:
+            return vectors @ query
+        scores = np.empty(len(vectors), dtype=np.float32)
+        for start in range(0, len(vectors), SCORE_BLOCK_ROWS):
+            block = vectors[start:start + SCORE_BLOCK_ROWS].astype(np.float32)
+            scores[start:start + SCORE_BLOCK_ROWS] = block @ query
+        return scores
+    
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[StoredDocument, float]]:
+        """
+        Return the k most similar documents that pass the filters.
+        
+        Args:
+            query_vector: Query embedding
+            k: Number of results to return
+            filters: Optional metadata filters (value or list of allowed values)
+        
+        Returns:
+            (document, cosine similarity) pairs, most similar first
+        """
+        if k <= 0 or not self.documents:
+            return []
+        
+        query = _normalize_rows(np.asarray(query_vector, dtype=np.float32).reshape(1, -1))[0]
+        size = len(self.documents)
+        
+        if filters:
+            candidates = self._filter_rows(filters)
+        else:
+            candidates = None
+        
+        shortlist = k * self.rerank_factor
+        if self.quantization == "binary" and (size if candidates is None else len(candidates)) > shortlist:
+            codes = self.codes[:size] if candidates is None else self.codes[candidates]
+            distances = _hamming_distances(codes, np.packbits(query > 0))
+            nearest = np.argpartition(distances, shortlist - 1)[:shortlist]
+            candidates = nearest if candidates is None else candidates[nearest]
+        
+        if candidates is None:
+            candidates = np.arange(size)
+            scores = self._score(self.vectors[:size], query)
+        else:
+            scores = self._score(self.vectors[candidates], query)
+        
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        
+        return [(self.documents[row], float(score)) for row, score in zip(candidates[order], scores[order])]
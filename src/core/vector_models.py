@@ -28,6 +28,7 @@ class VectorStoreType(str, Enum):
     PINECONE = "pinecone"
     CHROMA = "chroma"  # Legacy support
     FAISS = "faiss"
+    MEMORY = "memory"  # In-process exact search
     WEAVIATE = "weaviate"
 
 
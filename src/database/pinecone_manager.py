@@ -6,7 +6,6 @@ import os
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from pinecone.grpc import PineconeGRPC as Pinecone
-from sentence_transformers import SentenceTransformer
 import uuid
 import time
 
@@ -39,8 +38,9 @@ class PineconeManager:
             logger.error(f"❌ Failed to connect to Pinecone index: {e}")
             raise
         
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Initialize embedding model (shared with the embedding services)
+        from ..core.embedding_service import get_sentence_transformer
+        self.embedding_model = get_sentence_transformer('all-MiniLM-L6-v2')
         logger.info("✅ Embedding model loaded")
     
     def generate_embedding(self, text: str) -> List[float]:
@@ -62,14 +62,14 @@ class PineconeManager:
         try:
             vectors = []
             
-            for doc in documents:
-                # Generate embedding
-                embedding = self.generate_embedding(doc['text'])
-                
+            # Embed all texts in one batched encode call
+            embeddings = self.embedding_model.encode([doc['text'] for doc in documents]) if documents else []
+            
+            for doc, embedding in zip(documents, embeddings):
                 # Prepare vector
                 vector = {
                     "id": doc['id'],
-                    "values": embedding,
+                    "values": embedding.tolist(),
                     "metadata": {
                         "text": doc['text'][:1000],  # Pinecone metadata limit
                         **doc.get('metadata', {})
@@ -157,6 +157,76 @@ class PineconeManager:
             logger.error(f"❌ Failed to get index stats: {e}")
             return {}
     
+    # Pinecone rejects top_k above 1000 when metadata is returned, and above
+    # 10000 otherwise
+    MAX_TOP_K_WITH_METADATA = 1000
+    MAX_TOP_K = 10000
+    
+    def count_chunks_by_document(self, collection_name: str,
+                                 document_ids: List[str]) -> Dict[str, int]:
+        """
+        Count stored chunks per document with batched metadata-filtered requests
+        
+        Documents are looked up in one $in-filtered query per batch. A batch
+        that fills a whole page may have been truncated, so its documents are
+        recounted one query each.
+        
+        Args:
+            collection_name: Collection the chunks were added to
+            document_ids: Document IDs to count chunks for
+            
+        Returns:
+            Mapping of document ID to chunk count (documents without chunks are omitted)
+            
+        Raises:
+            Exception: If a Pinecone query fails
+        """
+        if not document_ids:
+            return {}
+        
+        # Pinecone has no metadata-only scan, so send a fixed unit probe vector
+        # instead of embedding a dummy query; only the filter matters here.
+        dimension = self.embedding_model.get_sentence_embedding_dimension()
+        probe = [1.0] + [0.0] * (dimension - 1)
+        
+        counts: Dict[str, int] = {}
+        unique_ids = list(dict.fromkeys(document_ids))
+        batch_size = 100
+        
+        for start in range(0, len(unique_ids), batch_size):
+            batch = unique_ids[start:start + batch_size]
+            results = self.index.query(
+                vector=probe,
+                top_k=self.MAX_TOP_K_WITH_METADATA,
+                include_metadata=True,
+                filter={
+                    "collection": collection_name,
+                    "document_id": {"$in": batch}
+                }
+            )
+            matches = results['matches']
+            
+            if len(matches) < self.MAX_TOP_K_WITH_METADATA:
+                for match in matches:
+                    doc_id = match['metadata'].get('document_id')
+                    if doc_id is not None:
+                        counts[doc_id] = counts.get(doc_id, 0) + 1
+                continue
+            
+            # Full page: counts may be truncated, so count each document on its
+            # own without metadata, which allows the larger top_k
+            for doc_id in batch:
+                results = self.index.query(
+                    vector=probe,
+                    top_k=self.MAX_TOP_K,
+                    include_metadata=False,
+                    filter={"collection": collection_name, "document_id": doc_id}
+                )
+                if results['matches']:
+                    counts[doc_id] = len(results['matches'])
+        
+        return counts
+    
     def clear_all_vectors(self) -> bool:
         """Clear all vectors from the index"""
         try:
@@ -5,6 +5,7 @@ Start the Graph-Enhanced Agentic RAG API server.
 import uvicorn
 import sys
 import os
+import shutil
 import logging
 
 # Add the project root to Python path so we can import from src
@@ -39,6 +40,34 @@ def is_production():
     """Check if running in production environment"""
     return os.environ.get("ENVIRONMENT", "development").lower() == "production"
 
+def get_workers():
+    """Get worker count from WEB_CONCURRENCY or default to at most 2
+    
+    Every worker loads its own embedding model, so scaling with the CPU count
+    can exhaust memory on small instances.
+    """
+    try:
+        return int(os.environ["WEB_CONCURRENCY"])
+    except (KeyError, ValueError):
+        return min(2, os.cpu_count() or 1)
+
+def exec_gunicorn(host, port):
+    """Replace this process with gunicorn running uvicorn workers"""
+    workers = get_workers()
+    args = [
+        "gunicorn", "src.api.main:app",
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(workers),
+        "-b", f"{host}:{port}",
+    ]
+    # Keep worker heartbeat files in memory instead of on the container disk
+    if os.path.isdir("/dev/shm"):
+        args += ["--worker-tmp-dir", "/dev/shm"]
+    
+    print(f"👷 Starting gunicorn with {workers} uvicorn workers")
+    sys.stdout.flush()
+    os.execvp(args[0], args)
+
 if __name__ == "__main__":
     # Force hardcoded values for Render
     host = "0.0.0.0"
@@ -50,6 +79,10 @@ if __name__ == "__main__":
     print(f"📡 Server will be available at: http://{host}:{port}")
     print("\n⚡ Starting server NOW...")
     
+    # In production, run several uvicorn workers behind gunicorn when it is installed
+    if is_production() and shutil.which("gunicorn"):
+        exec_gunicorn(host, port)
+    
     # Simple uvicorn run - no workers, no complexity
     uvicorn.run(
         "src.api.main:app",
@@ -0,0 +1,94 @@
+"""
+Shared pytest configuration for the test suites.
+
+Registers the markers used to split fast unit runs from slow and integration
+runs, and applies them to the test modules that need external services or long
+running workloads. Also provides session-scoped fixtures for expensive setup, so
+that the files of a suite, which the runner collects into one pytest session,
+load models and open connections only once.
+"""
+
+import functools
+import hashlib
+from typing import Tuple
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+# Markers applied to every test in these modules
+MODULE_MARKERS = {
+    "test_integration_workflows.py": ("integration",),
+    "test_system_resilience.py": ("integration",),
+    "test_database_connections.py": ("integration",),
+    "test_database_integration.py": ("integration",),
+    "test_dual_storage_ingestion.py": ("integration",),
+    "test_gemini_integration.py": ("integration",),
+    "test_performance_load.py": ("slow",),
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running performance and load tests")
+    config.addinivalue_line("markers", "integration: tests that exercise databases or external APIs")
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        for marker in MODULE_MARKERS.get(item.path.name, ()):
+            item.add_marker(getattr(pytest.mark, marker))
+
+
+@functools.lru_cache(maxsize=None)
+def deterministic_embedding(text: str, dimension: int = 384) -> Tuple[float, ...]:
+    """Unit-length pseudo-embedding derived from the text, stable across runs."""
+    seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+    vector = np.random.default_rng(seed).standard_normal(dimension)
+    return tuple((vector / np.linalg.norm(vector)).tolist())
+
+
+@pytest.fixture(scope="session")
+def make_embedding():
+    """Memoized deterministic embedding helper for tests that need no real model."""
+    return deterministic_embedding
+
+
+@pytest.fixture(scope="session")
+def embedding_model():
+    """Sentence transformer shared by every test in the session."""
+    pytest.importorskip("sentence_transformers")
+    from src.core.embedding_service import get_sentence_transformer
+    return get_sentence_transformer("all-MiniLM-L6-v2")
+
+
+@pytest.fixture(scope="session")
+def neo4j_manager():
+    """Connected Neo4j manager for the configured test database, closed after the session."""
+    pytest.importorskip("neo4j")
+    from src.core.database import close_neo4j, get_neo4j_manager
+    
+    manager = get_neo4j_manager()
+    try:
+        manager.connect()
+    except Exception as e:
+        pytest.skip(f"Neo4j not available: {e}")
+    
+    yield manager
+    close_neo4j()
+
+
+@pytest.fixture(scope="session")
+def _gemini_session_client():
+    pytest.importorskip("google.genai")
+    from src.agents.synthesis import GeminiClient
+    
+    client = GeminiClient(api_key="test-key")
+    client.client = MagicMock()
+    return client
+
+
+@pytest.fixture
+def gemini_client(_gemini_session_client):
+    """Gemini client built once per session whose API client is a fresh-state mock."""
+    _gemini_session_client.client.reset_mock(return_value=True, side_effect=True)
+    return _gemini_session_client
@@ -8,26 +8,211 @@ This script runs all test suites including:
 - System resilience tests
 
 Usage:
-    python tests/run_comprehensive_tests.py [--suite SUITE] [--verbose] [--report]
+    python tests/run_comprehensive_tests.py [--suite SUITE] [--verbose] [--report] [--parallel N]
+                                           [--changed-only {lf,testmon}] [--fast] [--fail-fast]
 
 This implements task 10: Implement comprehensive testing
 Requirements: 4.1, 4.2, 4.3, 4.4, 6.3, 6.4, 4.5, 2.4
 """
 
 import argparse
-import subprocess
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
 import sys
+import tempfile
 import time
 import json
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 import pytest
 
+# orjson is optional; reports fall back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Jinja2 is optional; without it the HTML report is skipped
+try:
+    from jinja2 import Environment, FileSystemLoader
+    JINJA2_AVAILABLE = True
+except ImportError:
+    JINJA2_AVAILABLE = False
+
+# Look the optional pytest plugins up without importing them; a plugin imported
+# before pytest starts cannot have its assertions rewritten
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+TESTMON_AVAILABLE = importlib.util.find_spec("testmon") is not None
+PYTEST_TIMEOUT_AVAILABLE = importlib.util.find_spec("pytest_timeout") is not None
+
+# Per-test timeout in seconds, unless a suite sets its own
+TEST_TIMEOUT = int(os.getenv("TEST_TIMEOUT", "30"))
+
+# Outcome counts kept per test file; suites and the summary store them as <count>_tests
+RESULT_COUNTS = ("total", "passed", "failed", "skipped")
+SUITE_COUNTS = tuple(f"{count}_tests" for count in RESULT_COUNTS)
+
+# Success rate a suite (or the whole run) needs to count as passing
+PASSING_SUCCESS_RATE = 0.8
+
+# Failures after which a suite's pytest session stops under --fail-fast
+FAIL_FAST_MAXFAIL = 5
+
+# Markers deselected by --fast (registered in tests/conftest.py)
+FAST_EXCLUDED_MARKERS = ("slow", "integration")
+FAST_MARKER_EXPRESSION = " and ".join(f"not {marker}" for marker in FAST_EXCLUDED_MARKERS)
+
+# Lines of each suite's pytest output kept in its results for the report
+OUTPUT_TAIL_LINES = 200
+
+# Compiled report templates are cached by the environment across reports
+if JINJA2_AVAILABLE:
+    REPORT_TEMPLATES = Environment(loader=FileSystemLoader(Path(__file__).parent), autoescape=True)
+
+
+class OutputTail(io.TextIOBase):
+    """Text stream that passes writes through and keeps the last lines written."""
+    
+    def __init__(self, target, max_lines: int = OUTPUT_TAIL_LINES):
+        self.target = target
+        self.lines = deque(maxlen=max_lines)
+        self._partial = ""
+    
+    @property
+    def encoding(self):
+        return getattr(self.target, "encoding", "utf-8")
+    
+    def writable(self) -> bool:
+        return True
+    
+    def isatty(self) -> bool:
+        return self.target.isatty()
+    
+    def write(self, text: str) -> int:
+        self.target.write(text)
+        *complete, self._partial = (self._partial + text).split("\n")
+        self.lines.extend(complete)
+        return len(text)
+    
+    def flush(self):
+        self.target.flush()
+    
+    def tail(self) -> str:
+        """Return the kept lines, including an unterminated last line."""
+        lines = [*self.lines, self._partial] if self._partial else self.lines
+        return "\n".join(lines)
+
+
+class ResultCollectorPlugin:
+    """Pytest plugin that counts test outcomes per test file for a run."""
+    
+    def __init__(self):
+        self.counts: Dict[str, Counter] = defaultdict(Counter)
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.errors: Dict[str, List[str]] = defaultdict(list)
+        self.rootpath = None
+        self._file_keys: Dict[str, str] = {}
+    
+    def pytest_sessionstart(self, session):
+        self.rootpath = session.config.rootpath
+    
+    def _file_key(self, nodeid: str) -> str:
+        """Resolve the file part of a node ID to an absolute path."""
+        location = nodeid.partition("::")[0]
+        key = self._file_keys.get(location)
+        if key is None:
+            key = self._file_keys[location] = str((self.rootpath / location).resolve())
+        return key
+    
+    def pytest_collectreport(self, report):
+        # A file that fails to import runs no tests; count it as one failure so
+        # the suite does not report success for tests that never ran
+        if report.failed:
+            key = self._file_key(report.nodeid)
+            self.counts[key]["failed"] += 1
+            self.errors[key].append(f"{report.nodeid}: collection error")
+    
+    def pytest_runtest_logreport(self, report):
+        key = self._file_key(report.nodeid)
+        counts = self.counts[key]
+        self.durations[key] += report.duration
+        
+        if report.when == "call":
+            if report.passed:
+                counts["passed"] += 1
+            elif report.failed:
+                counts["failed"] += 1
+            else:
+                counts["skipped"] += 1
+        elif report.when == "setup" and not report.passed:
+            # Skip markers and fixture errors surface during setup
+            if report.skipped:
+                counts["skipped"] += 1
+            else:
+                counts["failed"] += 1
+                self.errors[key].append(f"{report.nodeid}: error in setup")
+        elif report.when == "teardown" and report.failed:
+            self.errors[key].append(f"{report.nodeid}: error in teardown")
+    
+    def file_result(self, test_file: str, return_code: int) -> Dict[str, Any]:
+        """Return the results for one test file in the runner's file result format."""
+        key = str(Path(test_file).resolve())
+        counts = self.counts.get(key, Counter())
+        return {
+            "status": "completed",
+            "return_code": return_code,
+            "total": counts["passed"] + counts["failed"] + counts["skipped"],
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "skipped": counts["skipped"],
+            "duration": self.durations.get(key, 0.0),
+            "errors": list(self.errors.get(key, []))
+        }
+
 
 class TestSuiteRunner:
     """Manages execution of comprehensive test suites."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        parallel: Optional[str] = None,
+        changed_only: Optional[str] = None,
+        fast: bool = False,
+        fail_fast: bool = False
+    ):
+        """
+        Initialize the runner.
+        
+        Args:
+            parallel: pytest-xdist worker count ("auto" or a number) used for
+                suites that can run in parallel; None runs tests serially
+            changed_only: "lf" to rerun only the tests that failed last time, or
+                "testmon" to run only tests affected by changed code
+            fast: Deselect slow and integration tests, and skip suites made
+                up only of them
+            fail_fast: Stop starting suites once one falls below the passing
+                success rate, and stop each pytest session after a few failures
+        """
+        if parallel and not XDIST_AVAILABLE:
+            print("WARNING: pytest-xdist not installed, running tests serially "
+                  "(install with: pip install 'pytest-xdist>=3.2.0')")
+            parallel = None
+        if changed_only == "testmon" and not TESTMON_AVAILABLE:
+            print("WARNING: pytest-testmon not installed, running all tests "
+                  "(install with: pip install pytest-testmon)")
+            changed_only = None
+        self.parallel = parallel
+        self.changed_only = changed_only
+        self.fast = fast
+        self.fail_fast = fail_fast
+        
         self.test_suites = {
             "unit": {
                 "description": "Unit tests for all agents",
@@ -35,9 +220,11 @@ class TestSuiteRunner:
                     "tests/test_coordinator_agent.py",
                     "tests/test_graph_navigator_agent.py", 
                     "tests/test_vector_retrieval_agent.py",
-                    "tests/test_synthesis_agent.py"
+                    "tests/test_synthesis_agent.py",
+                    "tests/test_vector_index.py"
                 ],
-                "requirements": ["4.1", "4.2", "4.3", "4.4"]
+                "requirements": ["4.1", "4.2", "4.3", "4.4"],
+                "markers": []
             },
             "integration": {
                 "description": "Integration tests for workflows and data consistency",
@@ -45,14 +232,21 @@ class TestSuiteRunner:
                     "tests/test_integration_workflows.py",
                     "tests/test_system_resilience.py"
                 ],
-                "requirements": ["6.3", "6.4", "4.5"]
+                "requirements": ["6.3", "6.4", "4.5"],
+                "markers": ["integration"]
             },
             "performance": {
                 "description": "Performance and load tests",
                 "files": [
                     "tests/test_performance_load.py"
                 ],
-                "requirements": ["2.4"]
+                "requirements": ["2.4"],
+                "markers": ["slow"],
+                # Timing-sensitive, so never spread across xdist workers
+                "serial": True,
+                # Load tests always run in full, even with --changed-only
+                "full_run": True,
+                "timeout": 600
             },
             "existing": {
                 "description": "Existing test files",
@@ -71,11 +265,30 @@ class TestSuiteRunner:
                     "tests/test_models.py",
                     "tests/test_vector_models.py"
                 ],
-                "requirements": ["Various"]
+                "requirements": ["Various"],
+                # Individual files are marked in tests/conftest.py
+                "markers": []
             }
         }
         
         self.results = {}
+        self._existing = self._scan_existing(
+            [test_file for suite in self.test_suites.values() for test_file in suite["files"]]
+        )
+    
+    @staticmethod
+    def _scan_existing(test_files: List[str]) -> Set[str]:
+        """Return which of the given files exist, reading each directory once."""
+        existing = set()
+        for directory in {os.path.dirname(test_file) for test_file in test_files}:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    existing.update(
+                        os.path.join(directory, entry.name) for entry in entries if entry.is_file()
+                    )
+            except FileNotFoundError:
+                continue
+        return existing
     
     def run_test_suite(self, suite_name: str, verbose: bool = False) -> Dict[str, Any]:
         """Run a specific test suite."""
@@ -96,38 +309,44 @@ class TestSuiteRunner:
             "files": suite["files"],
             "start_time": time.time(),
             "file_results": {},
-            "total_tests": 0,
-            "passed_tests": 0,
-            "failed_tests": 0,
-            "skipped_tests": 0,
             "errors": []
         }
         
+        files_to_run = []
         for test_file in suite["files"]:
-            print(f"\nRunning {test_file}...")
-            
             # Check if test file exists
-            if not Path(test_file).exists():
+            if test_file not in self._existing:
                 print(f"  WARNING: Test file {test_file} not found, skipping...")
                 suite_results["file_results"][test_file] = {
                     "status": "skipped",
                     "reason": "file_not_found"
                 }
                 continue
-            
-            # Run pytest on the file
-            file_result = self._run_pytest_file(test_file, verbose)
+            files_to_run.append(test_file)
+        
+        # Run every file of the suite in a single pytest session
+        if files_to_run:
+            print(f"\nRunning {', '.join(files_to_run)}...")
+            # Stream pytest's output as it is written, keeping only its tail
+            output = OutputTail(sys.stdout)
+            with contextlib.redirect_stdout(output):
+                file_results = self._run_pytest_files(files_to_run, verbose, self._pytest_args(suite_name, suite))
+            suite_results["output_tail"] = output.tail()
+        else:
+            file_results = {}
+        
+        counts = Counter()
+        for test_file, file_result in file_results.items():
             suite_results["file_results"][test_file] = file_result
             
             # Aggregate results
-            suite_results["total_tests"] += file_result.get("total", 0)
-            suite_results["passed_tests"] += file_result.get("passed", 0)
-            suite_results["failed_tests"] += file_result.get("failed", 0)
-            suite_results["skipped_tests"] += file_result.get("skipped", 0)
+            counts.update({count: file_result.get(count, 0) for count in RESULT_COUNTS})
             
             if file_result.get("errors"):
                 suite_results["errors"].extend(file_result["errors"])
         
+        suite_results.update({f"{count}_tests": counts[count] for count in RESULT_COUNTS})
+        
         suite_results["end_time"] = time.time()
         suite_results["duration"] = suite_results["end_time"] - suite_results["start_time"]
         suite_results["success_rate"] = (
@@ -138,114 +357,58 @@ class TestSuiteRunner:
         self._print_suite_summary(suite_results)
         return suite_results
     
-    def _run_pytest_file(self, test_file: str, verbose: bool = False) -> Dict[str, Any]:
-        """Run pytest on a single test file."""
-        cmd = ["python", "-m", "pytest", test_file, "--tb=short", "-q"]
+    def _pytest_args(self, suite_name: str, suite: Dict[str, Any]) -> List[str]:
+        """Build the suite-specific pytest options."""
+        # Suites run concurrently, so each keeps its own cache (and with it its
+        # own last-failed list) instead of overwriting a shared one
+        args = ["-o", f"cache_dir=.pytest_cache/{suite_name}"]
+        if self.parallel and not suite.get("serial"):
+            # Worksteal rebalances when one worker is stuck on slow files
+            args.extend(["-n", str(self.parallel), "--dist=worksteal"])
+        if self.changed_only and not suite.get("full_run"):
+            args.append("--lf" if self.changed_only == "lf" else "--testmon")
+        if self.fast:
+            args.extend(["-m", FAST_MARKER_EXPRESSION])
+        if self.fail_fast:
+            args.append(f"--maxfail={FAIL_FAST_MAXFAIL}")
+        if PYTEST_TIMEOUT_AVAILABLE:
+            # Fail just the hung test; pytest-timeout's default signal method
+            # interrupts it, where the thread method would exit this process
+            args.append(f"--timeout={suite.get('timeout', TEST_TIMEOUT)}")
+        return args
+    
+    def _run_pytest_files(
+        self,
+        test_files: List[str],
+        verbose: bool = False,
+        extra_args: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run pytest once over several test files in this process."""
+        # A file that fails to import must not stop the other files in the session
+        args = [*test_files, "--tb=short", "-q", "--continue-on-collection-errors", *(extra_args or [])]
         
         if verbose:
-            cmd.append("-v")
-        
-        # Add JSON report for parsing results
-        cmd.extend(["--json-report", "--json-report-file=/tmp/pytest_report.json"])
+            args.append("-v")
         
+        plugin = ResultCollectorPlugin()
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout per file
-            )
-            
-            # Parse JSON report if available
-            try:
-                with open("/tmp/pytest_report.json", "r") as f:
-                    json_report = json.load(f)
-                
-                return {
-                    "status": "completed",
-                    "return_code": result.returncode,
-                    "total": json_report["summary"]["total"],
-                    "passed": json_report["summary"].get("passed", 0),
-                    "failed": json_report["summary"].get("failed", 0),
-                    "skipped": json_report["summary"].get("skipped", 0),
-                    "duration": json_report["duration"],
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "errors": []
-                }
-            except (FileNotFoundError, json.JSONDecodeError, KeyError):
-                # Fallback to parsing stdout
-                return self._parse_pytest_output(result)
-                
-        except subprocess.TimeoutExpired:
-            return {
-                "status": "timeout",
-                "return_code": -1,
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "duration": 300,
-                "stdout": "",
-                "stderr": "Test execution timed out",
-                "errors": ["Test execution timed out after 5 minutes"]
-            }
+            return_code = int(pytest.main(args, plugins=[plugin]))
+            return {test_file: plugin.file_result(test_file, return_code) for test_file in test_files}
         except Exception as e:
             return {
-                "status": "error",
-                "return_code": -1,
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "duration": 0,
-                "stdout": "",
-                "stderr": str(e),
-                "errors": [f"Failed to run test: {str(e)}"]
+                test_file: {
+                    "status": "error",
+                    "return_code": -1,
+                    "total": 0,
+                    "passed": 0,
+                    "failed": 0,
+                    "skipped": 0,
+                    "duration": 0,
+                    "errors": [f"Failed to run test: {str(e)}"]
+                }
+                for test_file in test_files
             }
     
-    def _parse_pytest_output(self, result: subprocess.CompletedProcess) -> Dict[str, Any]:
-        """Parse pytest output to extract test results."""
-        stdout = result.stdout
-        stderr = result.stderr
-        
-        # Simple parsing of pytest output
-        total = passed = failed = skipped = 0
-        errors = []
-        
-        # Look for result summary line
-        lines = stdout.split('\n')
-        for line in lines:
-            if "passed" in line or "failed" in line or "skipped" in line:
-                # Try to extract numbers
-                import re
-                numbers = re.findall(r'(\d+)\s+(passed|failed|skipped)', line)
-                for num, status in numbers:
-                    if status == "passed":
-                        passed = int(num)
-                    elif status == "failed":
-                        failed = int(num)
-                    elif status == "skipped":
-                        skipped = int(num)
-        
-        total = passed + failed + skipped
-        
-        if result.returncode != 0 and stderr:
-            errors.append(stderr)
-        
-        return {
-            "status": "completed",
-            "return_code": result.returncode,
-            "total": total,
-            "passed": passed,
-            "failed": failed,
-            "skipped": skipped,
-            "duration": 0,  # Unknown from simple parsing
-            "stdout": stdout,
-            "stderr": stderr,
-            "errors": errors
-        }
-    
     def _print_suite_summary(self, suite_results: Dict[str, Any]):
         """Print summary of test suite results."""
         print(f"\n{'-'*40}")
@@ -267,43 +430,71 @@ class TestSuiteRunner:
     
     def run_all_suites(self, verbose: bool = False) -> Dict[str, Any]:
         """Run all test suites."""
+        suite_names = list(self.test_suites)
+        if self.fast:
+            # Suites whose every test --fast would deselect are not started at all
+            skipped = [
+                name for name in suite_names
+                if set(self.test_suites[name]["markers"]) & set(FAST_EXCLUDED_MARKERS)
+            ]
+            suite_names = [name for name in suite_names if name not in skipped]
+        
         print("Starting comprehensive test execution...")
-        print(f"Test suites: {', '.join(self.test_suites.keys())}")
+        print(f"Test suites: {', '.join(suite_names)}")
+        if self.fast and skipped:
+            print(f"Skipped by --fast: {', '.join(skipped)}")
         
         overall_start = time.time()
         all_results = {
             "start_time": overall_start,
             "suites": {},
             "summary": {
-                "total_suites": len(self.test_suites),
-                "completed_suites": 0,
-                "total_tests": 0,
-                "passed_tests": 0,
-                "failed_tests": 0,
-                "skipped_tests": 0,
+                "total_suites": len(suite_names),
                 "overall_success_rate": 0.0
             }
         }
         
-        for suite_name in self.test_suites.keys():
-            try:
-                suite_result = self.run_test_suite(suite_name, verbose)
-                all_results["suites"][suite_name] = suite_result
-                all_results["summary"]["completed_suites"] += 1
-                
-                # Aggregate totals
-                all_results["summary"]["total_tests"] += suite_result["total_tests"]
-                all_results["summary"]["passed_tests"] += suite_result["passed_tests"]
-                all_results["summary"]["failed_tests"] += suite_result["failed_tests"]
-                all_results["summary"]["skipped_tests"] += suite_result["skipped_tests"]
-                
-            except Exception as e:
-                print(f"ERROR: Failed to run suite {suite_name}: {e}")
-                all_results["suites"][suite_name] = {
-                    "suite_name": suite_name,
-                    "status": "error",
-                    "error": str(e)
+        # Suites are independent, so they run at the same time in worker processes;
+        # serial (timing-sensitive) suites run on their own afterwards
+        parallel_suites = [name for name in suite_names if not self.test_suites[name].get("serial")]
+        serial_suites = [name for name in suite_names if self.test_suites[name].get("serial")]
+        
+        totals = Counter()
+        stopped = False
+        if parallel_suites:
+            with ProcessPoolExecutor(max_workers=self._suite_pool_size(len(parallel_suites))) as executor:
+                futures = {
+                    executor.submit(self._run_suite_captured, suite_name, verbose): suite_name
+                    for suite_name in parallel_suites
                 }
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    suite_result = self._record_suite(
+                        all_results, totals, futures[future], partial(self._replay_suite, future)
+                    )
+                    if not stopped and self._should_stop(futures[future], suite_result):
+                        # Suites already running still finish and are reported; queued
+                        # ones are cancelled
+                        stopped = True
+                        for pending in futures:
+                            pending.cancel()
+        
+        for suite_name in serial_suites:
+            if stopped:
+                break
+            suite_result = self._record_suite(
+                all_results, totals, suite_name, partial(self.run_test_suite, suite_name, verbose)
+            )
+            stopped = self._should_stop(suite_name, suite_result)
+        
+        all_results["summary"].update({key: totals[key] for key in ("completed_suites", *SUITE_COUNTS)})
+        
+        # Report suites in their declared order rather than completion order
+        all_results["suites"] = {
+            suite_name: all_results["suites"][suite_name]
+            for suite_name in self.test_suites if suite_name in all_results["suites"]
+        }
         
         all_results["end_time"] = time.time()
         all_results["total_duration"] = all_results["end_time"] - overall_start
@@ -317,6 +508,86 @@ class TestSuiteRunner:
         self._print_overall_summary(all_results)
         return all_results
     
+    def _run_suite_captured(self, suite_name: str, verbose: bool = False) -> Tuple[Dict[str, Any], str]:
+        """Run a suite in a worker process, returning its result and the path of its console output."""
+        # Spool the output to disk rather than holding it in memory
+        output = tempfile.NamedTemporaryFile("w", suffix=".log", delete=False)
+        try:
+            with output, contextlib.redirect_stdout(output):
+                suite_result = self.run_test_suite(suite_name, verbose)
+        except BaseException:
+            os.unlink(output.name)
+            raise
+        return suite_result, output.name
+    
+    @staticmethod
+    def _replay_suite(future: Future) -> Dict[str, Any]:
+        """Print a finished worker suite's spooled output and return its result."""
+        suite_result, output_path = future.result()
+        try:
+            with open(output_path) as output:
+                shutil.copyfileobj(output, sys.stdout)
+        finally:
+            os.unlink(output_path)
+        return suite_result
+    
+    def _record_suite(
+        self,
+        all_results: Dict[str, Any],
+        totals: Counter,
+        suite_name: str,
+        run: Callable[[], Dict[str, Any]]
+    ):
+        """
+        Get a suite's result from run, store it and add its counts to totals.
+        
+        Returns:
+            The suite result, or None if the suite failed to run
+        """
+        try:
+            suite_result = run()
+            all_results["suites"][suite_name] = suite_result
+            
+            # Aggregate totals
+            totals.update({key: suite_result[key] for key in SUITE_COUNTS}, completed_suites=1)
+            return suite_result
+            
+        except Exception as e:
+            print(f"ERROR: Failed to run suite {suite_name}: {e}")
+            all_results["suites"][suite_name] = {
+                "suite_name": suite_name,
+                "status": "error",
+                "error": str(e)
+            }
+            return None
+    
+    def _suite_pool_size(self, suite_count: int) -> int:
+        """
+        Number of suites to run at once.
+        
+        Without --fail-fast every suite starts immediately. With it, suites
+        beyond the --parallel worker count (one per CPU for "auto", one when
+        unset) wait in the queue so a failing suite can still cancel them.
+        """
+        if not self.fail_fast:
+            return suite_count
+        if self.parallel is None:
+            limit = 1
+        elif str(self.parallel) == "auto":
+            limit = os.cpu_count() or 1
+        else:
+            limit = max(1, int(self.parallel))
+        return min(suite_count, limit)
+    
+    def _should_stop(self, suite_name: str, suite_result: Optional[Dict[str, Any]]) -> bool:
+        """Decide whether --fail-fast ends the run after this suite."""
+        if not self.fail_fast:
+            return False
+        if suite_result is not None and suite_result["success_rate"] >= PASSING_SUCCESS_RATE:
+            return False
+        print(f"\nStopping after failing suite {suite_name} (--fail-fast)")
+        return True
+    
     def _print_overall_summary(self, all_results: Dict[str, Any]):
         """Print overall test execution summary."""
         summary = all_results["summary"]
@@ -335,7 +606,7 @@ class TestSuiteRunner:
         print(f"\nSuite Breakdown:")
         for suite_name, suite_result in all_results["suites"].items():
             if isinstance(suite_result, dict) and "success_rate" in suite_result:
-                status = "✓" if suite_result["success_rate"] >= 0.8 else "✗"
+                status = "✓" if suite_result["success_rate"] >= PASSING_SUCCESS_RATE else "✗"
                 print(f"  {status} {suite_name:12} - {suite_result['success_rate']:.1%} "
                       f"({suite_result['passed_tests']}/{suite_result['total_tests']})")
             else:
@@ -344,7 +615,7 @@ class TestSuiteRunner:
         # Overall assessment
         if summary['overall_success_rate'] >= 0.9:
             print(f"\n🎉 EXCELLENT: Test suite is in great shape!")
-        elif summary['overall_success_rate'] >= 0.8:
+        elif summary['overall_success_rate'] >= PASSING_SUCCESS_RATE:
             print(f"\n✅ GOOD: Test suite is mostly passing with minor issues.")
         elif summary['overall_success_rate'] >= 0.6:
             print(f"\n⚠️  NEEDS ATTENTION: Significant test failures need investigation.")
@@ -353,89 +624,55 @@ class TestSuiteRunner:
     
     def generate_report(self, results: Dict[str, Any], output_file: str = "test_report.json"):
         """Generate detailed test report."""
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2, default=str)
+        # Results hold only JSON-native values, so no default= fallback is needed
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(results, indent=2).encode("utf-8")
+        with self._atomic_output(output_file) as f:
+            f.write(data)
         
         print(f"\nDetailed test report saved to: {output_file}")
         
         # Generate HTML report summary
+        if not JINJA2_AVAILABLE:
+            print("HTML report skipped: Jinja2 not installed (install with: pip install jinja2)")
+            return
         html_file = output_file.replace(".json", ".html")
         self._generate_html_report(results, html_file)
         print(f"HTML report saved to: {html_file}")
     
     def _generate_html_report(self, results: Dict[str, Any], output_file: str):
         """Generate HTML test report."""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Graph-Enhanced Agentic RAG - Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background: #f0f0f0; padding: 20px; border-radius: 5px; }}
-        .suite {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
-        .passed {{ color: green; }}
-        .failed {{ color: red; }}
-        .skipped {{ color: orange; }}
-        .metrics {{ display: flex; gap: 20px; }}
-        .metric {{ text-align: center; padding: 10px; background: #f9f9f9; border-radius: 3px; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Graph-Enhanced Agentic RAG - Comprehensive Test Report</h1>
-        <p>Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Total Duration: {results.get('total_duration', 0):.1f} seconds</p>
-    </div>
-    
-    <div class="metrics">
-        <div class="metric">
-            <h3>Total Tests</h3>
-            <p>{results['summary']['total_tests']}</p>
-        </div>
-        <div class="metric">
-            <h3 class="passed">Passed</h3>
-            <p>{results['summary']['passed_tests']}</p>
-        </div>
-        <div class="metric">
-            <h3 class="failed">Failed</h3>
-            <p>{results['summary']['failed_tests']}</p>
-        </div>
-        <div class="metric">
-            <h3 class="skipped">Skipped</h3>
-            <p>{results['summary']['skipped_tests']}</p>
-        </div>
-        <div class="metric">
-            <h3>Success Rate</h3>
-            <p>{results['summary']['overall_success_rate']:.1%}</p>
-        </div>
-    </div>
-"""
-        
-        for suite_name, suite_result in results["suites"].items():
-            if isinstance(suite_result, dict) and "description" in suite_result:
-                html_content += f"""
-    <div class="suite">
-        <h2>{suite_name.title()} Test Suite</h2>
-        <p><strong>Description:</strong> {suite_result['description']}</p>
-        <p><strong>Requirements:</strong> {', '.join(suite_result.get('requirements', []))}</p>
-        <p><strong>Duration:</strong> {suite_result.get('duration', 0):.1f}s</p>
-        <p>
-            <span class="passed">Passed: {suite_result.get('passed_tests', 0)}</span> | 
-            <span class="failed">Failed: {suite_result.get('failed_tests', 0)}</span> | 
-            <span class="skipped">Skipped: {suite_result.get('skipped_tests', 0)}</span>
-        </p>
-        <p><strong>Success Rate:</strong> {suite_result.get('success_rate', 0):.1%}</p>
-    </div>
-"""
-        
-        html_content += """
-</body>
-</html>
-"""
+        template = REPORT_TEMPLATES.get_template("report_template.html.j2")
+        with self._atomic_output(output_file) as f:
+            template.stream(
+                results=results,
+                generated_at=time.strftime('%Y-%m-%d %H:%M:%S')
+            ).dump(f, encoding="utf-8")
+    
+    @staticmethod
+    @contextlib.contextmanager
+    def _atomic_output(output_file: str):
+        """
+        Open a temporary file for this invocation next to output_file.
         
-        with open(output_file, "w") as f:
-            f.write(html_content)
+        The file is moved over output_file only once fully written, so runs
+        sharing a report path never leave or read a half-written report.
+        """
+        directory = os.path.dirname(os.path.abspath(output_file))
+        handle = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".tmp", delete=False)
+        try:
+            with handle:
+                yield handle
+            # Temporary files are private; give the report the usual permissions
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(handle.name, 0o666 & ~umask)
+            os.replace(handle.name, output_file)
+        except BaseException:
+            os.unlink(handle.name)
+            raise
 
 
 def main():
@@ -465,9 +702,40 @@ def main():
         help="Output file for test report (default: test_report.json)"
     )
     
+    parser.add_argument(
+        "--parallel", "-n",
+        default=None,
+        help="Run tests on N pytest-xdist workers, or 'auto' for one per CPU "
+             "(the performance suite always runs serially)"
+    )
+    parser.add_argument(
+        "--changed-only",
+        choices=["lf", "testmon"],
+        default=None,
+        help="Run only last-failed tests (lf) or tests affected by code changes "
+             "(testmon, needs pytest-testmon); the performance suite always runs in full"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=f"Skip slow and integration tests ({FAST_MARKER_EXPRESSION})"
+    )
+    parser.add_argument(
+        "--fail-fast", "-x",
+        action="store_true",
+        help="Stop after the first suite below the passing success rate, and stop "
+             f"each suite's pytest session after {FAIL_FAST_MAXFAIL} failures; runs at "
+             "most --parallel suites at once so queued suites can be cancelled"
+    )
+    
     args = parser.parse_args()
     
-    runner = TestSuiteRunner()
+    runner = TestSuiteRunner(
+        parallel=args.parallel,
+        changed_only=args.changed_only,
+        fast=args.fast,
+        fail_fast=args.fail_fast
+    )
     
     try:
         if args.suite == "all":
@@ -492,7 +760,7 @@ def main():
         
         # Exit with appropriate code
         success_rate = results["summary"]["overall_success_rate"]
-        if success_rate >= 0.8:
+        if success_rate >= PASSING_SUCCESS_RATE:
             sys.exit(0)  # Success
         else:
             sys.exit(1)  # Failure
@@ -0,0 +1,334 @@
+"""
+Tests for the in-process vector indexes and the keyword matcher.
+
+DocumentStore and FaissVectorIndex results are compared against an exact
+NumPy cosine search over the same documents, including after removals,
+replacements and with metadata filters. KeywordMatcher is compared against
+the token-set intersection it replaces.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pytest
+
+from src.core.vector_index import DocumentStore, FaissVectorIndex
+from src.core.vector_models import DocumentEmbedding
+
+DIMENSION = 32
+CATEGORIES = ["guide", "reference", "tutorial", "faq"]
+
+
+def _make_document(doc_id: str, vector: np.ndarray, metadata: Dict[str, Any]) -> DocumentEmbedding:
+    return DocumentEmbedding(
+        id=doc_id,
+        content=f"content of {doc_id}",
+        embedding=vector.tolist(),
+        embedding_model="test",
+        embedding_dimension=len(vector),
+        metadata=metadata,
+    )
+
+
+def _make_documents(rng: np.random.Generator, count: int, prefix: str = "doc") -> List[DocumentEmbedding]:
+    return [
+        _make_document(
+            f"{prefix}_{i}",
+            rng.standard_normal(DIMENSION),
+            {"category": CATEGORIES[i % len(CATEGORIES)], "year": 2020 + i % 5},
+        )
+        for i in range(count)
+    ]
+
+
+class ExactIndex:
+    """Reference index: a dict of documents searched by brute-force cosine similarity."""
+    
+    def __init__(self):
+        self.documents: Dict[str, DocumentEmbedding] = {}
+    
+    def add(self, documents: List[DocumentEmbedding]) -> None:
+        for doc in documents:
+            self.documents[doc.id] = doc
+    
+    def remove(self, document_id: str) -> bool:
+        return self.documents.pop(document_id, None) is not None
+    
+    @staticmethod
+    def _passes(metadata: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+        for key, value in (filters or {}).items():
+            allowed = value if isinstance(value, list) else [value]
+            if metadata.get(key) not in allowed:
+                return False
+        return True
+    
+    def scores(self, query: np.ndarray, filters: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+        query = query / np.linalg.norm(query)
+        return {
+            doc.id: float(np.dot(doc.embedding, query) / np.linalg.norm(doc.embedding))
+            for doc in self.documents.values()
+            if self._passes(doc.metadata, filters)
+        }
+    
+    def search(self, query: np.ndarray, k: int, filters: Optional[Dict[str, Any]] = None) -> List[str]:
+        scores = self.scores(query, filters)
+        return sorted(scores, key=scores.get, reverse=True)[:k]
+
+
+def _assert_matches_exact(index, reference: ExactIndex, queries, k: int, filters=None, atol: float = 1e-5):
+    for query in queries:
+        results = index.search(query, k=k, filters=filters)
+        exact_scores = reference.scores(query, filters)
+        
+        assert [doc.id for doc, _ in results] == reference.search(query, k, filters)
+        for doc, score in results:
+            assert score == pytest.approx(exact_scores[doc.id], abs=atol)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1234)
+
+
+@pytest.fixture
+def queries(rng):
+    return [rng.standard_normal(DIMENSION) for _ in range(20)]
+
+
+# DocumentStore
+
+def _populated_store(rng, count: int = 200, **kwargs):
+    store = DocumentStore(dimension=DIMENSION, initial_capacity=4, **kwargs)
+    reference = ExactIndex()
+    documents = _make_documents(rng, count)
+    # Several add calls, so the matrix and masks grow between batches
+    for start in range(0, count, 37):
+        store.add(documents[start:start + 37])
+        reference.add(documents[start:start + 37])
+    return store, reference
+
+
+def _remove_and_replace(store, reference, rng):
+    """Remove every third document and replace every fifth remaining one with new content."""
+    removed = [f"doc_{i}" for i in range(0, 200, 3)]
+    for doc_id in removed:
+        assert store.remove(doc_id)
+        assert reference.remove(doc_id)
+    assert not store.remove(removed[0])
+    
+    replacements = [
+        _make_document(f"doc_{i}", rng.standard_normal(DIMENSION), {"category": "replaced", "year": 1999})
+        for i in range(1, 200, 5) if i % 3 != 0
+    ]
+    store.add(replacements)
+    reference.add(replacements)
+    return removed
+
+
+def test_document_store_matches_exact_search(rng, queries):
+    store, reference = _populated_store(rng)
+    
+    assert len(store) == 200
+    _assert_matches_exact(store, reference, queries, k=10)
+    _assert_matches_exact(store, reference, queries, k=500)
+
+
+def test_document_store_after_removal_and_replacement(rng, queries):
+    store, reference = _populated_store(rng)
+    removed = _remove_and_replace(store, reference, rng)
+    
+    assert len(store) == len(reference.documents)
+    _assert_matches_exact(store, reference, queries, k=10)
+    for doc_id in removed:
+        assert store.get_vector(doc_id) is None
+    # Swap-remove must keep every surviving row paired with its own vector
+    for doc_id, doc in reference.documents.items():
+        expected = np.asarray(doc.embedding) / np.linalg.norm(doc.embedding)
+        np.testing.assert_allclose(store.get_vector(doc_id), expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("filters", [
+    {"category": "guide"},
+    {"category": ["faq", "tutorial"]},
+    {"category": "replaced", "year": 1999},
+    {"category": ["guide", "replaced"], "year": [2021, 2023, 1999]},
+    {"category": "missing"},
+    {"year": None},
+])
+def test_document_store_filters(rng, queries, filters):
+    store, reference = _populated_store(rng)
+    _remove_and_replace(store, reference, rng)
+    
+    _assert_matches_exact(store, reference, queries, k=10, filters=filters)
+
+
+def test_document_store_filters_on_unhashable_metadata(rng, queries):
+    store, reference = _populated_store(rng, count=40)
+    tagged = [
+        _make_document(f"tagged_{i}", rng.standard_normal(DIMENSION), {"tags": ["a", "b"] if i % 2 else ["c"]})
+        for i in range(20)
+    ]
+    store.add(tagged)
+    reference.add(tagged)
+    
+    _assert_matches_exact(store, reference, queries, k=5, filters={"tags": [["a", "b"]]})
+    _assert_matches_exact(store, reference, queries, k=5, filters={"category": "guide"})
+
+
+def test_document_store_float16_scores(rng, queries):
+    store, reference = _populated_store(rng, vector_dtype="float16")
+    _remove_and_replace(store, reference, rng)
+    
+    for query in queries:
+        exact_scores = reference.scores(query)
+        expected = sorted(exact_scores.values(), reverse=True)[:10]
+        results = store.search(query, k=10)
+        
+        assert [score for _, score in results] == pytest.approx(expected, abs=2e-3)
+        for doc, score in results:
+            assert score == pytest.approx(exact_scores[doc.id], abs=2e-3)
+
+
+def test_document_store_binary_without_prefilter_is_exact(rng, queries):
+    # 200 documents fit in the k * rerank_factor shortlist, so every row is rescored
+    store, reference = _populated_store(rng, quantization="binary", rerank_factor=20)
+    _remove_and_replace(store, reference, rng)
+    
+    _assert_matches_exact(store, reference, queries, k=10)
+
+
+def test_document_store_binary_prefilter_rescores_exactly(rng, queries):
+    store, reference = _populated_store(rng, quantization="binary", rerank_factor=3)
+    _remove_and_replace(store, reference, rng)
+    
+    for query in queries:
+        exact_scores = reference.scores(query)
+        results = store.search(query, k=10)
+        scores = [score for _, score in results]
+        
+        assert len(results) == 10
+        assert scores == sorted(scores, reverse=True)
+        for doc, score in results:
+            assert score == pytest.approx(exact_scores[doc.id], abs=1e-5)
+    
+    # A stored vector has Hamming distance zero to itself, so it always survives the prefilter
+    for doc_id, doc in list(reference.documents.items())[:20]:
+        assert store.search(np.asarray(doc.embedding), k=1)[0][0].id == doc_id
+
+
+def test_document_store_rejects_bad_input(rng):
+    with pytest.raises(ValueError):
+        DocumentStore(dimension=DIMENSION, quantization="int4")
+    with pytest.raises(ValueError):
+        DocumentStore(dimension=DIMENSION, vector_dtype="float64")
+    
+    store = DocumentStore(dimension=DIMENSION)
+    with pytest.raises(ValueError):
+        store.add([_make_document("wrong", rng.standard_normal(DIMENSION + 1), {})])
+    assert store.search(rng.standard_normal(DIMENSION), k=5) == []
+
+
+# FaissVectorIndex
+
+def _populated_faiss_index(rng, count: int = 200, **kwargs):
+    pytest.importorskip("faiss")
+    index = FaissVectorIndex(dimension=DIMENSION, **kwargs)
+    reference = ExactIndex()
+    documents = _make_documents(rng, count)
+    for start in range(0, count, 37):
+        index.add(documents[start:start + 37])
+        reference.add(documents[start:start + 37])
+    return index, reference
+
+
+def test_faiss_hnsw_matches_exact_search(rng, queries):
+    # With ef_search above the index size, HNSW search is exhaustive
+    index, reference = _populated_faiss_index(rng, ef_search=256)
+    
+    _assert_matches_exact(index, reference, queries, k=10)
+
+
+def test_faiss_hnsw_tombstones_and_filters(rng, queries):
+    index, reference = _populated_faiss_index(rng, ef_search=512)
+    removed = _remove_and_replace(index, reference, rng)
+    
+    assert len(index) == len(reference.documents)
+    _assert_matches_exact(index, reference, queries, k=10)
+    _assert_matches_exact(index, reference, queries, k=10, filters={"category": "replaced"})
+    _assert_matches_exact(index, reference, queries, k=10, filters={"category": ["faq", "guide"], "year": 2022})
+    for query in queries:
+        returned = {doc.id for doc, _ in index.search(query, k=len(reference.documents))}
+        assert returned == set(reference.documents)
+        assert returned.isdisjoint(removed)
+
+
+def test_faiss_int8_scores_are_close(rng, queries):
+    index, reference = _populated_faiss_index(rng, ef_search=256, quantization="int8")
+    _remove_and_replace(index, reference, rng)
+    
+    for query in queries:
+        exact_scores = reference.scores(query)
+        results = index.search(query, k=10)
+        
+        assert len(results) == 10
+        assert len({doc.id for doc, _ in results} & set(reference.search(query, 10))) >= 8
+        for doc, score in results:
+            assert score == pytest.approx(exact_scores[doc.id], abs=0.05)
+
+
+def test_faiss_ivf_pq_pending_phase_is_exact(rng, queries):
+    index, reference = _populated_faiss_index(rng, index_type="ivf_pq", pq_m=8, min_train=1000)
+    _remove_and_replace(index, reference, rng)
+    
+    assert index.index is None
+    _assert_matches_exact(index, reference, queries, k=10)
+    _assert_matches_exact(index, reference, queries, k=10, filters={"category": ["tutorial", "replaced"]})
+
+
+def test_faiss_ivf_pq_after_training(rng, queries):
+    index, reference = _populated_faiss_index(rng, count=400, index_type="ivf_pq", pq_m=8, pq_nbits=4, min_train=300)
+    removed = _remove_and_replace(index, reference, rng)
+    
+    assert index.index is not None and index.index.is_trained
+    assert len(index) == len(reference.documents)
+    for query in queries:
+        results = index.search(query, k=10, filters={"category": "guide"})
+        
+        assert len(results) == 10
+        for doc, _ in results:
+            assert doc.id in reference.documents and doc.id not in removed
+            assert doc.metadata["category"] == "guide"
+
+
+def test_faiss_rejects_bad_configuration():
+    pytest.importorskip("faiss")
+    with pytest.raises(ValueError):
+        FaissVectorIndex(dimension=DIMENSION, index_type="flat")
+    with pytest.raises(ValueError):
+        FaissVectorIndex(dimension=DIMENSION, index_type="ivf_pq", quantization="int8")
+    with pytest.raises(ValueError):
+        FaissVectorIndex(dimension=DIMENSION, index_type="ivf_pq", pq_m=7)
+
+
+# KeywordMatcher
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_keyword_matcher_matches_token_intersection(monkeypatch, use_automaton):
+    vector_retrieval = pytest.importorskip("src.agents.vector_retrieval")
+    if use_automaton and not vector_retrieval.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(vector_retrieval, "AHOCORASICK_AVAILABLE", use_automaton)
+    
+    generator = random.Random(7)
+    vocabulary = ["graph", "graphs", "rag", "ragged", "vector", "db", "a", "an", "the", "neo4j", "api,"]
+    separators = [" ", "  ", "\t", "\n", ", ", "-", ""]
+    for _ in range(300):
+        words = set(generator.sample(vocabulary, generator.randint(1, 5)))
+        text = "".join(
+            generator.choice(vocabulary) + generator.choice(separators)
+            for _ in range(generator.randint(0, 15))
+        )
+        matcher = vector_retrieval.KeywordMatcher(words)
+        
+        assert matcher.count(text) == len(words & set(text.split())), (words, text)